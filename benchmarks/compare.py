@@ -0,0 +1,60 @@
+"""
+Compare two benchmark result files written with `--output`.
+
+Prints the p50 of every benchmark present in both files and the relative
+change, flagging regressions beyond `--threshold` percent.
+
+Usage: python -m benchmarks.compare baseline.json candidate.json [--threshold 10]
+"""
+
+import argparse
+import json
+import sys
+from typing import Any, Dict
+
+
+def load_results(path: str) -> Dict[str, Any]:
+    with open(path) as f:
+        return json.load(f)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("baseline")
+    parser.add_argument("candidate")
+    parser.add_argument("--metric", default="p50")
+    parser.add_argument("--threshold", type=float, default=10.0)
+    args = parser.parse_args()
+
+    baseline = load_results(args.baseline)
+    candidate = load_results(args.candidate)
+    regressions = 0
+
+    print(
+        f"baseline {baseline['metadata'].get('commit')} -> "
+        f"candidate {candidate['metadata'].get('commit')} ({args.metric})"
+    )
+
+    for name, stats in baseline["results"].items():
+        other = candidate["results"].get(name)
+        if not isinstance(stats, dict) or args.metric not in stats:
+            continue
+        if not isinstance(other, dict) or args.metric not in other:
+            continue
+
+        before = stats[args.metric]
+        after = other[args.metric]
+        change = (after - before) / before * 100 if before else 0.0
+        flag = ""
+
+        if change > args.threshold:
+            flag = "  REGRESSION"
+            regressions += 1
+
+        print(f"{name:<48} {before:>12.4f}ms -> {after:>12.4f}ms {change:>+8.1f}%{flag}")
+
+    sys.exit(1 if regressions else 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,79 @@
+"""
+Sequential against concurrent execution of independent I/O-bound blocks.
+
+The scripted answer awaits one simulated I/O tool per block before
+responding. With `concurrent_execution` enabled the independent blocks are
+awaited together, so a cycle takes roughly one tool latency instead of one
+per block.
+
+Usage: python -m benchmarks.concurrency [--blocks 4] [--io-ms 50] [--output concurrency.json]
+"""
+
+import argparse
+import asyncio
+from time import perf_counter_ns
+from typing import Any, Dict, List
+
+from benchmarks.fakes import IoToolContextProvider, ScriptedLlm
+from benchmarks.harness import summarize, to_milliseconds, write_results
+from chat2edit import Chat2Edit, Chat2EditConfig
+from chat2edit.execution.strategies import NativeExecutionStrategy
+from chat2edit.models import Message
+
+
+def create_script(num_blocks: int) -> List[tuple]:
+    commands = "\n".join(f"value_{i} = await fetch_{i}({i})" for i in range(num_blocks))
+    total = " + ".join(f"value_{i}" for i in range(num_blocks))
+    commands += f'\nrespond_to_user(f"The total is {{{total}}}")'
+    return [("I should fetch every value, then answer.", commands)]
+
+
+async def run_mode(args: argparse.Namespace, concurrent: bool) -> List[int]:
+    chat2edit = Chat2Edit(
+        llm=ScriptedLlm(create_script(args.blocks)),
+        context_provider=IoToolContextProvider(args.blocks, args.io_ms / 1000),
+        execution_strategy=NativeExecutionStrategy(),
+        config=Chat2EditConfig(concurrent_execution=concurrent),
+    )
+    samples: List[int] = []
+
+    for i in range(args.warmup + args.requests):
+        start = perf_counter_ns()
+        response, _, _ = await chat2edit.generate(Message(text="Sum the fetched values"))
+        elapsed = perf_counter_ns() - start
+        assert response is not None, "The scripted answer should respond in one cycle"
+
+        if i >= args.warmup:
+            samples.append(elapsed)
+
+    return samples
+
+
+async def run(args: argparse.Namespace) -> Dict[str, Any]:
+    sequential = summarize(to_milliseconds(await run_mode(args, concurrent=False)))
+    concurrent = summarize(to_milliseconds(await run_mode(args, concurrent=True)))
+
+    return {
+        "sequential": sequential,
+        "concurrent": concurrent,
+        "speedup": sequential["p50"] / concurrent["p50"],
+        "config": vars(args),
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--requests", type=int, default=20)
+    parser.add_argument("--warmup", type=int, default=2)
+    parser.add_argument("--blocks", type=int, default=4, help="independent tool calls")
+    parser.add_argument("--io-ms", type=float, default=50.0, help="latency of each tool call")
+    parser.add_argument("--output", default=None, help="write JSON results to this path")
+    args = parser.parse_args()
+
+    results = asyncio.run(run(args))
+    write_results("concurrency", results, args.output)
+    print(f"{'speedup (p50)':<48} {results['speedup']:.2f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,109 @@
+"""
+End-to-end latency of `Chat2Edit.generate` against a scripted fake LLM.
+
+Every request runs the full loop (prompt build, LLM call, parsing, processing,
+execution and contextualization) with the calculator context extended by a
+synthetic tool API. Per-stage and total timings are reported as p50/p95/p99
+and can be written as JSON to compare runs across commits.
+
+Usage: python -m benchmarks.e2e [--requests 50] [--tools 200] [--output e2e.json]
+"""
+
+import argparse
+import asyncio
+from time import perf_counter_ns
+from typing import Any, Dict, List
+
+from benchmarks.fakes import ScriptedLlm, SyntheticToolContextProvider
+from benchmarks.harness import summarize, to_milliseconds, write_results
+from benchmarks.instrumentation import (
+    STAGES,
+    StageTimer,
+    TimedContextStrategy,
+    TimedExecutionStrategy,
+    TimedLlm,
+    TimedPromptingStrategy,
+)
+from chat2edit import Chat2Edit, Chat2EditConfig
+from chat2edit.context.strategies import DefaultContextStrategy
+from chat2edit.execution.strategies import DefaultExecutionStrategy, NativeExecutionStrategy
+from chat2edit.models import ChatCycle, Message
+from chat2edit.prompting.strategies import OtcPromptingStrategy
+
+ENGINES = {"default": DefaultExecutionStrategy, "native": NativeExecutionStrategy}
+
+
+async def run(args: argparse.Namespace) -> Dict[str, Any]:
+    timer = StageTimer()
+    chat2edit = Chat2Edit(
+        llm=TimedLlm(
+            ScriptedLlm(
+                latency=args.latency_ms / 1000,
+                jitter=args.jitter_ms / 1000 if args.distribution != "lognormal" else args.jitter,
+                distribution=args.distribution,
+                seed=args.seed,
+            ),
+            timer,
+        ),
+        context_provider=SyntheticToolContextProvider(args.tools, args.classes),
+        context_strategy=TimedContextStrategy(DefaultContextStrategy(), timer),
+        prompting_strategy=TimedPromptingStrategy(OtcPromptingStrategy(), timer),
+        execution_strategy=TimedExecutionStrategy(ENGINES[args.engine](), timer),
+        config=Chat2EditConfig(max_history_cycles=args.history),
+    )
+
+    cycles: List[ChatCycle] = []
+    context: Dict[str, Any] = {}
+    totals: List[int] = []
+
+    for i in range(args.warmup + args.requests):
+        start = perf_counter_ns()
+        _, chat_cycle, context = await chat2edit.generate(
+            Message(text=f"Request number {i}"), cycles, context
+        )
+        elapsed = perf_counter_ns() - start
+        cycles.append(chat_cycle)
+
+        if i < args.warmup:
+            timer.end_request()
+            timer.samples.clear()
+            continue
+
+        totals.append(elapsed)
+        timer.end_request()
+
+    results = {"total": summarize(to_milliseconds(totals))}
+    results.update({stage: summarize(to_milliseconds(timer.samples[stage])) for stage in STAGES})
+    results["config"] = vars(args)
+    return results
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--requests", type=int, default=50)
+    parser.add_argument("--warmup", type=int, default=3)
+    parser.add_argument("--tools", type=int, default=200)
+    parser.add_argument("--classes", type=int, default=20)
+    parser.add_argument("--history", type=int, default=None, help="max_history_cycles")
+    parser.add_argument("--latency-ms", type=float, default=0.0)
+    parser.add_argument("--jitter-ms", type=float, default=0.0)
+    parser.add_argument("--jitter", type=float, default=0.25, help="lognormal sigma")
+    parser.add_argument(
+        "--distribution",
+        choices=["constant", "uniform", "normal", "lognormal"],
+        default="constant",
+    )
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--engine", choices=sorted(ENGINES), default="default")
+    parser.add_argument("--output", default=None, help="write JSON results to this path")
+    args = parser.parse_args()
+
+    if args.tools < 2:
+        parser.error("--tools must be at least 2, the scripted answers call tool_0 and tool_1")
+
+    results = asyncio.run(run(args))
+    write_results("e2e", results, args.output)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,235 @@
+"""Deterministic stand-ins for the LLM and a large tool API."""
+
+import asyncio
+import importlib.util
+import random
+import sys
+import tempfile
+from pathlib import Path
+from types import ModuleType
+from typing import Any, Dict, List, Sequence, Tuple
+
+from chat2edit.context.providers import CalculatorContextProvider, ContextProvider
+from chat2edit.models import (
+    ChatCycle,
+    ExecutionBlock,
+    Exemplar,
+    Feedback,
+    Message,
+    PromptCycle,
+    PromptExchange,
+)
+from chat2edit.prompting.llms import Llm
+
+OTC_ANSWER_TEMPLATE = """
+thinking: {thinking}
+commands:
+```python
+{commands}
+```
+""".strip()
+
+DEFAULT_SCRIPT: List[Tuple[str, str]] = [
+    (
+        "I should use the math module to calculate the square root.",
+        'result = math.sqrt(1296)\nrespond_to_user(f"The square root of 1296 is {result}")',
+    ),
+    (
+        "I should transform the value with the tools first.",
+        "value = tool_0(3, 4.0)\nscaled = tool_1(value, 2.0)",
+    ),
+    (
+        "The value is ready, I can answer.",
+        'respond_to_user(f"The scaled value is {scaled}")',
+    ),
+]
+
+
+class ScriptedLlm(Llm):
+    """
+    Replays scripted OTC answers after a simulated network latency.
+
+    Latencies are drawn from a seeded distribution so runs are reproducible:
+    `constant` always waits `latency`, `uniform` waits in
+    [latency - jitter, latency + jitter], `normal` and `lognormal` use
+    `jitter` as the spread.
+    """
+
+    def __init__(
+        self,
+        script: Sequence[Tuple[str, str]] = DEFAULT_SCRIPT,
+        *,
+        latency: float = 0.0,
+        jitter: float = 0.0,
+        distribution: str = "constant",
+        seed: int = 0,
+    ) -> None:
+        self._answers = [
+            OTC_ANSWER_TEMPLATE.format(thinking=thinking, commands=commands)
+            for thinking, commands in script
+        ]
+        self._latency = latency
+        self._jitter = jitter
+        self._distribution = distribution
+        self._random = random.Random(seed)
+        self._index = 0
+
+    def sample_latency(self) -> float:
+        if self._distribution == "constant":
+            return self._latency
+        if self._distribution == "uniform":
+            return self._random.uniform(self._latency - self._jitter, self._latency + self._jitter)
+        if self._distribution == "normal":
+            return self._random.gauss(self._latency, self._jitter)
+        if self._distribution == "lognormal":
+            return self._latency * self._random.lognormvariate(0, self._jitter)
+
+        raise ValueError(f"Unknown latency distribution: {self._distribution}")
+
+    async def generate(self, prompt: Message, history: List[Tuple[Message, Message]]) -> Message:
+        latency = max(self.sample_latency(), 0.0)
+        if latency:
+            await asyncio.sleep(latency)
+
+        answer = self._answers[self._index % len(self._answers)]
+        self._index += 1
+        return Message(text=answer)
+
+    def get_info(self) -> Dict[str, Any]:
+        return {
+            "model": "scripted",
+            "latency": self._latency,
+            "jitter": self._jitter,
+            "distribution": self._distribution,
+        }
+
+
+SYNTHETIC_TOOL_TEMPLATE = """
+def tool_{index}(value: float, factor: float = 1.0) -> float:
+    return value * factor + {index}
+"""
+
+SYNTHETIC_ASYNC_TOOL_TEMPLATE = """
+async def async_tool_{index}(value: float) -> float:
+    return value + {index}
+"""
+
+SYNTHETIC_CLASS_TEMPLATE = '''
+class Entity{index}:
+    """Synthetic entity number {index}."""
+
+    name: str = "entity_{index}"
+    weight: float = {index}.0
+
+    def scale(self, factor: float) -> "Entity{index}":
+        return self
+
+    async def refresh(self) -> None:
+        pass
+'''
+
+
+def create_synthetic_module(num_tools: int, num_classes: int) -> ModuleType:
+    """
+    Write a synthetic tool module to a temporary directory and import it.
+
+    The module lives outside site-packages and has real source, so the stub
+    generator renders full stubs for it just like a user's own tools.
+    """
+    source = "".join(SYNTHETIC_TOOL_TEMPLATE.format(index=i) for i in range(num_tools))
+    source += "".join(SYNTHETIC_ASYNC_TOOL_TEMPLATE.format(index=i) for i in range(num_tools // 4))
+    source += "".join(SYNTHETIC_CLASS_TEMPLATE.format(index=i) for i in range(num_classes))
+
+    module_name = f"chat2edit_synthetic_tools_{num_tools}_{num_classes}"
+    if module_name in sys.modules:
+        return sys.modules[module_name]
+
+    path = Path(tempfile.mkdtemp(prefix="chat2edit-bench-")) / f"{module_name}.py"
+    path.write_text(source)
+
+    spec = importlib.util.spec_from_file_location(module_name, path)
+    assert spec is not None and spec.loader is not None
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[module_name] = module
+    spec.loader.exec_module(module)
+
+    return module
+
+
+class SyntheticToolContextProvider(ContextProvider):
+    """Calculator context extended with a large synthetic tool API."""
+
+    def __init__(self, num_tools: int = 200, num_classes: int = 20) -> None:
+        self._base = CalculatorContextProvider()
+        self._module = create_synthetic_module(num_tools, num_classes)
+        self._context = self._base.get_context()
+        self._context.update(
+            {
+                name: value
+                for name, value in vars(self._module).items()
+                if name.startswith(("tool_", "async_tool_", "Entity"))
+            }
+        )
+
+    def get_context(self) -> Dict[str, Any]:
+        return dict(self._context)
+
+    def get_exemplars(self) -> List[Exemplar]:
+        return self._base.get_exemplars()
+
+
+class IoToolContextProvider(ContextProvider):
+    """Calculator context extended with async tools that wait on simulated I/O."""
+
+    def __init__(self, num_tools: int = 4, io_latency: float = 0.05) -> None:
+        self._base = CalculatorContextProvider()
+        self._context = self._base.get_context()
+        self._context.update(
+            {f"fetch_{i}": self._create_io_tool(i, io_latency) for i in range(num_tools)}
+        )
+
+    @staticmethod
+    def _create_io_tool(index: int, io_latency: float) -> Any:
+        async def fetch(value: float) -> float:
+            await asyncio.sleep(io_latency)
+            return value + index
+
+        fetch.__name__ = fetch.__qualname__ = f"fetch_{index}"
+        return fetch
+
+    def get_context(self) -> Dict[str, Any]:
+        return dict(self._context)
+
+    def get_exemplars(self) -> List[Exemplar]:
+        return self._base.get_exemplars()
+
+
+def create_chat_cycle(turn: int, prompt_chars: int = 4000) -> ChatCycle:
+    """Build a completed two prompt cycle history entry without running anything."""
+    prompt_cycles = []
+
+    for i in range(2):
+        exchange = PromptExchange(
+            prompt=Message(text="p" * prompt_chars),
+            answer=Message(text=f"thinking: step {i}\ncommands:\n```python\nx_{i} = {turn}\n```"),
+            code=f"x_{i} = {turn}",
+        )
+        blocks = [
+            ExecutionBlock(
+                generated_code=f"x_{i} = {turn}",
+                processed_code=f"x_{i} = {turn}\n",
+                executed=True,
+            ),
+            ExecutionBlock(
+                generated_code="respond_to_user('done')",
+                processed_code="respond_to_user('done')\n",
+                feedback=Feedback(type="incomplete_cycle", severity="info") if i == 0 else None,
+                response=Message(text="done") if i == 1 else None,
+                executed=True,
+            ),
+        ]
+        prompt_cycles.append(PromptCycle(exchanges=[exchange], blocks=blocks))
+
+    return ChatCycle(
+        request=Message(text=f"request {turn}"), cycles=prompt_cycles, start_time=0, end_time=0
+    )
@@ -0,0 +1,123 @@
+"""Shared statistics and result reporting for the benchmark suites."""
+
+import gc
+import json
+import math
+import platform
+import statistics
+import subprocess
+import sys
+from datetime import datetime, timezone
+from pathlib import Path
+from time import perf_counter_ns
+from typing import Any, Callable, Dict, List, Optional, Sequence
+
+
+def percentile(samples: Sequence[float], q: float) -> float:
+    """Linear-interpolated percentile of `samples`, with `q` in [0, 100]."""
+    if not samples:
+        return math.nan
+
+    ordered = sorted(samples)
+    rank = (len(ordered) - 1) * q / 100
+    lower = math.floor(rank)
+    upper = math.ceil(rank)
+
+    if lower == upper:
+        return ordered[lower]
+
+    return ordered[lower] + (ordered[upper] - ordered[lower]) * (rank - lower)
+
+
+def summarize(samples: Sequence[float]) -> Dict[str, float]:
+    if not samples:
+        return {"count": 0}
+
+    return {
+        "count": len(samples),
+        "min": min(samples),
+        "mean": statistics.fmean(samples),
+        "stdev": statistics.stdev(samples) if len(samples) > 1 else 0.0,
+        "p50": percentile(samples, 50),
+        "p95": percentile(samples, 95),
+        "p99": percentile(samples, 99),
+        "max": max(samples),
+    }
+
+
+def run_benchmark(
+    func: Callable[[], Any],
+    *,
+    warmup: int = 3,
+    repetitions: int = 20,
+    number: int = 1,
+) -> Dict[str, float]:
+    """
+    Time `func` in milliseconds per call.
+
+    Each repetition calls `func` `number` times and records the mean, so very
+    fast operations can be batched above the timer resolution. Garbage
+    collection is paused while timing, as `timeit` does.
+    """
+    for _ in range(warmup):
+        func()
+
+    samples = []
+    gc.collect()
+    gc_enabled = gc.isenabled()
+    gc.disable()
+
+    try:
+        for _ in range(repetitions):
+            start = perf_counter_ns()
+            for _ in range(number):
+                func()
+            samples.append((perf_counter_ns() - start) / number / 1e6)
+    finally:
+        if gc_enabled:
+            gc.enable()
+
+    return summarize(samples)
+
+
+def get_git_commit() -> Optional[str]:
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "HEAD"],
+            capture_output=True,
+            text=True,
+            check=True,
+            cwd=Path(__file__).parent,
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def collect_metadata() -> Dict[str, Any]:
+    return {
+        "commit": get_git_commit(),
+        "timestamp": datetime.now(timezone.utc).isoformat(),
+        "python": sys.version.split()[0],
+        "platform": platform.platform(),
+    }
+
+
+def write_results(suite: str, results: Dict[str, Any], output: Optional[str]) -> None:
+    """Print a human readable table and optionally write the machine-readable JSON."""
+    document = {"suite": suite, "metadata": collect_metadata(), "results": results}
+
+    for name, stats in results.items():
+        if isinstance(stats, dict) and "p50" in stats:
+            print(
+                f"{name:<48} n={stats['count']:<6} "
+                f"p50={stats['p50']:>10.3f}ms p95={stats['p95']:>10.3f}ms "
+                f"p99={stats['p99']:>10.3f}ms"
+            )
+
+    if output:
+        Path(output).write_text(json.dumps(document, indent=2))
+        print(f"Results written to {output}")
+
+
+def to_milliseconds(samples_ns: List[int]) -> List[float]:
+    return [sample / 1e6 for sample in samples_ns]
@@ -0,0 +1,107 @@
+"""
+Import-time budget for `chat2edit` measured with `python -X importtime`.
+
+Imports the target module in fresh interpreters, reports the cumulative cost
+of the slowest modules and fails when the total exceeds `--budget-ms` or when
+a module that should load lazily (LLM SDKs, the execution engine, formatters)
+is imported eagerly.
+
+Usage: python -m benchmarks.import_time [--module chat2edit] [--budget-ms 500]
+"""
+
+import argparse
+import re
+import subprocess
+import sys
+from typing import Any, Dict, List, Tuple
+
+from benchmarks.harness import summarize, write_results
+
+IMPORTTIME_PATTERN = re.compile(r"^import time:\s+(\d+) \|\s+(\d+) \|( *)(\S+)$")
+
+# Modules that must not be loaded by a plain `import chat2edit`
+LAZY_MODULES = ["google.generativeai", "openai", "IPython", "black", "astor"]
+
+
+def measure_imports(module: str, statement: str) -> List[Tuple[str, int, int, int]]:
+    """Return (module, self_us, cumulative_us, depth) for every import in a fresh interpreter."""
+    process = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", statement or f"import {module}"],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    imports = []
+
+    for line in process.stderr.splitlines():
+        match = IMPORTTIME_PATTERN.match(line)
+        if match:
+            self_us, cumulative_us, indent, name = match.groups()
+            imports.append((name, int(self_us), int(cumulative_us), len(indent) // 2))
+
+    return imports
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--module", default="chat2edit")
+    parser.add_argument("--statement", default="", help="code to run instead of `import MODULE`")
+    parser.add_argument("--repetitions", type=int, default=5)
+    parser.add_argument("--top", type=int, default=20, help="number of slowest modules to report")
+    parser.add_argument("--budget-ms", type=float, default=None)
+    parser.add_argument("--output", default=None, help="write JSON results to this path")
+    args = parser.parse_args()
+
+    samples: Dict[str, List[float]] = {}
+    totals: List[float] = []
+    loaded: set = set()
+    # Interpreter startup imports are not attributed to the module under test
+    startup = {name for name, *_ in measure_imports("", "pass")}
+
+    for _ in range(args.repetitions):
+        imports = measure_imports(args.module, args.statement)
+        # Top-level imports are not nested in one another, so they add up to the total
+        totals.append(
+            sum(
+                cumulative
+                for name, _, cumulative, depth in imports
+                if depth == 0 and name not in startup
+            )
+            / 1000
+        )
+
+        for name, _, cumulative, _ in imports:
+            if name in startup:
+                continue
+            samples.setdefault(name, []).append(cumulative / 1000)
+            loaded.add(name)
+
+    slowest = sorted(samples, key=lambda name: max(samples[name]), reverse=True)[: args.top]
+    results: Dict[str, Any] = {"import.total": summarize(totals)}
+    results.update({f"import.{name}": summarize(samples[name]) for name in slowest})
+
+    eager = [
+        name
+        for name in LAZY_MODULES
+        if name in loaded or any(m.startswith(f"{name}.") for m in loaded)
+    ]
+    results["eager_modules"] = eager
+    results["config"] = vars(args)
+    write_results("import_time", results, args.output)
+
+    failures = []
+    if eager:
+        failures.append(f"modules expected to load lazily were imported: {', '.join(eager)}")
+    if args.budget_ms is not None and results["import.total"]["p50"] > args.budget_ms:
+        failures.append(
+            f"import took {results['import.total']['p50']:.1f}ms, budget is {args.budget_ms:.1f}ms"
+        )
+
+    for failure in failures:
+        print(f"FAIL: {failure}")
+
+    sys.exit(1 if failures else 0)
+
+
+if __name__ == "__main__":
+    main()
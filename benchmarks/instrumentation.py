@@ -0,0 +1,128 @@
+"""Delegating strategy wrappers that time each stage of the generate loop."""
+
+from collections import defaultdict
+from contextlib import contextmanager
+from time import perf_counter_ns
+from typing import Any, Callable, Collection, Dict, Iterator, List, Optional, Tuple
+
+from chat2edit.context.strategies import ContextStrategy
+from chat2edit.execution.strategies import ExecutionStrategy
+from chat2edit.execution.utils import LogCallback
+from chat2edit.models import (
+    ChatCycle,
+    ExecutionError,
+    ExecutionProfile,
+    Exemplar,
+    Feedback,
+    Message,
+)
+from chat2edit.prompting.llms import Llm
+from chat2edit.prompting.strategies import PromptingStrategy
+
+STAGES = ["prompt_build", "llm", "parse", "process", "execute", "contextualize"]
+
+
+class StageTimer:
+    def __init__(self) -> None:
+        self.samples: Dict[str, List[int]] = defaultdict(list)
+        self._current: Dict[str, int] = defaultdict(int)
+
+    @contextmanager
+    def measure(self, stage: str) -> Iterator[None]:
+        start = perf_counter_ns()
+        try:
+            yield
+        finally:
+            self._current[stage] += perf_counter_ns() - start
+
+    def end_request(self) -> None:
+        """Record one sample per stage, summing every call made during the request."""
+        for stage in STAGES:
+            self.samples[stage].append(self._current.pop(stage, 0))
+
+
+class TimedLlm(Llm):
+    def __init__(self, llm: Llm, timer: StageTimer) -> None:
+        self._llm = llm
+        self._timer = timer
+
+    async def generate(self, prompt: Message, history: List[Tuple[Message, Message]]) -> Message:
+        with self._timer.measure("llm"):
+            return await self._llm.generate(prompt, history)
+
+    def get_info(self) -> Dict[str, Any]:
+        return self._llm.get_info()
+
+
+class TimedPromptingStrategy(PromptingStrategy):
+    def __init__(self, strategy: PromptingStrategy, timer: StageTimer) -> None:
+        self._strategy = strategy
+        self._timer = timer
+
+    def create_prompt(
+        self,
+        cycles: List[ChatCycle],
+        exemplars: List[Exemplar],
+        context: Dict[str, Any],
+    ) -> Message:
+        with self._timer.measure("prompt_build"):
+            return self._strategy.create_prompt(cycles, exemplars, context)
+
+    def get_refine_prompt(self) -> Message:
+        return self._strategy.get_refine_prompt()
+
+    def extract_code(self, text: str) -> Optional[str]:
+        with self._timer.measure("parse"):
+            return self._strategy.extract_code(text)
+
+
+class TimedExecutionStrategy(ExecutionStrategy):
+    def __init__(self, strategy: ExecutionStrategy, timer: StageTimer) -> None:
+        self._strategy = strategy
+        self._timer = timer
+
+    @property
+    def supports_concurrent_execution(self) -> bool:
+        return self._strategy.supports_concurrent_execution
+
+    def parse(self, code: str) -> List[str]:
+        with self._timer.measure("parse"):
+            return self._strategy.parse(code)
+
+    def process(self, code: str, context: Dict[str, Any]) -> str:
+        with self._timer.measure("process"):
+            return self._strategy.process(code, context)
+
+    async def execute(
+        self,
+        code: str,
+        context: Dict[str, Any],
+        on_log: Optional[LogCallback] = None,
+        on_profile: Optional[Callable[[ExecutionProfile], None]] = None,
+        attachment_names: Optional[Collection[str]] = None,
+    ) -> Tuple[
+        Optional[ExecutionError],
+        Optional[Feedback],
+        Optional[Message],
+        List[str],
+    ]:
+        with self._timer.measure("execute"):
+            return await self._strategy.execute(code, context, on_log, on_profile, attachment_names)
+
+
+class TimedContextStrategy(ContextStrategy):
+    def __init__(self, strategy: ContextStrategy, timer: StageTimer) -> None:
+        self._strategy = strategy
+        self._timer = timer
+
+    def filter_context(self, context: Dict[str, Any]) -> Dict[str, Any]:
+        with self._timer.measure("contextualize"):
+            return self._strategy.filter_context(context)
+
+    def contextualize_message(self, message: Message, context: Dict[str, Any]) -> Message:
+        with self._timer.measure("contextualize"):
+            return self._strategy.contextualize_message(message, context)
+
+    def decontextualize_message(self, message: Message, context: Dict[str, Any]) -> Message:
+        with self._timer.measure("contextualize"):
+            return self._strategy.decontextualize_message(message, context)
@@ -0,0 +1,241 @@
+"""
+Microbenchmarks for the stubbing, prompting and execution hot paths.
+
+Each benchmark isolates one subsystem and runs offline with warmup,
+repetitions and summary statistics, so changes to a single subsystem can be
+measured and tracked over time with `--output` and `benchmarks.compare`.
+
+Usage: python -m benchmarks.micro [--filter stub] [--repetitions 20] [--output micro.json]
+"""
+
+import argparse
+import asyncio
+import inspect
+import sys
+from typing import Any, Callable, Dict, List
+
+from benchmarks.fakes import SyntheticToolContextProvider, create_chat_cycle
+from benchmarks.harness import run_benchmark, write_results
+from chat2edit.context.providers import CalculatorContextProvider
+from chat2edit.context.utils import value_to_path
+from chat2edit.execution.decorators import (
+    deepcopy_parameter,
+    feedback_empty_list_parameters,
+    feedback_ignored_return_value,
+    feedback_invalid_parameter_type,
+    feedback_mismatch_list_parameters,
+    feedback_missing_all_optional_parameters,
+    feedback_unexpected_error,
+    respond,
+)
+from chat2edit.execution.signaling import pop_response
+from chat2edit.execution.strategies import (
+    DefaultExecutionStrategy,
+    ExecutionStrategy,
+    NativeExecutionStrategy,
+)
+from chat2edit.execution.utils import LogCapture, fix_unawaited_async_calls
+from chat2edit.models import Message
+from chat2edit.prompting.strategies import OtcPromptingStrategy
+from chat2edit.prompting.stubbing.stubs import CodeStub, ImportInfo
+from chat2edit.prompting.stubbing.utils import is_external_package
+
+ASYNC_CALLS_CODE = "\n".join(
+    f"value_{i} = async_tool_{i % 4}(tool_{i}(1.0, 2.0))" for i in range(20)
+)
+
+
+EXECUTION_BLOCKS = {
+    "assign": "value = tool_0(1.0, 2.0)",
+    "await": "value = await async_tool_0(tool_1(1.0, 2.0))",
+    "error": "value = tool_0(1.0, 2.0) / 0",
+}
+
+
+class Node:
+    def __init__(self, children: List[Any]) -> None:
+        self.children = children
+
+
+def create_deep_graph(depth: int, fanout: int) -> Any:
+    """Alternate dicts, lists and objects so every branch of `value_to_path` is used."""
+    if depth == 0:
+        return object()
+
+    children = [create_deep_graph(depth - 1, fanout) for _ in range(fanout)]
+
+    if depth % 3 == 0:
+        return {f"key_{i}": child for i, child in enumerate(children)}
+    if depth % 3 == 1:
+        return children
+
+    return Node(children)
+
+
+def find_last_leaf(graph: Any) -> Any:
+    while True:
+        if isinstance(graph, dict):
+            graph = list(graph.values())[-1]
+        elif isinstance(graph, list):
+            graph = graph[-1]
+        elif isinstance(graph, Node):
+            graph = graph.children[-1]
+        else:
+            return graph
+
+
+def plain(values: List[int], other: List[int], count: int = 0, extra: Any = None) -> Message:
+    return Message(text="ok")
+
+
+def collect_module_objects(count: int) -> List[Any]:
+    """Collect classes and functions defined across the loaded modules, one per module."""
+    objects: List[Any] = []
+
+    for name, module in list(sys.modules.items()):
+        if name.startswith("__"):
+            continue
+
+        for value in list(vars(module).values()):
+            if (inspect.isclass(value) or inspect.isfunction(value)) and value.__module__ == name:
+                objects.append(value)
+                break
+
+    return [objects[i % len(objects)] for i in range(count)]
+
+
+def create_decorator_benchmarks() -> Dict[str, Callable[[], Any]]:
+    decorated = {
+        "undecorated": plain,
+        "feedback_invalid_parameter_type": feedback_invalid_parameter_type(plain),
+        "feedback_ignored_return_value": feedback_ignored_return_value(plain),
+        "feedback_unexpected_error": feedback_unexpected_error(plain),
+        "feedback_empty_list_parameters": feedback_empty_list_parameters(["values"])(plain),
+        "feedback_mismatch_list_parameters": feedback_mismatch_list_parameters(["values", "other"])(
+            plain
+        ),
+        "feedback_missing_all_optional_parameters": feedback_missing_all_optional_parameters(
+            ["count", "extra"]
+        )(plain),
+        "deepcopy_parameter": deepcopy_parameter("values")(plain),
+        "respond": respond(plain),
+    }
+
+    def create_call(func: Callable[..., Message]) -> Callable[[], Any]:
+        def call() -> Any:
+            # The assignment keeps feedback_ignored_return_value from raising
+            result = func([1, 2, 3], [4, 5, 6], count=1)
+            pop_response()
+            return result
+
+        return call
+
+    return {f"decorator.{name}": create_call(func) for name, func in decorated.items()}
+
+
+def create_execution_benchmarks(context: Dict[str, Any]) -> Dict[str, Callable[[], Any]]:
+    """Per-block overhead of each execution engine on the same processed blocks."""
+    loop = asyncio.new_event_loop()
+    strategies: Dict[str, ExecutionStrategy] = {
+        "default": DefaultExecutionStrategy(),
+        "native": NativeExecutionStrategy(),
+    }
+
+    def create_run(strategy: ExecutionStrategy, code: str) -> Callable[[], Any]:
+        return lambda: loop.run_until_complete(strategy.execute(code, dict(context)))
+
+    benchmarks = {
+        f"execution.{engine}_execute.{block}": create_run(strategy, code)
+        for engine, strategy in strategies.items()
+        for block, code in EXECUTION_BLOCKS.items()
+    }
+    # A fresh cache per call measures a miss, the shared strategy measures a hit
+    benchmarks["execution.native_process.miss"] = lambda: NativeExecutionStrategy().process(
+        ASYNC_CALLS_CODE, context
+    )
+    benchmarks["execution.native_process.hit"] = lambda: strategies["native"].process(
+        ASYNC_CALLS_CODE, context
+    )
+
+    # Chatty output: many short lines, and one long line written in small fragments
+    benchmarks["execution.log_capture.lines"] = lambda: capture_output(
+        [f"\x1b[32mstep {i}\x1b[0m\n" for i in range(10000)]
+    )
+    benchmarks["execution.log_capture.long_line"] = lambda: capture_output(
+        ["fragment "] * 10000 + ["\n"]
+    )
+
+    return benchmarks
+
+
+def capture_output(writes: List[str]) -> List[str]:
+    capture = LogCapture(lambda line: None)
+    for text in writes:
+        capture.write(text)
+    capture.close()
+    return capture.get_lines()
+
+
+def create_benchmarks(args: argparse.Namespace) -> Dict[str, Callable[[], Any]]:
+    synthetic_context = SyntheticToolContextProvider(args.tools, args.classes).get_context()
+    synthetic_stub = CodeStub.from_context(synthetic_context)
+    calculator = CalculatorContextProvider()
+    strategy = OtcPromptingStrategy()
+    exemplars = calculator.get_exemplars()
+    calculator_context = calculator.get_context()
+    history = [create_chat_cycle(turn, prompt_chars=200) for turn in range(args.cycles)]
+    graph = create_deep_graph(args.depth, args.fanout)
+    leaf = find_last_leaf(graph)
+    module_objects = collect_module_objects(args.context_entries)
+
+    benchmarks = {
+        "stubbing.code_stub_generate": lambda: CodeStub.from_context(synthetic_context).generate(),
+        "stubbing.code_stub_render": synthetic_stub.generate,
+        "stubbing.is_external_package": lambda: list(map(is_external_package, module_objects)),
+        "stubbing.import_info_from_obj": lambda: list(map(ImportInfo.from_obj, module_objects)),
+        "prompting.create_prompt": lambda: strategy.create_prompt(
+            history, exemplars, calculator_context
+        ),
+        "execution.fix_unawaited_async_calls": lambda: fix_unawaited_async_calls(
+            ASYNC_CALLS_CODE, synthetic_context
+        ),
+        "context.value_to_path": lambda: value_to_path(leaf, {"graph": graph}),
+    }
+    benchmarks.update(create_decorator_benchmarks())
+    benchmarks.update(create_execution_benchmarks(synthetic_context))
+
+    return benchmarks
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--filter", default="", help="only run benchmarks containing this text")
+    parser.add_argument("--warmup", type=int, default=3)
+    parser.add_argument("--repetitions", type=int, default=20)
+    parser.add_argument("--tools", type=int, default=200)
+    parser.add_argument("--classes", type=int, default=20)
+    parser.add_argument("--context-entries", type=int, default=500)
+    parser.add_argument("--cycles", type=int, default=50)
+    parser.add_argument("--depth", type=int, default=6)
+    parser.add_argument("--fanout", type=int, default=5)
+    parser.add_argument("--output", default=None, help="write JSON results to this path")
+    args = parser.parse_args()
+
+    results: Dict[str, Any] = {}
+
+    for name, func in create_benchmarks(args).items():
+        if args.filter not in name:
+            continue
+
+        # Batch sub-millisecond operations so each sample is above timer noise
+        number = 1 if not name.startswith("decorator.") else 1000
+        results[name] = run_benchmark(
+            func, warmup=args.warmup, repetitions=args.repetitions, number=number
+        )
+
+    results["config"] = vars(args)
+    write_results("micro", results, args.output)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,83 @@
+"""
+Write amplification of `SessionJournal` against full re-serialization.
+
+Simulates a session of synthetic turns and compares the bytes written when
+each turn appends its records to a journal with the bytes written when the
+whole `cycles` list is dumped after every turn.
+
+Usage: python -m benchmarks.session_journal [--turns 200] [--compress]
+"""
+
+import argparse
+import json
+import os
+import tempfile
+import time
+from typing import List
+
+from pydantic import TypeAdapter
+
+from benchmarks.fakes import create_chat_cycle
+from chat2edit.models import ChatCycle
+from chat2edit.sessions import SessionJournal
+
+CYCLES_ADAPTER = TypeAdapter(List[ChatCycle])
+
+
+def record_chat_cycle(journal: SessionJournal, chat_cycle: ChatCycle) -> None:
+    journal.append_chat_cycle(chat_cycle)
+    for prompt_cycle in chat_cycle.cycles:
+        journal.append_prompt_cycle(prompt_cycle)
+        for block in prompt_cycle.blocks:
+            journal.append_execution_block(block)
+
+
+def run(turns: int, prompt_chars: int, compress: bool) -> dict:
+    cycles = [create_chat_cycle(turn, prompt_chars) for turn in range(turns)]
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "session.journal")
+
+        start = time.perf_counter()
+        with SessionJournal(path, compress=compress) as journal:
+            for chat_cycle in cycles:
+                record_chat_cycle(journal, chat_cycle)
+        journal_seconds = time.perf_counter() - start
+        journal_bytes = os.path.getsize(path)
+
+        start = time.perf_counter()
+        with SessionJournal(path) as journal:
+            recent = journal[-4:]
+        lazy_load_seconds = time.perf_counter() - start
+        assert [c.request.text for c in recent] == [c.request.text for c in cycles[-4:]]
+
+    full_bytes = 0
+    start = time.perf_counter()
+    for turn in range(1, turns + 1):
+        full_bytes += len(CYCLES_ADAPTER.dump_json(cycles[:turn]))
+    full_seconds = time.perf_counter() - start
+
+    return {
+        "turns": turns,
+        "compress": compress,
+        "journal_bytes": journal_bytes,
+        "full_reserialization_bytes": full_bytes,
+        "write_amplification": full_bytes / journal_bytes,
+        "journal_seconds": journal_seconds,
+        "full_reserialization_seconds": full_seconds,
+        "lazy_load_last_4_seconds": lazy_load_seconds,
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--turns", type=int, default=200)
+    parser.add_argument("--prompt-chars", type=int, default=4000)
+    parser.add_argument("--compress", action="store_true")
+    args = parser.parse_args()
+
+    print(json.dumps(run(args.turns, args.prompt_chars, args.compress), indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -1,14 +1,41 @@
-from time import time_ns
-from typing import Any, Callable, Dict, List, Optional, Tuple, cast
+import ast
+import asyncio
+import re
+from collections import deque
+from statistics import median
+from time import monotonic, perf_counter, time_ns
+from typing import (
+    Any,
+    AsyncIterator,
+    Callable,
+    Collection,
+    Deque,
+    Dict,
+    List,
+    Optional,
+    Sequence,
+    Set,
+    Tuple,
+    cast,
+)
 
 from pydantic import BaseModel, Field
 
-from chat2edit.context.providers import CalculatorContextProvider, ContextProvider
+from chat2edit.context.providers import ContextProvider
 from chat2edit.context.strategies import ContextStrategy, DefaultContextStrategy
-from chat2edit.execution.strategies import DefaultExecutionStrategy, ExecutionStrategy
+from chat2edit.execution.signaling import pop_feedback, pop_response
+from chat2edit.execution.strategies import ExecutionStrategy
+from chat2edit.execution.utils import (
+    TrackingNamespace,
+    get_outcome_block,
+    group_independent_blocks,
+)
+from chat2edit.metrics import Chat2EditMetrics
 from chat2edit.models import (
     ChatCycle,
     ExecutionBlock,
+    ExecutionError,
+    ExecutionProfile,
     Exemplar,
     Feedback,
     Message,
@@ -16,13 +43,54 @@ from chat2edit.models import (
     PromptExchange,
 )
 from chat2edit.models.prompt_error import PromptError
-from chat2edit.prompting.llms import GoogleLlm, Llm
-from chat2edit.prompting.strategies import OtcPromptingStrategy, PromptingStrategy
+from chat2edit.prompting.artifacts import PromptArtifact, fingerprint_prompt_inputs
+from chat2edit.prompting.llms import Llm
+from chat2edit.prompting.strategies import PromptingStrategy
+from chat2edit.sessions import Session, SessionJournal, SessionStore
+from chat2edit.streaming import (
+    AnswerDeltaEvent,
+    BlockFinishedEvent,
+    BlockStartedEvent,
+    CodeExtractedEvent,
+    EventSink,
+    LogEvent,
+    OverflowPolicy,
+    PromptEvent,
+    ResponseEvent,
+    StreamEvent,
+    get_event_sink,
+    set_event_sink,
+)
+from chat2edit.tracing import Tracer
 
 
 class Chat2EditConfig(BaseModel):
     max_prompt_cycles: int = Field(default=4, ge=0)
     max_llm_exchanges: int = Field(default=2, ge=0)
+    max_history_cycles: Optional[int] = Field(default=None, ge=0)
+    # Wall-clock seconds allowed for one code block and for all blocks of a prompt cycle.
+    # Execution is cancelled at its next await point, so purely synchronous work
+    # overruns until it yields.
+    block_timeout: Optional[float] = Field(default=None, gt=0)
+    cycle_timeout: Optional[float] = Field(default=None, gt=0)
+    # Await blocks that share no names concurrently when the execution strategy supports it.
+    # Once a block stops the cycle, the later blocks awaited alongside it are cancelled.
+    # Those that already ran, fully or in part, are still reported as executed.
+    concurrent_execution: bool = Field(default=False)
+    # Stop instead of starting a prompt cycle when the time left before the generate deadline
+    # is below the median duration of recent prompt cycles, which would likely be cut off.
+    skip_unaffordable_cycles: bool = Field(default=False)
+    # Answers requested per LLM exchange. The first one whose code compiles is used and the
+    # remaining requests are cancelled, which saves refine round trips at the cost of tokens.
+    num_candidates: int = Field(default=1, ge=1)
+    # Prompt artifact written by `chat2edit-prompt-artifact`. Its sections replace rendering the
+    # context code and exemplars when its fingerprint matches this instance's prompt inputs,
+    # otherwise prompts are rendered as usual.
+    prompt_artifact_path: Optional[str] = Field(default=None)
+
+
+# Number of recent prompt cycle durations the median cycle time is estimated from
+CYCLE_TIME_WINDOW = 100
 
 
 class Chat2EditCallbacks(BaseModel):
@@ -37,175 +105,741 @@ class Chat2Edit:
     def __init__(
         self,
         *,
-        llm: Llm = GoogleLlm("gemini-2.5-flash"),
-        context_provider: ContextProvider = CalculatorContextProvider(),
-        context_strategy: ContextStrategy = DefaultContextStrategy(),
-        prompting_strategy: PromptingStrategy = OtcPromptingStrategy(),
-        execution_strategy: ExecutionStrategy = DefaultExecutionStrategy(),
-        callbacks: Chat2EditCallbacks = Chat2EditCallbacks(),
-        config: Chat2EditConfig = Chat2EditConfig(),
+        llm: Optional[Llm] = None,
+        context_provider: Optional[ContextProvider] = None,
+        context_strategy: Optional[ContextStrategy] = None,
+        prompting_strategy: Optional[PromptingStrategy] = None,
+        execution_strategy: Optional[ExecutionStrategy] = None,
+        callbacks: Optional[Chat2EditCallbacks] = None,
+        config: Optional[Chat2EditConfig] = None,
+        session_store: Optional[SessionStore] = None,
+        tracer: Optional[Tracer] = None,
+        metrics: Optional[Chat2EditMetrics] = None,
     ) -> None:
+        # Components left unset are constructed on first use, so importing and
+        # instantiating Chat2Edit does not load the LLM SDKs or the execution engine
         self._llm = llm
         self._context_provider = context_provider
-        self._context_strategy = context_strategy
+        self._context_strategy = context_strategy or DefaultContextStrategy()
         self._prompting_strategy = prompting_strategy
         self._execution_strategy = execution_strategy
-        self._callbacks = callbacks
-        self._config = config
-        self._exemplars = [
-            self._contextualize_exemplar(exemplar)
-            for exemplar in self._context_provider.get_exemplars()
-        ]
+        self._callbacks = callbacks or Chat2EditCallbacks()
+        self._config = config or Chat2EditConfig()
+        self._session_store = session_store
+        self._tracer = tracer or Tracer()
+        self._metrics = metrics or Chat2EditMetrics()
+        self._exemplars: Optional[List[Exemplar]] = None
+        self._cycle_times: Deque[float] = deque(maxlen=CYCLE_TIME_WINDOW)
+        self._prompt_sections_loaded = False
+
+        if self._config.prompt_artifact_path is not None:
+            self._load_prompt_artifact(self._config.prompt_artifact_path)
 
     async def generate(
         self,
         request: Message,
-        cycles: Optional[List[ChatCycle]] = None,
+        cycles: Optional[Sequence[ChatCycle]] = None,
         context: Optional[Dict[str, Any]] = None,
+        session_id: Optional[str] = None,
+        deadline: Optional[float] = None,
     ) -> Tuple[Optional[Message], ChatCycle, Dict[str, Any]]:
-        # Avoid sharing mutable default arguments across invocations by creating fresh copies
-        cycles = list(cycles) if cycles is not None else []
-        context = dict(context) if context is not None else {}
+        """
+        Answer a request, prompting the LLM and executing its code until it responds.
+
+        `deadline` is a `time.monotonic()` timestamp bounding the whole call. LLM calls
+        and code blocks are cancelled once it passes, and the partial chat cycle is
+        returned with `stop_reason` set to `"deadline"`.
+        """
+        with self._tracer.start_span(
+            "generate", request_chars=len(request.text), session_id=session_id
+        ) as span:
+            session = self._get_session(session_id) if session_id is not None else None
+            # Cycles passed by the caller take precedence and stay owned by the caller
+            records_cycles = session is not None and cycles is None
+            if session is not None:
+                cycles = session.cycles if cycles is None else cycles
+                context = session.context if context is None else context
+
+            journal = cycles if isinstance(cycles, SessionJournal) else None
+            # Avoid sharing mutable default arguments across invocations by creating fresh copies
+            cycles = self._get_history(cycles) if cycles is not None else []
+            context = dict(context) if context is not None else {}
+
+            context.update(self._get_context_provider().get_context())
+            contextualized_request = self._context_strategy.contextualize_message(request, context)
+            chat_cycle = ChatCycle(request=contextualized_request, start_time=time_ns())
+            cycles.append(chat_cycle)
+
+            if journal is not None:
+                journal.append_chat_cycle(chat_cycle)
+
+            if self._callbacks.on_request:
+                self._callbacks.on_request(chat_cycle.request)
+
+            while len(chat_cycle.cycles) < self._config.max_prompt_cycles:
+                chat_cycle.stop_reason = self._check_budget(deadline)
+                if chat_cycle.stop_reason:
+                    break
+
+                prompt_cycle = PromptCycle()
+                chat_cycle.cycles.append(prompt_cycle)
+                cycle_start: Optional[float] = monotonic()
+
+                try:
+                    with self._tracer.start_span(
+                        "prompt_cycle", index=len(chat_cycle.cycles) - 1
+                    ) as cycle_span:
+                        prompt_cycle.exchanges = await self._prompt(cycles, deadline)
+                        cycle_span.set_attribute("exchanges", len(prompt_cycle.exchanges))
+                        self._metrics.exchanges_per_cycle.observe(len(prompt_cycle.exchanges))
+
+                        if journal is not None:
+                            journal.append_prompt_cycle(prompt_cycle)
+
+                        code = prompt_cycle.exchanges[-1].code if prompt_cycle.exchanges else None
+                        if not code:
+                            chat_cycle.stop_reason = (
+                                "deadline" if self._is_past(deadline) else "no_code"
+                            )
+                            break
+
+                        prompt_cycle.blocks = await self._execute(
+                            code, context, self._get_attachment_names(cycles), deadline
+                        )
+                        chat_cycle.execution_time += sum(
+                            block.end_time - block.start_time
+                            for block in prompt_cycle.blocks
+                            if block.start_time is not None and block.end_time is not None
+                        )
 
-        context.update(self._context_provider.get_context())
-        contextualized_request = self._context_strategy.contextualize_message(request, context)
-        chat_cycle = ChatCycle(request=contextualized_request)
-        cycles.append(chat_cycle)
+                        if journal is not None:
+                            for block in prompt_cycle.blocks:
+                                journal.append_execution_block(block)
+
+                        outcome_block = get_outcome_block(prompt_cycle.blocks)
+                        if (
+                            outcome_block is not None
+                            and (outcome_block.response or outcome_block.error)
+                            and not outcome_block.feedback
+                        ):
+                            chat_cycle.stop_reason = (
+                                "response" if outcome_block.response else "error"
+                            )
+                            break
+
+                except BaseException:
+                    # An interrupted cycle says nothing about how long cycles take
+                    cycle_start = None
+                    raise
+
+                finally:
+                    # Cycles cut off by the deadline would understate the cycle time
+                    if cycle_start is not None and not self._is_past(deadline):
+                        self._cycle_times.append(monotonic() - cycle_start)
+
+            chat_cycle.stop_reason = chat_cycle.stop_reason or "max_prompt_cycles"
+            chat_cycle.end_time = time_ns()
+            if journal is not None:
+                journal.update_chat_cycle(chat_cycle)
+
+            response = self._get_response(chat_cycle, context)
+            self._metrics.requests.inc(responded=str(response is not None).lower())
+            self._metrics.cycles_per_request.observe(len(chat_cycle.cycles))
+            span.set_attributes(
+                {
+                    "history_cycles": len(cycles) - 1,
+                    "prompt_cycles": len(chat_cycle.cycles),
+                    "responded": response is not None,
+                    "stop_reason": chat_cycle.stop_reason,
+                }
+            )
+            filtered_context = self._context_strategy.filter_context(context)
 
-        if self._callbacks.on_request:
-            self._callbacks.on_request(chat_cycle.request)
+            if session is not None and self._session_store is not None:
+                if records_cycles:
+                    session.cycles.append(chat_cycle)
+                session.context = filtered_context
+                self._session_store.put(session)
 
-        while len(chat_cycle.cycles) < self._config.max_prompt_cycles:
-            prompt_cycle = PromptCycle()
-            chat_cycle.cycles.append(prompt_cycle)
-            prompt_cycle.exchanges = await self._prompt(cycles)
+            return response, chat_cycle, filtered_context
 
-            if not prompt_cycle.exchanges or not prompt_cycle.exchanges[-1].code:
-                break
+    async def stream(
+        self,
+        request: Message,
+        cycles: Optional[Sequence[ChatCycle]] = None,
+        context: Optional[Dict[str, Any]] = None,
+        session_id: Optional[str] = None,
+        deadline: Optional[float] = None,
+        *,
+        max_buffered_events: int = 256,
+        overflow: OverflowPolicy = "block",
+    ) -> AsyncIterator[StreamEvent]:
+        """
+        Run `generate` and yield its progress as events, ending with a `ResponseEvent`.
+
+        At most `max_buffered_events` events wait for the consumer. Once full,
+        `overflow` decides whether generation waits for the consumer or drops
+        answer deltas and logs; all other events are always delivered.
+        """
+        sink = EventSink(max_buffered_events, overflow)
+
+        async def produce() -> None:
+            set_event_sink(sink)
+            error: Optional[Exception] = None
+            try:
+                response, chat_cycle, filtered_context = await self.generate(
+                    request, cycles, context, session_id, deadline
+                )
+                await sink.put(
+                    ResponseEvent(
+                        response=response, chat_cycle=chat_cycle, context=filtered_context
+                    )
+                )
+            except Exception as e:
+                error = e
+            finally:
+                await sink.close(error)
+
+        task = asyncio.create_task(produce())
+
+        try:
+            async for event in sink:
+                yield event
+        finally:
+            if not task.done():
+                task.cancel()
+                await asyncio.gather(task, return_exceptions=True)
+
+    def create_prompt_artifact(self) -> PromptArtifact:
+        """Render the static prompt sections so other instances can load them instead."""
+        # Fingerprint before the exemplars are contextualized, as a loading instance does
+        fingerprint = self._get_prompt_fingerprint()
+        sections = self._get_prompting_strategy().create_prompt_sections(
+            self._get_exemplars(), self._get_context_provider().get_context()
+        )
+        return PromptArtifact(fingerprint=fingerprint, sections=sections)
 
-            code = prompt_cycle.exchanges[-1].code
-            if not code:
-                break
+    def _get_session(self, session_id: str) -> Session:
+        if self._session_store is None:
+            raise ValueError("A session store is required to generate by session id")
 
-            prompt_cycle.blocks = await self._execute(code, context)
+        return self._session_store.get(session_id) or Session(session_id=session_id)
 
-            executed_blocks = list(filter(lambda block: block.executed, prompt_cycle.blocks))
-            if executed_blocks and (executed_blocks[-1].response or executed_blocks[-1].error) and not executed_blocks[-1].feedback:
-                break
+    def _get_history(self, cycles: Sequence[ChatCycle]) -> List[ChatCycle]:
+        # Slicing a journal only materializes the cycles that end up in the prompt
+        if self._config.max_history_cycles is None:
+            return list(cycles)
 
-        return (
-            self._get_response(chat_cycle, context),
-            chat_cycle,
-            self._context_strategy.filter_context(context),
-        )
+        start = max(len(cycles) - self._config.max_history_cycles, 0)
+        return list(cycles[start:])
 
     async def _prompt(
         self,
         cycles: List[ChatCycle],
+        deadline: Optional[float] = None,
     ) -> List[PromptExchange]:
-        context = self._context_provider.get_context()
+        context = self._get_context_provider().get_context()
         exchanges: List[PromptExchange] = []
 
-        while len(exchanges) < self._config.max_llm_exchanges:
-            prompt = (
-                self._prompting_strategy.get_refine_prompt()
-                if exchanges
-                else self._prompting_strategy.create_prompt(cycles, self._exemplars, context)
-            )
-            exchange = PromptExchange(prompt=prompt)
-            exchanges.append(exchange)
+        while len(exchanges) < self._config.max_llm_exchanges and not self._is_past(deadline):
+            with self._tracer.start_span("exchange", index=len(exchanges)) as exchange_span:
+                with self._tracer.start_span("create_prompt", refine=bool(exchanges)):
+                    prompt = (
+                        self._get_prompting_strategy().get_refine_prompt()
+                        if exchanges
+                        else self._get_prompting_strategy().create_prompt(
+                            cycles,
+                            # Loaded sections already hold the rendered exemplars
+                            [] if self._prompt_sections_loaded else self._get_exemplars(),
+                            context,
+                        )
+                    )
+                exchange = PromptExchange(prompt=prompt)
+                exchanges.append(exchange)
+                exchange_span.set_attribute("prompt_chars", len(prompt.text))
+                prompt_kind = "refine" if len(exchanges) > 1 else "initial"
+                self._metrics.prompts.inc(kind=prompt_kind)
+                self._metrics.prompt_chars.observe(len(prompt.text), kind=prompt_kind)
+
+                if self._callbacks.on_prompt:
+                    self._callbacks.on_prompt(prompt)
+                await self._emit(PromptEvent(prompt=prompt, refine=len(exchanges) > 1))
+
+                model = self._get_model_name()
+                start = perf_counter()
+
+                try:
+                    history: List[Tuple[Message, Message]] = [
+                        (e.prompt, e.answer) for e in exchanges[:-1] if e.answer
+                    ]
+                    with self._tracer.start_span(
+                        "llm_call",
+                        model=model,
+                        prompt_chars=len(prompt.text),
+                        history_exchanges=len(history),
+                    ) as llm_span:
+                        answer = await asyncio.wait_for(
+                            (
+                                self._race_candidates(exchange, history)
+                                if self._config.num_candidates > 1
+                                else self._generate_answer(exchange.prompt, history)
+                            ),
+                            self._get_remaining(deadline),
+                        )
+                        llm_span.set_attribute("answer_chars", len(answer.text))
+                    self._metrics.llm_latency.observe(perf_counter() - start, model=model)
+                    exchange.answer = answer
 
-            if self._callbacks.on_prompt:
-                self._callbacks.on_prompt(prompt)
+                    if self._callbacks.on_answer:
+                        self._callbacks.on_answer(answer)
 
-            try:
-                history: List[Tuple[Message, Message]] = [
-                    (e.prompt, e.answer) for e in exchanges[:-1] if e.answer
-                ]
-                answer = await self._llm.generate(exchange.prompt, history)
-                exchange.answer = answer
+                except Exception as e:
+                    error = (
+                        PromptError(
+                            message="LLM call exceeded the generate deadline", stack_trace=""
+                        )
+                        if isinstance(e, asyncio.TimeoutError)
+                        else PromptError.from_exception(e)
+                    )
+                    error.llm = self._get_llm().get_info()
+                    exchange.error = error
+                    exchange_span.set_attribute("error", error.message)
+                    self._metrics.llm_latency.observe(perf_counter() - start, model=model)
+                    self._metrics.llm_errors.inc(model=model)
+                    break
+
+                code = self._get_prompting_strategy().extract_code(answer.text)
+                exchange.code = code
+                exchange_span.set_attribute("extracted_code", code is not None)
+
+                if code:
+                    if self._callbacks.on_extract:
+                        self._callbacks.on_extract(code)
+                    await self._emit(CodeExtractedEvent(code=code))
+                    break
 
-                if self._callbacks.on_answer:
-                    self._callbacks.on_answer(answer)
+        return exchanges
 
-            except Exception as e:
-                error = PromptError.from_exception(e)
-                error.llm = self._llm.get_info()
-                exchange.error = error
-                break
+    async def _generate_answer(
+        self, prompt: Message, history: List[Tuple[Message, Message]]
+    ) -> Message:
+        if get_event_sink() is None:
+            return await self._get_llm().generate(prompt, history)
+
+        deltas: List[str] = []
+        async for delta in self._get_llm().generate_stream(prompt, history):
+            deltas.append(delta)
+            await self._emit(AnswerDeltaEvent(text=delta))
+
+        return Message(text="".join(deltas))
+
+    async def _race_candidates(
+        self, exchange: PromptExchange, history: List[Tuple[Message, Message]]
+    ) -> Message:
+        exchange.candidates = self._config.num_candidates
+        start = time_ns()
+        fallback: Optional[Message] = None
+        candidates = self._get_llm().generate_candidates(
+            exchange.prompt, history, self._config.num_candidates
+        )
 
-            code = self._prompting_strategy.extract_code(answer.text)
-            exchange.code = code
+        try:
+            index = 0
+            async for answer in candidates:
+                code = self._get_prompting_strategy().extract_code(answer.text)
+                if code and self._passes_static_checks(code):
+                    exchange.chosen_candidate = index
+                    break
 
-            if code:
-                if self._callbacks.on_extract:
-                    self._callbacks.on_extract(code)
-                break
+                fallback = fallback or answer
+                index += 1
+            else:
+                # No candidate is usable, keep the first so the refine prompt can address it
+                if fallback is None:
+                    raise ValueError("The LLM returned no candidate answers")
 
-        return exchanges
+                answer = fallback
+                exchange.chosen_candidate = 0
+
+        finally:
+            await candidates.aclose()
+
+        exchange.race_time = time_ns() - start
+        await self._emit(AnswerDeltaEvent(text=answer.text))
+        return answer
+
+    def _passes_static_checks(self, code: str) -> bool:
+        try:
+            for block in self._get_execution_strategy().parse(code):
+                compile(block, "<candidate>", "exec", flags=ast.PyCF_ALLOW_TOP_LEVEL_AWAIT)
+        except (SyntaxError, ValueError):
+            return False
+
+        return True
+
+    async def _execute(
+        self,
+        code: str,
+        context: Dict[str, Any],
+        attachment_names: Collection[str] = (),
+        deadline: Optional[float] = None,
+    ) -> List[ExecutionBlock]:
+        with self._tracer.start_span("process_blocks") as span:
+            generated_code_blocks = self._get_execution_strategy().parse(code)
+            processed_code_blocks = [
+                self._get_execution_strategy().process(block, context)
+                for block in generated_code_blocks
+            ]
+            span.set_attribute("blocks", len(generated_code_blocks))
+
+        cycle_deadline = (
+            monotonic() + self._config.cycle_timeout
+            if self._config.cycle_timeout is not None
+            else None
+        )
 
-    async def _execute(self, code: str, context: Dict[str, Any]) -> List[ExecutionBlock]:
-        generated_code_blocks = self._execution_strategy.parse(code)
-        processed_code_blocks = [
-            self._execution_strategy.process(block, context) for block in generated_code_blocks
-        ]
         blocks = [
             ExecutionBlock(generated_code=generated_code, processed_code=processed_code)
             for generated_code, processed_code in zip(generated_code_blocks, processed_code_blocks)
         ]
 
-        for block in blocks:
+        for group in self._group_blocks(processed_code_blocks):
+            timeout, scope = self._get_block_timeout(cycle_deadline, deadline)
+
+            if len(group) == 1:
+                namespaces = [context]
+                results = [
+                    await self._execute_block(
+                        blocks, group[0], context, timeout, scope, attachment_names
+                    )
+                ]
+            else:
+                # Each block gets its own namespace, merged back in block order below
+                namespaces = [TrackingNamespace(context) for _ in group]
+                results = await self._execute_group(
+                    blocks, group, namespaces, timeout, scope, attachment_names
+                )
+
+            for index, namespace, (feedback, response) in zip(group, namespaces, results):
+                if isinstance(namespace, TrackingNamespace):
+                    namespace.apply_changes(context)
+
+                await self._complete_block(index, blocks[index], feedback, response, context)
+
+            if any(
+                blocks[index].feedback or blocks[index].response or blocks[index].error
+                for index in group
+            ):
+                break
+
+        executed_blocks = list(filter(lambda block: block.executed, blocks))
+        outcome_block = get_outcome_block(blocks)
+        if outcome_block is not None and not (
+            outcome_block.feedback or outcome_block.response or outcome_block.error
+        ):
+            outcome_block.feedback = Feedback(
+                type="incomplete_cycle",
+                severity="info",
+            )
+
+        for block in executed_blocks:
+            if block.feedback:
+                self._metrics.feedbacks.inc(type=block.feedback.type)
+
+        return blocks
+
+    async def _execute_group(
+        self,
+        blocks: List[ExecutionBlock],
+        group: List[int],
+        namespaces: List[TrackingNamespace],
+        timeout: Optional[float],
+        scope: Optional[str],
+        attachment_names: Collection[str] = (),
+    ) -> List[Tuple[Optional[Feedback], Optional[Message]]]:
+        tasks = [
+            asyncio.create_task(
+                self._execute_block(blocks, index, namespace, timeout, scope, attachment_names)
+            )
+            for index, namespace in zip(group, namespaces)
+        ]
+
+        try:
+            pending = set(tasks)
+            while pending:
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+
+                for task in done:
+                    if task.cancelled():
+                        continue
+
+                    feedback, response = task.result()
+                    position = tasks.index(task)
+                    if not (feedback or response or blocks[group[position]].error):
+                        continue
+
+                    # A sequential run would not reach the blocks after one that stops the cycle
+                    for later_task in tasks[position + 1 :]:
+                        later_task.cancel()
+
+        finally:
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+
+        results: List[Tuple[Optional[Feedback], Optional[Message]]] = []
+        for index, task in zip(group, tasks):
+            if task.cancelled():
+                self._cancel_block(blocks[index])
+                results.append((None, None))
+            else:
+                results.append(task.result())
+
+        return results
+
+    def _cancel_block(self, block: ExecutionBlock) -> None:
+        # The block may have run up to its cancellation, so it is reported rather than discarded
+        block.end_time = time_ns()
+        block.executed = True
+        block.error = ExecutionError(
+            message=(
+                "Execution was cancelled because an earlier block stopped the cycle, "
+                "the block may have partially run"
+            ),
+            stack_trace="",
+        )
+
+    def _group_blocks(self, processed_code_blocks: List[str]) -> List[List[int]]:
+        if self._config.concurrent_execution and (
+            self._get_execution_strategy().supports_concurrent_execution
+        ):
+            return group_independent_blocks(processed_code_blocks)
+
+        return [[index] for index in range(len(processed_code_blocks))]
+
+    async def _execute_block(
+        self,
+        blocks: List[ExecutionBlock],
+        index: int,
+        context: Dict[str, Any],
+        timeout: Optional[float],
+        scope: Optional[str],
+        attachment_names: Collection[str] = (),
+    ) -> Tuple[Optional[Feedback], Optional[Message]]:
+        block = blocks[index]
+
+        with self._tracer.start_span(
+            "execute_block", index=index, code_chars=len(block.processed_code)
+        ) as span:
             block.start_time = time_ns()
             if self._callbacks.on_execute:
                 self._callbacks.on_execute(block)
+            await self._emit(BlockStartedEvent(index=index, code=block.processed_code))
 
             def on_log(log: str) -> None:
                 block.logs.append(log)
                 if self._callbacks.on_execute:
                     self._callbacks.on_execute(block)
+                sink = get_event_sink()
+                if sink is not None:
+                    sink.put_nowait(LogEvent(index=index, line=log))
 
-            error, feedback, response, logs = await self._execution_strategy.execute(
-                block.processed_code,
-                context,
-                on_log=on_log,
-            )
+            def on_profile(profile: ExecutionProfile) -> None:
+                block.profile = profile
+
+            try:
+                error, feedback, response, logs = await asyncio.wait_for(
+                    self._get_execution_strategy().execute(
+                        block.processed_code,
+                        context,
+                        on_log=on_log,
+                        on_profile=on_profile,
+                        attachment_names=attachment_names,
+                    ),
+                    timeout,
+                )
+            except asyncio.TimeoutError:
+                error, feedback, response = self._create_timeout_result(scope)
+                logs = list(block.logs)
+                span.set_attribute("timeout", scope)
             block.end_time = time_ns()
             block.executed = True
             block.error = error
-            if feedback:
-                # contextualize_message mutates in place and returns the same object
-                # so the type is preserved (Feedback -> Feedback)
-                contextualized_feedback = self._context_strategy.contextualize_message(
-                    feedback, context
-                )
-                block.feedback = cast(Feedback, contextualized_feedback)
-            else:
-                block.feedback = None
-            if response:
-                block.response = self._context_strategy.contextualize_message(response, context)
-            else:
-                block.response = None
             block.logs = logs
 
-            if self._callbacks.on_execute:
-                self._callbacks.on_execute(block)
+            span.set_attributes(
+                {
+                    "feedback_type": feedback.type if feedback else None,
+                    "responded": response is not None,
+                    "error": error.message if error else None,
+                    "logs": len(logs),
+                }
+            )
+            self._metrics.block_execution_time.observe((block.end_time - block.start_time) / 1e9)
+            if error:
+                self._metrics.execution_errors.inc()
 
-            if feedback or response or error:
-                break
+        return feedback, response
 
-        executed_blocks = list(filter(lambda block: block.executed, blocks))
-        last_executed_block = executed_blocks[-1]
-        if not (
-            last_executed_block.feedback
-            or last_executed_block.response
-            or last_executed_block.error
-        ):
-            last_executed_block.feedback = Feedback(
-                type="incomplete_cycle",
-                severity="info",
+    async def _complete_block(
+        self,
+        index: int,
+        block: ExecutionBlock,
+        feedback: Optional[Feedback],
+        response: Optional[Message],
+        context: Dict[str, Any],
+    ) -> None:
+        if feedback:
+            # contextualize_message mutates in place and returns the same object
+            # so the type is preserved (Feedback -> Feedback)
+            contextualized_feedback = self._context_strategy.contextualize_message(
+                feedback, context
             )
+            block.feedback = cast(Feedback, contextualized_feedback)
+        else:
+            block.feedback = None
+        if response:
+            block.response = self._context_strategy.contextualize_message(response, context)
+        else:
+            block.response = None
+
+        if self._callbacks.on_execute:
+            self._callbacks.on_execute(block)
+        await self._emit(BlockFinishedEvent(index=index, block=block.model_copy()))
+
+    async def _emit(self, event: StreamEvent) -> None:
+        sink = get_event_sink()
+        if sink is not None:
+            await sink.put(event)
+
+    def _get_attachment_names(self, cycles: List[ChatCycle]) -> Set[str]:
+        # Contextualized attachments are paths into the context, only their root names matter
+        paths = [path for cycle in cycles for path in cycle.request.attachments]
+        paths.extend(
+            path
+            for cycle in cycles
+            for prompt_cycle in cycle.cycles
+            for block in prompt_cycle.blocks
+            if block.response
+            for path in block.response.attachments
+        )
+        return {re.split(r"[.\[]", path, maxsplit=1)[0] for path in paths if isinstance(path, str)}
 
-        return blocks
+    def _get_llm(self) -> Llm:
+        if self._llm is None:
+            from chat2edit.prompting.llms import GoogleLlm
+
+            self._llm = GoogleLlm("gemini-2.5-flash")
+
+        return self._llm
+
+    def _get_context_provider(self) -> ContextProvider:
+        if self._context_provider is None:
+            from chat2edit.context.providers import CalculatorContextProvider
+
+            self._context_provider = CalculatorContextProvider()
+
+        return self._context_provider
+
+    def _get_prompting_strategy(self) -> PromptingStrategy:
+        if self._prompting_strategy is None:
+            from chat2edit.prompting.strategies import OtcPromptingStrategy
+
+            self._prompting_strategy = OtcPromptingStrategy()
+
+        return self._prompting_strategy
+
+    def _get_execution_strategy(self) -> ExecutionStrategy:
+        if self._execution_strategy is None:
+            from chat2edit.execution.strategies import DefaultExecutionStrategy
+
+            self._execution_strategy = DefaultExecutionStrategy()
+
+        return self._execution_strategy
+
+    def _get_exemplars(self) -> List[Exemplar]:
+        if self._exemplars is None:
+            self._exemplars = [
+                self._contextualize_exemplar(exemplar)
+                for exemplar in self._get_context_provider().get_exemplars()
+            ]
+
+        return self._exemplars
+
+    def _get_prompt_fingerprint(self) -> str:
+        return fingerprint_prompt_inputs(
+            self._get_context_provider().get_context(),
+            self._get_context_provider().get_exemplars(),
+            [self._get_context_provider(), self._context_strategy, self._get_prompting_strategy()],
+        )
+
+    def _load_prompt_artifact(self, path: str) -> None:
+        with self._tracer.start_span("load_prompt_artifact") as span:
+            artifact = PromptArtifact.load(path)
+            self._prompt_sections_loaded = (
+                artifact is not None
+                and artifact.fingerprint == self._get_prompt_fingerprint()
+                and self._get_prompting_strategy().load_prompt_sections(artifact.sections)
+            )
+            span.set_attribute("loaded", self._prompt_sections_loaded)
+
+    def _get_block_timeout(
+        self, cycle_deadline: Optional[float], deadline: Optional[float] = None
+    ) -> Tuple[Optional[float], Optional[str]]:
+        timeout, scope = self._config.block_timeout, "block"
+
+        for limit_deadline, limit_scope in ((cycle_deadline, "cycle"), (deadline, "deadline")):
+            remaining = self._get_remaining(limit_deadline)
+            if remaining is not None and (timeout is None or remaining < timeout):
+                timeout, scope = remaining, limit_scope
+
+        return timeout, scope if timeout is not None else None
+
+    def _get_remaining(self, deadline: Optional[float]) -> Optional[float]:
+        return max(deadline - monotonic(), 0.0) if deadline is not None else None
+
+    def _is_past(self, deadline: Optional[float]) -> bool:
+        return deadline is not None and monotonic() >= deadline
+
+    def _check_budget(self, deadline: Optional[float]) -> Optional[str]:
+        remaining = self._get_remaining(deadline)
+        if remaining is None:
+            return None
+
+        if remaining <= 0:
+            return "deadline"
+
+        if (
+            self._config.skip_unaffordable_cycles
+            and self._cycle_times
+            and remaining < median(self._cycle_times)
+        ):
+            return "insufficient_budget"
+
+        return None
+
+    def _create_timeout_result(self, scope: Optional[str]) -> Tuple[ExecutionError, Feedback, None]:
+        # Signals raised before cancellation must not leak into the next block
+        pop_feedback()
+        pop_response()
+
+        if scope == "deadline":
+            limit = None
+            message = "Execution exceeded the generate deadline"
+        else:
+            limit = self._config.block_timeout if scope == "block" else self._config.cycle_timeout
+            message = f"Execution exceeded the {scope} time limit of {limit:g} seconds"
+
+        error = ExecutionError(message=message, stack_trace="")
+        feedback = Feedback(
+            type="execution_timeout",
+            severity="error",
+            details={"scope": scope, "timeout": limit},
+        )
+        return error, feedback, None
+
+    def _get_model_name(self) -> Optional[str]:
+        return self._get_llm().get_info().get("model")
 
     def _get_response(self, chat_cycle: ChatCycle, context: Dict[str, Any]) -> Optional[Message]:
         if not chat_cycle.cycles:
@@ -215,18 +849,14 @@ class Chat2Edit:
         if not last_prompt_cycle.blocks:
             return None
 
-        executed_blocks = list(filter(lambda block: block.executed, last_prompt_cycle.blocks))
-        if not executed_blocks:
-            return None
-
-        last_executed_block = executed_blocks[-1]
-        if not last_executed_block.response:
+        outcome_block = get_outcome_block(last_prompt_cycle.blocks)
+        if outcome_block is None or not outcome_block.response:
             return None
 
-        return self._context_strategy.decontextualize_message(last_executed_block.response, context)
+        return self._context_strategy.decontextualize_message(outcome_block.response, context)
 
     def _contextualize_exemplar(self, exemplar: Exemplar) -> Exemplar:
-        context = self._context_provider.get_context()
+        context = self._get_context_provider().get_context()
 
         for chat_cycle in exemplar.cycles:
             if not chat_cycle.request.contextualized:
@@ -0,0 +1,13 @@
+from chat2edit.context.attachments.attachment_handle import AttachmentHandle
+from chat2edit.context.attachments.attachment_store import AttachmentStore
+from chat2edit.context.attachments.utils import (
+    resolve_attachment_handles,
+    store_resolved_attachments,
+)
+
+__all__ = [
+    "AttachmentHandle",
+    "AttachmentStore",
+    "resolve_attachment_handles",
+    "store_resolved_attachments",
+]
@@ -0,0 +1,26 @@
+from dataclasses import dataclass
+from typing import Any, Literal
+
+
+@dataclass(frozen=True)
+class AttachmentHandle:
+    """Lightweight reference to an attachment payload held by an `AttachmentStore`."""
+
+    digest: str
+    size: int
+    kind: Literal["bytes", "pickle"]
+    type_name: str
+    root: str
+
+    def resolve(self) -> Any:
+        from chat2edit.context.attachments.attachment_store import AttachmentStore
+
+        return AttachmentStore.from_root(self.root).resolve(self)
+
+    def load(self) -> Any:
+        from chat2edit.context.attachments.attachment_store import AttachmentStore
+
+        return AttachmentStore.from_root(self.root).load(self)
+
+    def __repr__(self) -> str:
+        return f"AttachmentHandle({self.type_name}, {self.digest[:12]}, {self.size} bytes)"
@@ -0,0 +1,130 @@
+import hashlib
+import mmap
+import os
+import pickle
+import threading
+from pathlib import Path
+from typing import Any, ClassVar, Dict, Union
+
+from chat2edit.context.attachments.attachment_handle import AttachmentHandle
+
+BYTES_LIKE_TYPES = (bytes, bytearray, memoryview)
+# Byte payload types restored by `load`, memoryviews are returned as views of the mapping
+BYTES_TYPES = {"bytes": bytes, "bytearray": bytearray}
+
+
+class AttachmentStore:
+    """
+    Content-addressed store for large attachment payloads.
+
+    Payloads are written once per digest under `root`, so identical attachments
+    are shared by every session that uses the same root. Byte payloads are
+    resolved to read-only `memoryview`s over a memory map without copying;
+    other objects are pickled and unpickled straight from the mapping.
+    """
+
+    _stores: ClassVar[Dict[str, "AttachmentStore"]] = {}
+    _stores_lock: ClassVar[threading.Lock] = threading.Lock()
+
+    def __init__(self, root: Union[str, os.PathLike], min_size: int = 64 * 1024) -> None:
+        self._root = Path(root).resolve()
+        self._root.mkdir(parents=True, exist_ok=True)
+        self._min_size = min_size
+        self._maps: Dict[str, mmap.mmap] = {}
+        self._lock = threading.Lock()
+
+        with AttachmentStore._stores_lock:
+            AttachmentStore._stores.setdefault(str(self._root), self)
+
+    @classmethod
+    def from_root(cls, root: str) -> "AttachmentStore":
+        with cls._stores_lock:
+            store = cls._stores.get(root)
+
+        return store if store is not None else cls(root)
+
+    @property
+    def root(self) -> Path:
+        return self._root
+
+    def put(self, value: Any) -> Any:
+        """Store a value and return its handle, or the value itself if it is too small."""
+        if isinstance(value, AttachmentHandle):
+            return value
+
+        if isinstance(value, BYTES_LIKE_TYPES):
+            kind = "bytes"
+            data = memoryview(value).cast("B")
+        else:
+            kind = "pickle"
+            try:
+                data = memoryview(pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL))
+            except Exception:
+                return value
+
+        if data.nbytes < self._min_size:
+            return value
+
+        digest = hashlib.sha256(data).hexdigest()
+        path = self._get_path(digest)
+
+        if not path.exists():
+            path.parent.mkdir(parents=True, exist_ok=True)
+            temp_path = path.with_name(f"{path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+            with open(temp_path, "wb") as f:
+                f.write(data)
+            # Concurrent writers produce identical content, so the last rename wins harmlessly
+            os.replace(temp_path, path)
+
+        return AttachmentHandle(
+            digest=digest,
+            size=data.nbytes,
+            kind=kind,
+            type_name=type(value).__name__,
+            root=str(self._root),
+        )
+
+    def open(self, handle: AttachmentHandle) -> memoryview:
+        """Return a read-only view of the stored payload backed by a memory map."""
+        with self._lock:
+            mapping = self._maps.get(handle.digest)
+
+            if mapping is None:
+                with open(self._get_path(handle.digest), "rb") as f:
+                    mapping = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+                self._maps[handle.digest] = mapping
+
+        return memoryview(mapping)
+
+    def resolve(self, handle: AttachmentHandle) -> Any:
+        view = self.open(handle)
+
+        if handle.kind == "bytes":
+            return view
+
+        with view:
+            return pickle.loads(view)
+
+    def load(self, handle: AttachmentHandle) -> Any:
+        """Resolve a payload to its original type, copying byte payloads out of the mapping."""
+        value = self.resolve(handle)
+
+        if handle.kind == "bytes" and handle.type_name in BYTES_TYPES:
+            with value:
+                return BYTES_TYPES[handle.type_name](value)
+
+        return value
+
+    def close(self) -> None:
+        with self._lock:
+            for digest, mapping in list(self._maps.items()):
+                try:
+                    mapping.close()
+                except BufferError:
+                    # Still referenced by a resolved memoryview, keep it mapped
+                    continue
+
+                del self._maps[digest]
+
+    def _get_path(self, digest: str) -> Path:
+        return self._root / digest[:2] / digest[2:]
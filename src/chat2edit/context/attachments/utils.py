@@ -0,0 +1,60 @@
+import ast
+from typing import Any, Dict, Mapping, Set, Tuple
+
+from chat2edit.context.attachments.attachment_handle import AttachmentHandle
+from chat2edit.context.attachments.attachment_store import AttachmentStore
+
+
+def get_referenced_names(code: str) -> Set[str]:
+    try:
+        tree = ast.parse(code)
+    except SyntaxError:
+        return set()
+
+    return {node.id for node in ast.walk(tree) if isinstance(node, ast.Name)}
+
+
+def resolve_attachment_handles(
+    code: str, namespace: Dict[str, Any]
+) -> Dict[str, Tuple[AttachmentHandle, Any]]:
+    """
+    Replace handles referenced by the code with their payloads, leaving the rest lazy.
+
+    Returns the resolved names with their handles and payloads, to be passed
+    to `store_resolved_attachments` once the code has run.
+    """
+    resolved = {}
+
+    for name in get_referenced_names(code):
+        value = namespace.get(name)
+        if isinstance(value, AttachmentHandle):
+            namespace[name] = resolved_value = value.resolve()
+            resolved[name] = (value, resolved_value)
+
+    return resolved
+
+
+def store_resolved_attachments(
+    resolved: Mapping[str, Tuple[AttachmentHandle, Any]],
+    namespace: Mapping[str, Any],
+    context: Dict[str, Any],
+) -> None:
+    """
+    Write payloads the code mutated in place back to their store.
+
+    The context keeps holding handles, so without this a change made to a
+    resolved object would be dropped with the namespace. A changed payload is
+    stored under its new digest and the context entry is pointed at it, names
+    the code rebound or deleted are left to the namespace merge.
+    """
+    for name, (handle, value) in resolved.items():
+        # Byte payloads resolve to read-only views and cannot change
+        if handle.kind == "bytes":
+            continue
+
+        if context.get(name) is not handle or namespace.get(name) is not value:
+            continue
+
+        stored = AttachmentStore.from_root(handle.root).put(value)
+        if stored != handle:
+            context[name] = stored
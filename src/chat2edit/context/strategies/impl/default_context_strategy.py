@@ -1,21 +1,29 @@
-from typing import Any, Dict, List
+from typing import Any, Dict, List, Optional
 
+from chat2edit.context.attachments import AttachmentHandle, AttachmentStore
 from chat2edit.context.strategies.context_strategy import ContextStrategy
 from chat2edit.context.utils import assign_context_values, path_to_value
+from chat2edit.context.utils.assign_context_values import get_basename
 from chat2edit.models import Message
+from chat2edit.utils import to_snake_case
 
 
 class DefaultContextStrategy(ContextStrategy):
+    def __init__(self, attachment_store: Optional[AttachmentStore] = None) -> None:
+        self._attachment_store = attachment_store
+
     def filter_context(self, context: Dict[str, Any]) -> Dict[str, Any]:
         return context
 
     def contextualize_message(self, message: Message, context: Dict[str, Any]) -> Message:
         contextualized_attachments = self.contextualize_message_attachments(message.attachments, context)
-        return Message(
-            timestamp=message.timestamp,
-            text=self.contextualize_message_text(message.text, context),
-            attachments=contextualized_attachments,
-            contextualized=True,
+        # Copy rather than rebuild so subclasses such as Feedback keep their type and fields
+        return message.model_copy(
+            update={
+                "text": self.contextualize_message_text(message.text, context),
+                "attachments": contextualized_attachments,
+                "contextualized": True,
+            }
         )
 
     def decontextualize_message(self, message: Message, context: Dict[str, Any]) -> Message:
@@ -34,9 +42,18 @@ class DefaultContextStrategy(ContextStrategy):
     def contextualize_message_attachments(
         self, attachments: List[Any], context: Dict[str, Any]
     ) -> List[str]:
-        return assign_context_values(attachments, context)
+        if self._attachment_store:
+            attachments = [self._attachment_store.put(a) for a in attachments]
+
+        return assign_context_values(attachments, context, self.get_attachment_varname_prefix)
 
     def decontextualize_message_attachments(
         self, attachments: List[str], context: Dict[str, Any]
     ) -> List[Any]:
         return [path_to_value(path, context) for path in attachments]
+
+    def get_attachment_varname_prefix(self, attachment: Any) -> str:
+        if isinstance(attachment, AttachmentHandle):
+            return to_snake_case(attachment.type_name).split("_").pop()
+
+        return get_basename(attachment)
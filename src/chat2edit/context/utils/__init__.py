@@ -1,6 +1,17 @@
 from chat2edit.context.utils.assign_context_values import assign_context_values
+from chat2edit.context.utils.fingerprint import fingerprint_attachment, fingerprint_value
 from chat2edit.context.utils.path_to_value import path_to_value
 from chat2edit.context.utils.safe_deepcopy import safe_deepcopy
+from chat2edit.context.utils.safe_pickle import safe_pickle, safe_unpickle
 from chat2edit.context.utils.value_to_path import value_to_path
 
-__all__ = ["assign_context_values", "path_to_value", "safe_deepcopy", "value_to_path"]
+__all__ = [
+    "assign_context_values",
+    "fingerprint_attachment",
+    "fingerprint_value",
+    "path_to_value",
+    "safe_deepcopy",
+    "safe_pickle",
+    "safe_unpickle",
+    "value_to_path",
+]
@@ -0,0 +1,111 @@
+import hashlib
+import pickle
+from typing import Any, Optional
+
+from pydantic import BaseModel
+
+from chat2edit.context.attachments import AttachmentHandle
+
+BYTES_LIKE_TYPES = (bytes, bytearray, memoryview)
+SCALAR_TYPES = (type(None), bool, int, float, complex, str)
+
+ATTACHMENT_SAMPLES = 64
+ATTACHMENT_SAMPLE_SIZE = 1024
+
+
+def fingerprint_value(value: Any) -> str:
+    """
+    Return a content digest of a value, equal for values with equal content.
+
+    Attachment handles are identified by the digest of their payload, so a
+    handle and a later handle to the same payload share a fingerprint without
+    reading it. Raises `TypeError` for values that can be neither traversed
+    nor pickled.
+    """
+    hasher = hashlib.sha256()
+    _update_fingerprint(hasher, value)
+    return hasher.hexdigest()
+
+
+def _update_fingerprint(hasher: Any, value: Any) -> None:
+    if isinstance(value, AttachmentHandle):
+        hasher.update(b"h" + value.digest.encode())
+    elif isinstance(value, SCALAR_TYPES):
+        hasher.update(f"s{type(value).__name__}:{value!r};".encode())
+    elif isinstance(value, BYTES_LIKE_TYPES):
+        data = memoryview(value).cast("B")
+        hasher.update(f"b{data.nbytes};".encode())
+        hasher.update(data)
+    elif isinstance(value, (list, tuple)):
+        hasher.update(f"l{type(value).__name__}:{len(value)};".encode())
+        for item in value:
+            _update_fingerprint(hasher, item)
+    elif isinstance(value, dict):
+        # Items are ordered by their own fingerprints, so insertion order does not matter
+        items = sorted(fingerprint_value(key) + fingerprint_value(v) for key, v in value.items())
+        hasher.update(f"d{len(items)};{''.join(items)}".encode())
+    elif isinstance(value, (set, frozenset)):
+        items = sorted(fingerprint_value(item) for item in value)
+        hasher.update(f"f{len(items)};{''.join(items)}".encode())
+    elif isinstance(value, BaseModel):
+        hasher.update(f"m{type(value).__qualname__}:".encode())
+        _update_fingerprint(hasher, dict(value))
+    else:
+        try:
+            data = pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL)
+        except Exception as e:
+            raise TypeError(f"Cannot fingerprint value of type {type(value).__name__}") from e
+
+        hasher.update(f"p{type(value).__module__}.{type(value).__qualname__}:".encode())
+        hasher.update(data)
+
+
+def fingerprint_attachment(value: Any) -> Optional[str]:
+    """
+    Return a cheap fingerprint of an attachment for detecting in-place changes.
+
+    Only the size and a fixed set of sampled windows of the value's buffer are
+    hashed, so edits falling entirely between samples go unnoticed. Returns
+    None for values exposing no buffer, which are then not watched, since
+    serializing them would cost as much as the block itself.
+    """
+    if isinstance(value, AttachmentHandle):
+        return value.digest
+
+    data = get_attachment_buffer(value)
+    if data is None:
+        return None
+
+    hasher = hashlib.blake2b(f"{type(value).__qualname__}:{data.nbytes};".encode(), digest_size=16)
+
+    if data.nbytes <= 2 * ATTACHMENT_SAMPLES * ATTACHMENT_SAMPLE_SIZE:
+        hasher.update(data)
+        return hasher.hexdigest()
+
+    stride = (data.nbytes - ATTACHMENT_SAMPLE_SIZE) // (ATTACHMENT_SAMPLES - 1)
+    for i in range(ATTACHMENT_SAMPLES):
+        start = i * stride
+        hasher.update(data[start : start + ATTACHMENT_SAMPLE_SIZE])
+
+    return hasher.hexdigest()
+
+
+def get_attachment_buffer(value: Any) -> Optional[memoryview]:
+    try:
+        return memoryview(value).cast("B")
+    except TypeError:
+        pass
+
+    # Array-like values such as images expose their raw data without serializing the object
+    try:
+        interface = getattr(value, "__array_interface__", None)
+        if isinstance(interface, dict) and isinstance(interface.get("data"), BYTES_LIKE_TYPES):
+            return memoryview(interface["data"]).cast("B")
+
+        tobytes = getattr(value, "tobytes", None)
+        if callable(tobytes):
+            return memoryview(tobytes()).cast("B")
+    except Exception:
+        return None
+
+    return None
@@ -1,5 +1,7 @@
 from typing import Any
 
+from chat2edit.context.attachments import AttachmentHandle
+
 
 def path_to_value(path: str, root: Any) -> Any:
     current = root
@@ -10,7 +12,7 @@ def path_to_value(path: str, root: Any) -> Any:
             key, indices = part.split("[", 1)
             indices = indices.rstrip("]")
             if key:
-                current = current[key]
+                current = resolve_handle(current[key])
             current = current[int(indices)]
         else:
             if isinstance(current, dict):
@@ -20,4 +22,11 @@ def path_to_value(path: str, root: Any) -> Any:
             else:
                 raise ValueError(f"Invalid path: {part} in {path}")
 
+        current = resolve_handle(current)
+
     return current
+
+
+def resolve_handle(value: Any) -> Any:
+    # Values leave the context here, so they are returned as the type that was attached
+    return value.load() if isinstance(value, AttachmentHandle) else value
@@ -0,0 +1,26 @@
+import pickle
+from typing import Any, Dict
+
+
+def safe_pickle(context: Dict[str, Any]) -> Dict[str, bytes]:
+    pickled_context = {}
+
+    for k, v in context.items():
+        try:
+            pickled_context[k] = pickle.dumps(v)
+        except:  # noqa: E722
+            continue
+
+    return pickled_context
+
+
+def safe_unpickle(pickled_context: Dict[str, bytes]) -> Dict[str, Any]:
+    context = {}
+
+    for k, v in pickled_context.items():
+        try:
+            context[k] = pickle.loads(v)
+        except:  # noqa: E722
+            continue
+
+    return context
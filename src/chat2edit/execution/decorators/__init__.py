@@ -1,3 +1,4 @@
+from chat2edit.execution.decorators.cached_tool import cached_tool
 from chat2edit.execution.decorators.deepcopy_parameter import deepcopy_parameter
 from chat2edit.execution.decorators.feedback_empty_list_parameters import (
     feedback_empty_list_parameters,
@@ -20,6 +21,7 @@ from chat2edit.execution.decorators.feedback_unexpected_error import (
 from chat2edit.execution.decorators.respond import respond
 
 __all__ = [
+    "cached_tool",
     "feedback_empty_list_parameters",
     "feedback_invalid_parameter_type",
     "feedback_ignored_return_value",
@@ -0,0 +1,113 @@
+import hashlib
+import inspect
+import os
+from copy import deepcopy
+from functools import wraps
+from typing import Any, Callable, Optional, Tuple, Union
+
+from chat2edit.context.utils import fingerprint_value
+from chat2edit.execution.utils import ToolCache
+from chat2edit.prompting.stubbing.decorators import exclude_this_decorator_factory
+from chat2edit.utils import hash_source_file
+
+
+@exclude_this_decorator_factory
+def cached_tool(
+    max_size: int = 128,
+    spill_dir: Optional[Union[str, os.PathLike]] = None,
+    max_spill_bytes: Optional[int] = None,
+) -> Callable:
+    """
+    Memoize a pure tool by the content of its arguments.
+
+    Results are copied in and out of the cache, so blocks mutating a returned
+    value do not affect later hits. Calls with arguments that cannot be
+    fingerprinted, and calls that raise, are not cached. The wrapper exposes
+    `cache_info()` and `cache_clear()` like `functools.lru_cache`.
+    """
+
+    def decorator(func: Callable) -> Callable:
+        signature = inspect.signature(func)
+        cache = ToolCache(
+            f"{func.__module__}.{func.__qualname__}",
+            max_size=max_size,
+            spill_dir=spill_dir,
+            max_spill_bytes=max_spill_bytes,
+            version=get_code_digest(func),
+        )
+
+        def get_key(args, kwargs) -> Optional[str]:
+            try:
+                bound = signature.bind(*args, **kwargs)
+            except TypeError:
+                # Let the call itself report the invalid arguments
+                return None
+
+            bound.apply_defaults()
+
+            try:
+                return fingerprint_value(tuple(bound.arguments.items()))
+            except TypeError:
+                cache.record_uncacheable()
+                return None
+
+        def lookup(key: Optional[str]) -> Tuple[bool, Any]:
+            if key is None:
+                return False, None
+
+            found, value = cache.get(key)
+            return found, deepcopy(value) if found else None
+
+        def store(key: Optional[str], value: Any) -> None:
+            if key is None:
+                return
+
+            try:
+                cache.put(key, deepcopy(value))
+            except Exception:
+                cache.record_uncacheable()
+
+        @wraps(func)
+        def wrapper(*args, **kwargs):
+            key = get_key(args, kwargs)
+            found, value = lookup(key)
+            if found:
+                return value
+
+            value = func(*args, **kwargs)
+            store(key, value)
+            return value
+
+        @wraps(func)
+        async def async_wrapper(*args, **kwargs):
+            key = get_key(args, kwargs)
+            found, value = lookup(key)
+            if found:
+                return value
+
+            value = await func(*args, **kwargs)
+            store(key, value)
+            return value
+
+        target = async_wrapper if inspect.iscoroutinefunction(func) else wrapper
+        target.cache_info = cache.get_stats  # type: ignore[attr-defined]
+        target.cache_clear = cache.clear  # type: ignore[attr-defined]
+        return target
+
+    return decorator
+
+
+def get_code_digest(func: Callable) -> str:
+    """Digest the file defining a tool, falling back to its bytecode when it has none."""
+    target = inspect.unwrap(func)
+
+    try:
+        digest = hash_source_file(inspect.getsourcefile(target))
+    except TypeError:
+        digest = "-"
+
+    if digest == "-":
+        code = getattr(target, "__code__", None)
+        digest = hashlib.blake2b(code.co_code if code else b"", digest_size=16).hexdigest()
+
+    return digest[:16]
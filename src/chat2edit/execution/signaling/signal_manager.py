@@ -1,5 +1,5 @@
-import threading
-from typing import Any, Optional
+from contextvars import ContextVar
+from typing import Any, Dict, Optional
 
 from chat2edit.models import Feedback, Message
 
@@ -8,19 +8,22 @@ FEEDBACK_SIGNAL_KEY = "__feedback__"
 
 
 class SignalManager:
-    _signals = threading.local()
+    # Signals are copied on write, so concurrently awaited blocks never see each other's
+    _signals: ContextVar[Dict[str, Any]] = ContextVar("chat2edit_signals")
 
     @classmethod
     def set_signal(cls, key: str, value: Any) -> None:
-        setattr(SignalManager._signals, key, value)
+        cls._signals.set({**cls._signals.get({}), key: value})
 
     @classmethod
     def pop_signal(cls, key: str) -> Optional[Any]:
-        if not hasattr(cls._signals, key):
+        signals = cls._signals.get({})
+        if key not in signals:
             return None
 
-        signal = getattr(cls._signals, key, None)
-        delattr(cls._signals, key)
+        signals = dict(signals)
+        signal = signals.pop(key)
+        cls._signals.set(signals)
 
         return signal
 
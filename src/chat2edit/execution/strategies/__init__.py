@@ -1,9 +1,27 @@
+from typing import TYPE_CHECKING
+
 from chat2edit.execution.strategies.execution_strategy import ExecutionStrategy
-from chat2edit.execution.strategies.impl.default_execution_strategy import (
-    DefaultExecutionStrategy,
+from chat2edit.utils import create_lazy_getattr
+
+if TYPE_CHECKING:
+    from chat2edit.execution.strategies.impl.default_execution_strategy import (
+        DefaultExecutionStrategy,
+    )
+    from chat2edit.execution.strategies.impl.native_execution_strategy import (
+        NativeExecutionStrategy,
+    )
+
+# The default engine imports IPython, so engines are only loaded when first used
+__getattr__ = create_lazy_getattr(
+    __name__,
+    {
+        "DefaultExecutionStrategy": f"{__name__}.impl.default_execution_strategy",
+        "NativeExecutionStrategy": f"{__name__}.impl.native_execution_strategy",
+    },
 )
 
 __all__ = [
     "ExecutionStrategy",
     "DefaultExecutionStrategy",
+    "NativeExecutionStrategy",
 ]
@@ -1,14 +1,21 @@
 from abc import ABC, abstractmethod
-from typing import Any, Callable, Dict, List, Optional, Tuple, Union
+from typing import Any, Callable, Collection, Dict, List, Optional, Tuple, Union
 
+from chat2edit.execution.utils import LogCallback
 from chat2edit.models import (
     ExecutionError,
+    ExecutionProfile,
     Feedback,
     Message,
 )
 
 
 class ExecutionStrategy(ABC):
+    @property
+    def supports_concurrent_execution(self) -> bool:
+        """Whether blocks may be executed concurrently, each against its own context copy."""
+        return False
+
     @abstractmethod
     def parse(self, code: str) -> List[str]:
         pass
@@ -18,7 +25,14 @@ class ExecutionStrategy(ABC):
         pass
 
     @abstractmethod
-    async def execute(self, code: str, context: Dict[str, Any], on_log: Optional[Callable[[str], None]] = None) -> Tuple[
+    async def execute(
+        self,
+        code: str,
+        context: Dict[str, Any],
+        on_log: Optional[LogCallback] = None,
+        on_profile: Optional[Callable[[ExecutionProfile], None]] = None,
+        attachment_names: Optional[Collection[str]] = None,
+    ) -> Tuple[
         Optional[ExecutionError],
         Optional[Union[Feedback, Feedback]],
         Optional[Message],
@@ -1,41 +1,77 @@
 import ast
-import re
 import textwrap
-from contextlib import redirect_stderr, redirect_stdout
-from io import StringIO
-from typing import Any, Callable, Dict, List, Optional, Tuple
+from contextlib import nullcontext, redirect_stderr, redirect_stdout
+from typing import Any, Callable, Collection, Dict, List, Optional, Tuple
 
 from IPython.core.interactiveshell import InteractiveShell
 
+from chat2edit.context.attachments import (
+    resolve_attachment_handles,
+    store_resolved_attachments,
+)
 from chat2edit.execution.exceptions import FeedbackException, ResponseException
 from chat2edit.execution.signaling import pop_feedback, pop_response
 from chat2edit.execution.strategies.execution_strategy import ExecutionStrategy
-from chat2edit.execution.utils import fix_unawaited_async_calls
-from chat2edit.models import ExecutionError, Feedback, Message
-
-
-def strip_ansi_codes(text: str) -> str:
-    """Remove ANSI escape codes from text."""
-    # Pattern to match ANSI escape sequences
-    # Matches: \x1b[...m or \033[...m or \x1b[K (clear line) etc.
-    ansi_escape = re.compile(r"\x1b\[[0-9;]*[a-zA-Z]|\x1b\[K|\033\[[0-9;]*[a-zA-Z]|\033\[K")
-    return ansi_escape.sub("", text)
+from chat2edit.execution.utils import (
+    AttachmentWatcher,
+    BlockProfiler,
+    CachedBlock,
+    CodeCache,
+    CodeCacheStats,
+    LogCallback,
+    LogCapture,
+    TrackingNamespace,
+    fix_unawaited_async_calls,
+    get_async_function_names,
+)
+from chat2edit.models import ExecutionError, ExecutionProfile, Feedback, Message
 
 
 class DefaultExecutionStrategy(ExecutionStrategy):
+    def __init__(
+        self,
+        *,
+        profile_sample_rate: float = 0.0,
+        memory_sample_rate: float = 0.0,
+        profile_top_n: int = 10,
+        code_cache: Optional[CodeCache] = None,
+        max_log_lines: int = 1000,
+        max_log_chars: int = 1_000_000,
+    ) -> None:
+        # Fractions of blocks to profile, CPU and memory are sampled independently
+        self._profile_sample_rate = profile_sample_rate
+        self._memory_sample_rate = memory_sample_rate
+        self._profile_top_n = profile_top_n
+        self._code_cache = code_cache or CodeCache()
+        self._max_log_lines = max_log_lines
+        self._max_log_chars = max_log_chars
+
     def parse(self, code: str) -> List[str]:
         dedented_code = textwrap.dedent(code)
         tree = ast.parse(dedented_code)
         return [ast.unparse(node).strip() for node in tree.body]
 
     def process(self, code: str, context: Dict[str, Any]) -> str:
-        return fix_unawaited_async_calls(code, context)
+        async_names = get_async_function_names(context)
+        cached = self._code_cache.get(code, async_names)
+        if cached is not None:
+            return cached.processed_code
+
+        processed_code = fix_unawaited_async_calls(code, context, async_names)
+        # The shell compiles cells itself, so only the processing result is cached
+        self._code_cache.put(code, async_names, CachedBlock(processed_code))
+        return processed_code
+
+    def get_code_cache_stats(self) -> CodeCacheStats:
+        return self._code_cache.get_stats()
 
     async def execute(
         self,
         code: str,
         context: Dict[str, Any],
-        on_log: Optional[Callable[[str], None]] = None,
+        on_log: Optional[LogCallback] = None,
+        on_profile: Optional[Callable[[ExecutionProfile], None]] = None,
+        attachment_names: Optional[Collection[str]] = None,
     ) -> Tuple[
         Optional[ExecutionError],
         Optional[Feedback],
@@ -49,44 +85,36 @@ class DefaultExecutionStrategy(ExecutionStrategy):
 
         InteractiveShell.clear_instance()
 
-        shell = InteractiveShell.instance()
+        namespace = TrackingNamespace()
+        shell = InteractiveShell.instance(user_ns=namespace)
         shell.cleanup()
 
-        shell.user_ns.update(context)
-        keys = set(shell.user_ns.keys())
-
-        class _LogStream:
-            def __init__(self, on_log_cb: Optional[Callable[[str], None]]) -> None:
-                self._buffer = StringIO()
-                self._on_log = on_log_cb
-                self._line_buffer = ""
-
-            def write(self, s: str) -> int:
-                self._buffer.write(s)
-                if self._on_log and s:
-                    text = strip_ansi_codes(s)
-                    self._line_buffer += text
-                    while "\n" in self._line_buffer:
-                        line, self._line_buffer = self._line_buffer.split("\n", 1)
-                        if line:
-                            self._on_log(line)
-                return len(s)
-
-            def flush(self) -> None:
-                self._buffer.flush()
+        namespace.update(context)
+        # Context keeps the handles, only the attachments this block uses are loaded
+        resolved_attachments = resolve_attachment_handles(code, namespace)
+        namespace.reset_changes()
+        watcher = AttachmentWatcher(code, namespace, attachment_names or ())
+
+        log_capture = LogCapture(
+            on_log, max_lines=self._max_log_lines, max_chars=self._max_log_chars
+        )
+        profiler = (
+            BlockProfiler.sample(
+                self._profile_sample_rate, self._memory_sample_rate, self._profile_top_n
+            )
+            if on_profile
+            else None
+        )
 
-            def getvalue(self) -> str:
-                return strip_ansi_codes(self._buffer.getvalue())
+        async with log_capture:
+            try:
+                with redirect_stdout(log_capture), redirect_stderr(log_capture):
+                    with profiler or nullcontext():
+                        result = await shell.run_cell_async(code, silent=True)
 
-        log_buffer = _LogStream(on_log)
-
-        try:
-            with redirect_stdout(log_buffer), redirect_stderr(log_buffer):
-                result = await shell.run_cell_async(code, silent=True)
-
-        finally:
-            new_keys = set(shell.user_ns.keys()).difference(keys)
-            context.update({k: v for k, v in shell.user_ns.items() if k in new_keys})
+            finally:
+                namespace.apply_changes(context, shell.user_ns_hidden)
+                store_resolved_attachments(resolved_attachments, namespace, context)
 
         try:
             result.raise_error()
@@ -105,10 +133,13 @@ class DefaultExecutionStrategy(ExecutionStrategy):
                 },
             )
         finally:
-            log_text = log_buffer.getvalue()
-            logs = [line for line in log_text.splitlines() if line]
+            logs = log_capture.get_lines()
 
-        feedback = feedback or pop_feedback()
+        feedback = feedback or pop_feedback() or watcher.create_feedback()
         response = response or pop_response()
 
+        profile = profiler.get_profile() if profiler else None
+        if on_profile and profile:
+            on_profile(profile)
+
         return error, feedback, response, logs
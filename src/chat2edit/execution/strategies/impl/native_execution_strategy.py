@@ -0,0 +1,198 @@
+import ast
+import builtins
+import hashlib
+import inspect
+import linecache
+import textwrap
+import traceback
+from contextlib import nullcontext
+from types import CodeType
+from typing import Any, Callable, Collection, Dict, List, Optional, Tuple
+
+from chat2edit.context.attachments import (
+    resolve_attachment_handles,
+    store_resolved_attachments,
+)
+from chat2edit.execution.exceptions import FeedbackException, ResponseException
+from chat2edit.execution.signaling import pop_feedback, pop_response
+from chat2edit.execution.strategies.execution_strategy import ExecutionStrategy
+from chat2edit.execution.utils import (
+    AttachmentWatcher,
+    BlockProfiler,
+    CachedBlock,
+    CodeCache,
+    CodeCacheStats,
+    LogCallback,
+    LogCapture,
+    TrackingNamespace,
+    fix_unawaited_async_calls,
+    get_async_function_names,
+    redirect_logs,
+)
+from chat2edit.models import ExecutionError, ExecutionProfile, Feedback, Message
+
+BLOCK_FILENAME_PREFIX = "<chat2edit-block-"
+# Namespace entries the interpreter needs that are not part of the context
+HIDDEN_NAMES = frozenset({"__name__", "__builtins__"})
+
+
+def get_block_filename(code: str) -> str:
+    # Derived from the source so cached code objects and linecache entries agree
+    return f"{BLOCK_FILENAME_PREFIX}{hashlib.sha1(code.encode()).hexdigest()[:12]}>"
+
+
+def compile_block(code: str) -> Optional[CodeType]:
+    try:
+        return compile(code, get_block_filename(code), "exec", flags=ast.PyCF_ALLOW_TOP_LEVEL_AWAIT)
+    except SyntaxError:
+        # Left to execute, which reports it as feedback
+        return None
+
+
+def format_block_traceback(exception: BaseException) -> str:
+    """Format an exception like IPython does, starting at the block's own frame."""
+    tb = exception.__traceback__
+    while tb is not None and not tb.tb_frame.f_code.co_filename.startswith(BLOCK_FILENAME_PREFIX):
+        tb = tb.tb_next
+
+    return "".join(traceback.format_exception(type(exception), exception, tb))
+
+
+class NativeExecutionStrategy(ExecutionStrategy):
+    """
+    Executes blocks with the interpreter directly instead of an IPython shell.
+
+    Blocks are compiled with top-level await enabled and evaluated in a plain
+    dict namespace seeded from the context, which avoids the shell's per-cell
+    history, hooks and display machinery. Feedback, response and log handling
+    match `DefaultExecutionStrategy`. Output and signals are captured per task,
+    so independent blocks can be awaited concurrently.
+    """
+
+    def __init__(
+        self,
+        *,
+        profile_sample_rate: float = 0.0,
+        memory_sample_rate: float = 0.0,
+        profile_top_n: int = 10,
+        code_cache: Optional[CodeCache] = None,
+        max_log_lines: int = 1000,
+        max_log_chars: int = 1_000_000,
+    ) -> None:
+        self._profile_sample_rate = profile_sample_rate
+        self._memory_sample_rate = memory_sample_rate
+        self._profile_top_n = profile_top_n
+        self._code_cache = code_cache or CodeCache()
+        self._max_log_lines = max_log_lines
+        self._max_log_chars = max_log_chars
+
+    @property
+    def supports_concurrent_execution(self) -> bool:
+        return True
+
+    def parse(self, code: str) -> List[str]:
+        dedented_code = textwrap.dedent(code)
+        tree = ast.parse(dedented_code)
+        return [ast.unparse(node).strip() for node in tree.body]
+
+    def process(self, code: str, context: Dict[str, Any]) -> str:
+        async_names = get_async_function_names(context)
+        cached = self._code_cache.get(code, async_names)
+        if cached is not None:
+            return cached.processed_code
+
+        processed_code = fix_unawaited_async_calls(code, context, async_names)
+        self._code_cache.put(
+            code, async_names, CachedBlock(processed_code, compile_block(processed_code))
+        )
+        return processed_code
+
+    def get_code_cache_stats(self) -> CodeCacheStats:
+        return self._code_cache.get_stats()
+
+    def _get_compiled(self, code: str, context: Dict[str, Any]) -> CodeType:
+        cached = self._code_cache.get(code, get_async_function_names(context))
+        if cached is not None and cached.code is not None:
+            return cached.code
+
+        return compile(code, get_block_filename(code), "exec", flags=ast.PyCF_ALLOW_TOP_LEVEL_AWAIT)
+
+    async def execute(
+        self,
+        code: str,
+        context: Dict[str, Any],
+        on_log: Optional[LogCallback] = None,
+        on_profile: Optional[Callable[[ExecutionProfile], None]] = None,
+        attachment_names: Optional[Collection[str]] = None,
+    ) -> Tuple[
+        Optional[ExecutionError],
+        Optional[Feedback],
+        Optional[Message],
+        List[str],
+    ]:
+        error: Optional[ExecutionError] = None
+        feedback: Optional[Feedback] = None
+        response: Optional[Message] = None
+
+        namespace = TrackingNamespace(context, __name__="__main__", __builtins__=builtins)
+        # Context keeps the handles, only the attachments this block uses are loaded
+        resolved_attachments = resolve_attachment_handles(code, namespace)
+        namespace.reset_changes()
+        watcher = AttachmentWatcher(code, namespace, attachment_names or ())
+
+        log_capture = LogCapture(
+            on_log, max_lines=self._max_log_lines, max_chars=self._max_log_chars
+        )
+        profiler = (
+            BlockProfiler.sample(
+                self._profile_sample_rate, self._memory_sample_rate, self._profile_top_n
+            )
+            if on_profile
+            else None
+        )
+
+        filename = get_block_filename(code)
+        # Lets tracebacks show the offending source lines
+        linecache.cache[filename] = (len(code), None, code.splitlines(keepends=True), filename)
+
+        async with log_capture:
+            try:
+                compiled = self._get_compiled(code, context)
+
+                with redirect_logs(log_capture):
+                    with profiler or nullcontext():
+                        result = eval(compiled, namespace)
+                        # Blocks containing top-level await compile to a coroutine
+                        if compiled.co_flags & inspect.CO_COROUTINE:
+                            await result
+
+            except FeedbackException as e:
+                feedback = e.feedback
+            except ResponseException as e:
+                response = e.response
+            except Exception as e:
+                log_capture.write(format_block_traceback(e))
+                execution_error = ExecutionError.from_exception(e)
+                error = execution_error
+                feedback = Feedback(
+                    type="unexpected_error",
+                    severity="error",
+                    details={
+                        "error": execution_error.model_dump(),
+                    },
+                )
+            finally:
+                linecache.cache.pop(filename, None)
+                namespace.apply_changes(context, HIDDEN_NAMES)
+                store_resolved_attachments(resolved_attachments, namespace, context)
+
+        logs = log_capture.get_lines()
+
+        feedback = feedback or pop_feedback() or watcher.create_feedback()
+        response = response or pop_response()
+
+        profile = profiler.get_profile() if profiler else None
+        if on_profile and profile:
+            on_profile(profile)
+
+        return error, feedback, response, logs
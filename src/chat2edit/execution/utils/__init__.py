@@ -1,5 +1,58 @@
-from chat2edit.execution.utils.async_call_corrector import fix_unawaited_async_calls
+from typing import TYPE_CHECKING
+
+from chat2edit.execution.utils.attachment_watcher import AttachmentWatcher
+from chat2edit.execution.utils.block_dependencies import (
+    BlockAccesses,
+    get_block_accesses,
+    group_independent_blocks,
+)
+from chat2edit.execution.utils.block_profiler import BlockProfiler
+from chat2edit.execution.utils.code_cache import CachedBlock, CodeCache
+from chat2edit.execution.utils.code_cache_stats import CodeCacheStats
+from chat2edit.execution.utils.log_capture import (
+    LogCallback,
+    LogCapture,
+    redirect_logs,
+    strip_ansi_codes,
+)
+from chat2edit.execution.utils.outcome_block import get_outcome_block
+from chat2edit.execution.utils.tool_cache import ToolCache, get_tool_cache_stats
+from chat2edit.execution.utils.tool_cache_stats import ToolCacheStats
+from chat2edit.execution.utils.tracking_namespace import TrackingNamespace
+from chat2edit.utils import create_lazy_getattr
+
+if TYPE_CHECKING:
+    from chat2edit.execution.utils.async_call_corrector import (
+        fix_unawaited_async_calls,
+        get_async_function_names,
+    )
+
+__getattr__ = create_lazy_getattr(
+    __name__,
+    {
+        "fix_unawaited_async_calls": f"{__name__}.async_call_corrector",
+        "get_async_function_names": f"{__name__}.async_call_corrector",
+    },
+)
 
 __all__ = [
+    "AttachmentWatcher",
+    "BlockAccesses",
+    "BlockProfiler",
+    "CachedBlock",
+    "CodeCache",
+    "CodeCacheStats",
     "fix_unawaited_async_calls",
+    "get_async_function_names",
+    "get_block_accesses",
+    "get_outcome_block",
+    "get_tool_cache_stats",
+    "group_independent_blocks",
+    "LogCallback",
+    "LogCapture",
+    "redirect_logs",
+    "strip_ansi_codes",
+    "ToolCache",
+    "ToolCacheStats",
+    "TrackingNamespace",
 ]
@@ -1,18 +1,21 @@
 import ast
 import inspect
+import threading
 import types
-from typing import Any, Dict, Optional, Set
-
-import astor
-import black
+import weakref
+from collections import OrderedDict
+from typing import Any, Dict, FrozenSet, Optional, Set, Tuple
 
 
 class AsyncCallCorrector(ast.NodeTransformer):
-    def __init__(self, context: Dict[str, Any]):
+    def __init__(self, context: Dict[str, Any], async_functions: Optional[Set[str]] = None):
         super().__init__()
         # Set to store all discovered async function/method names
         self.async_functions: Set[str] = set()
-        self._collect_async_functions(context)
+        if async_functions is not None:
+            self.async_functions.update(async_functions)
+        else:
+            self._collect_async_functions(context)
 
     def _collect_async_functions(
         self, obj: Any, prefix: str = "", visited: Optional[Set[int]] = None
@@ -113,15 +116,55 @@ def add_parent_info(node: ast.AST):
         add_parent_info(child)
 
 
-def fix_unawaited_async_calls(code: str, context: Dict[str, Any]) -> str:
+MAX_CACHED_CONTEXT_VALUES = 4096
+
+# Async names reachable from each context value, keyed by (name, id(value)). A weak reference
+# to the value detects a reused id without keeping attachments of finished sessions alive.
+_async_names_cache: "OrderedDict[Tuple[str, int], Tuple[weakref.ref, FrozenSet[str]]]" = (
+    OrderedDict()
+)
+_async_names_lock = threading.Lock()
+
+
+def get_async_function_names(context: Dict[str, Any]) -> FrozenSet[str]:
+    """Return the async function/method names the corrector would collect from the context."""
+    names: Set[str] = set()
+
+    for key, value in context.items():
+        cache_key = (key, id(value))
+
+        with _async_names_lock:
+            entry = _async_names_cache.get(cache_key)
+            if entry is not None and entry[0]() is value:
+                _async_names_cache.move_to_end(cache_key)
+                names.update(entry[1])
+                continue
+
+        value_names = frozenset(AsyncCallCorrector({key: value}).async_functions)
+        names.update(value_names)
+
+        try:
+            value_ref = weakref.ref(value)
+        except TypeError:
+            # Values such as dicts and lists cannot be weakly referenced and are collected each time
+            continue
+
+        with _async_names_lock:
+            _async_names_cache[cache_key] = (value_ref, value_names)
+            if len(_async_names_cache) > MAX_CACHED_CONTEXT_VALUES:
+                _async_names_cache.popitem(last=False)
+
+    return frozenset(names)
+
+
+def fix_unawaited_async_calls(
+    code: str, context: Dict[str, Any], async_names: Optional[FrozenSet[str]] = None
+) -> str:
     tree = ast.parse(code)
     add_parent_info(tree)
 
-    transformer = AsyncCallCorrector(context)
+    transformer = AsyncCallCorrector(context, set(async_names) if async_names is not None else None)
     fixed_tree = transformer.visit(tree)
 
     ast.fix_missing_locations(fixed_tree)
-    fixed_code = astor.to_source(fixed_tree)
-    formatted_code = black.format_str(fixed_code, mode=black.Mode(line_length=1000))
-
-    return formatted_code
+    return f"{ast.unparse(fixed_tree)}\n"
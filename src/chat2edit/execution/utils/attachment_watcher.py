@@ -0,0 +1,50 @@
+from typing import Any, Collection, Dict, List, Mapping, Optional, Tuple
+
+from chat2edit.context.attachments.utils import get_referenced_names
+from chat2edit.context.utils import fingerprint_attachment
+from chat2edit.models import Feedback
+
+
+class AttachmentWatcher:
+    """
+    Detects attachments that a block modified in place.
+
+    The attachments the block references are fingerprinted before it runs and
+    the same objects are fingerprinted again afterwards, so rebinding a name
+    to a new value is not reported while mutating the original object is.
+    """
+
+    def __init__(
+        self, code: str, namespace: Mapping[str, Any], attachment_names: Collection[str]
+    ) -> None:
+        self._fingerprints: Dict[str, Tuple[Any, str]] = {}
+
+        if not attachment_names:
+            return
+
+        for name in get_referenced_names(code):
+            if name not in attachment_names or name not in namespace:
+                continue
+
+            value = namespace[name]
+            fingerprint = fingerprint_attachment(value)
+            if fingerprint is not None:
+                self._fingerprints[name] = (value, fingerprint)
+
+    def get_modified(self) -> List[str]:
+        return [
+            name
+            for name, (value, fingerprint) in self._fingerprints.items()
+            if fingerprint_attachment(value) != fingerprint
+        ]
+
+    def create_feedback(self) -> Optional[Feedback]:
+        modified = self.get_modified()
+        if not modified:
+            return None
+
+        return Feedback(
+            type="modified_attachment",
+            severity="error",
+            details={"variable": modified[0], "variables": modified},
+        )
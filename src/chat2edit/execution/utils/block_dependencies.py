@@ -0,0 +1,110 @@
+import ast
+from dataclasses import dataclass
+from typing import FrozenSet, List, Optional, Sequence, Set
+
+# Calls that can read or write any name, so blocks using them are never reordered
+DYNAMIC_NAMESPACE_CALLS = frozenset({"exec", "eval", "globals", "locals", "vars", "__import__"})
+
+
+@dataclass(frozen=True)
+class BlockAccesses:
+    reads: FrozenSet[str]
+    writes: FrozenSet[str]
+    awaits: bool
+    # False when the names a block touches cannot be determined statically
+    analyzable: bool = True
+
+    def conflicts_with(self, other: "BlockAccesses") -> bool:
+        return bool(
+            self.writes & (other.reads | other.writes) or other.writes & (self.reads | self.writes)
+        )
+
+
+def get_root_name(node: ast.AST) -> Optional[str]:
+    while isinstance(node, (ast.Attribute, ast.Subscript, ast.Starred)):
+        node = node.value
+
+    return node.id if isinstance(node, ast.Name) else None
+
+
+def get_block_accesses(code: str) -> BlockAccesses:
+    """
+    Collect the top-level names a block reads and writes.
+
+    The analysis is conservative: mutating an attribute or item, calling a
+    method on an object and passing an object to a call all count as writes to
+    the object's name, since tools commonly edit their arguments in place.
+    """
+    try:
+        tree = ast.parse(code)
+    except SyntaxError:
+        return BlockAccesses(frozenset(), frozenset(), False, analyzable=False)
+
+    reads: Set[str] = set()
+    writes: Set[str] = set()
+    awaits = False
+    analyzable = True
+
+    for node in ast.walk(tree):
+        if isinstance(node, ast.Name):
+            (reads if isinstance(node.ctx, ast.Load) else writes).add(node.id)
+        elif isinstance(node, (ast.Attribute, ast.Subscript)):
+            if not isinstance(node.ctx, ast.Load):
+                writes.add(get_root_name(node) or "")
+        elif isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef, ast.ClassDef)):
+            writes.add(node.name)
+        elif isinstance(node, (ast.Import, ast.ImportFrom)):
+            for alias in node.names:
+                if alias.name == "*":
+                    analyzable = False
+                writes.add(alias.asname or alias.name.split(".")[0])
+        elif isinstance(node, (ast.Global, ast.Nonlocal)):
+            writes.update(node.names)
+        elif isinstance(node, (ast.Await, ast.AsyncFor, ast.AsyncWith)):
+            awaits = True
+        elif isinstance(node, ast.Call):
+            if isinstance(node.func, ast.Name) and node.func.id in DYNAMIC_NAMESPACE_CALLS:
+                analyzable = False
+            if isinstance(node.func, (ast.Attribute, ast.Subscript)):
+                writes.add(get_root_name(node.func.value) or "")
+            for arg in [*node.args, *(keyword.value for keyword in node.keywords)]:
+                writes.add(get_root_name(arg) or "")
+
+    writes.discard("")
+    return BlockAccesses(frozenset(reads), frozenset(writes), awaits, analyzable)
+
+
+def group_independent_blocks(blocks: Sequence[str]) -> List[List[int]]:
+    """
+    Split blocks into consecutive groups that can be awaited concurrently.
+
+    A group only contains blocks that await something and share no name that
+    one of them writes. Every other block forms a group of its own, so blocks
+    still run in their original order relative to anything they depend on.
+    """
+    groups: List[List[int]] = []
+    group: List[int] = []
+    group_accesses: List[BlockAccesses] = []
+
+    for index, code in enumerate(blocks):
+        accesses = get_block_accesses(code)
+        concurrent = accesses.analyzable and accesses.awaits
+
+        if concurrent and not any(accesses.conflicts_with(other) for other in group_accesses):
+            group.append(index)
+            group_accesses.append(accesses)
+            continue
+
+        if group:
+            groups.append(group)
+
+        if concurrent:
+            group, group_accesses = [index], [accesses]
+        else:
+            groups.append([index])
+            group, group_accesses = [], []
+
+    if group:
+        groups.append(group)
+
+    return groups
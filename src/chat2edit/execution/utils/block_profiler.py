@@ -0,0 +1,129 @@
+import cProfile
+import pstats
+import random
+import threading
+import tracemalloc
+from collections import defaultdict
+from typing import Dict, Optional, Set, Tuple
+
+from chat2edit.models import ExecutionProfile, ProfiledFunction
+
+FunctionKey = Tuple[str, int, str]
+
+# Pseudo filenames given to code compiled from a block
+BLOCK_FILENAME_PREFIXES: Tuple[str, ...] = ("<ipython-input-", "<chat2edit-block-")
+
+# Only one profiler can be attached to the interpreter at a time
+_cpu_profiler_lock = threading.Lock()
+
+
+class BlockProfiler:
+    """
+    Profiles a single code block with cProfile and optionally tracemalloc.
+
+    If another block is already being profiled, CPU profiling is skipped for this
+    one instead of replacing the active profiler. Allocation tracking is
+    process-wide, so concurrent blocks contribute to each other's memory figures.
+    """
+
+    def __init__(self, profile_cpu: bool = True, profile_memory: bool = False, top_n: int = 10):
+        self._profile_cpu = profile_cpu
+        self._profile_memory = profile_memory
+        self._top_n = top_n
+        self._profiler: Optional[cProfile.Profile] = None
+        self._started_tracing = False
+        self._start_memory = 0
+        self._profile: Optional[ExecutionProfile] = None
+
+    @classmethod
+    def sample(
+        cls, profile_sample_rate: float, memory_sample_rate: float, top_n: int = 10
+    ) -> Optional["BlockProfiler"]:
+        """Return a profiler for a sampled block, CPU and memory are sampled independently."""
+        profile_cpu = random.random() < profile_sample_rate
+        profile_memory = random.random() < memory_sample_rate
+
+        if not profile_cpu and not profile_memory:
+            return None
+
+        return cls(profile_cpu, profile_memory, top_n)
+
+    def __enter__(self) -> "BlockProfiler":
+        if self._profile_memory:
+            if not tracemalloc.is_tracing():
+                tracemalloc.start()
+                self._started_tracing = True
+
+            self._start_memory, _ = tracemalloc.get_traced_memory()
+            tracemalloc.reset_peak()
+
+        if self._profile_cpu and _cpu_profiler_lock.acquire(blocking=False):
+            self._profiler = cProfile.Profile()
+            self._profiler.enable()
+
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        profile = ExecutionProfile()
+
+        if self._profiler is not None:
+            self._profiler.disable()
+            _cpu_profiler_lock.release()
+            self._summarize_cpu(profile)
+
+        if self._profile_memory:
+            current, peak = tracemalloc.get_traced_memory()
+            profile.peak_memory = max(peak - self._start_memory, 0)
+            profile.allocated_memory = current - self._start_memory
+
+            if self._started_tracing:
+                tracemalloc.stop()
+
+        self._profile = profile
+
+    def get_profile(self) -> Optional[ExecutionProfile]:
+        return self._profile
+
+    def _summarize_cpu(self, profile: ExecutionProfile) -> None:
+        stats = pstats.Stats(self._profiler).stats  # type: ignore[arg-type, attr-defined]
+        reachable = get_reachable_functions(stats)
+
+        entries = [
+            ProfiledFunction(
+                name=name,
+                filename=filename,
+                line=line,
+                calls=calls,
+                total_time=tottime,
+                cumulative_time=cumtime,
+            )
+            for (filename, line, name), (_, calls, tottime, cumtime, _) in stats.items()
+            if (filename, line, name) in reachable
+        ]
+        entries.sort(key=lambda entry: entry.cumulative_time, reverse=True)
+        profile.functions = entries[: self._top_n]
+        profile.total_calls = sum(entry.calls for entry in entries)
+
+
+def is_block_code(filename: str) -> bool:
+    return filename.startswith(BLOCK_FILENAME_PREFIXES)
+
+
+def get_reachable_functions(stats: Dict[FunctionKey, tuple]) -> Set[FunctionKey]:
+    """Return the functions called from the block, leaving out the execution machinery."""
+    callees: Dict[FunctionKey, Set[FunctionKey]] = defaultdict(set)
+
+    for func, (*_, callers) in stats.items():
+        for caller in callers:
+            callees[caller].add(func)
+
+    reachable = {func for func in stats if is_block_code(func[0])}
+    work = list(reachable)
+
+    while work:
+        for callee in callees[work.pop()]:
+            if callee not in reachable:
+                reachable.add(callee)
+                work.append(callee)
+
+    return reachable
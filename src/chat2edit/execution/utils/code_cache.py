@@ -0,0 +1,65 @@
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass
+from types import CodeType
+from typing import FrozenSet, Optional, Tuple
+
+from chat2edit.execution.utils.code_cache_stats import CodeCacheStats
+
+CodeCacheKey = Tuple[str, FrozenSet[str]]
+
+
+@dataclass(frozen=True)
+class CachedBlock:
+    processed_code: str
+    code: Optional[CodeType] = None
+
+
+class CodeCache:
+    """
+    Bounded LRU of processed and compiled code blocks.
+
+    Entries are keyed by block source plus the set of async names the corrector
+    used. Each entry is stored under both the generated and the processed source,
+    so `process` and the later compilation of its output both hit.
+    """
+
+    def __init__(self, max_size: int = 512) -> None:
+        self._max_size = max_size
+        self._entries: "OrderedDict[CodeCacheKey, CachedBlock]" = OrderedDict()
+        self._stats = CodeCacheStats()
+        self._lock = threading.Lock()
+
+    def get(self, source: str, async_names: FrozenSet[str]) -> Optional[CachedBlock]:
+        key = (source, async_names)
+
+        with self._lock:
+            block = self._entries.get(key)
+
+            if block is None:
+                self._stats.misses += 1
+                return None
+
+            self._stats.hits += 1
+            self._entries.move_to_end(key)
+            return block
+
+    def put(self, source: str, async_names: FrozenSet[str], block: CachedBlock) -> None:
+        with self._lock:
+            for key in {(source, async_names), (block.processed_code, async_names)}:
+                self._entries[key] = block
+                self._entries.move_to_end(key)
+
+            while len(self._entries) > self._max_size:
+                self._entries.popitem(last=False)
+                self._stats.evictions += 1
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def get_stats(self) -> CodeCacheStats:
+        with self._lock:
+            stats = self._stats.model_copy()
+            stats.size = len(self._entries)
+            return stats
@@ -0,0 +1,13 @@
+from pydantic import BaseModel, Field
+
+
+class CodeCacheStats(BaseModel):
+    hits: int = Field(default=0)
+    misses: int = Field(default=0)
+    evictions: int = Field(default=0)
+    size: int = Field(default=0)
+
+    @property
+    def hit_rate(self) -> float:
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
@@ -0,0 +1,289 @@
+import asyncio
+import inspect
+import re
+import sys
+import threading
+from collections import deque
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Any, Callable, Deque, Iterator, List, Optional, TextIO
+
+ANSI_ESCAPE_PATTERN = re.compile(r"\x1b\[[0-9;]*[a-zA-Z]")
+
+LogCallback = Callable[[str], None]
+
+
+def strip_ansi_codes(text: str) -> str:
+    """Remove ANSI escape codes from text."""
+    return ANSI_ESCAPE_PATTERN.sub("", text)
+
+
+class LogCapture:
+    """
+    Captures a block's stdout/stderr as lines with bounded memory.
+
+    Only the first and the last lines are kept once a block exceeds `max_lines`
+    or `max_chars`, with a marker counting the lines omitted in between, and a
+    single line is cut at `max_line_chars`. ANSI codes are stripped once per
+    completed line.
+
+    Used as an async context manager, lines are handed to `on_log` through a
+    queue drained by a separate task on the event loop, so the callback never
+    runs inside a write and lines printed from worker threads are delivered on
+    the loop thread. The callback still runs on the loop and pending lines are
+    delivered on exit unless the block was cancelled, keeping them ordered
+    before whatever follows the block: a slow callback delays the block's
+    completion. At most `max_pending` lines wait for delivery, later ones are
+    still captured but not delivered.
+    """
+
+    def __init__(
+        self,
+        on_log: Optional[LogCallback] = None,
+        *,
+        max_lines: int = 1000,
+        max_chars: int = 1_000_000,
+        max_line_chars: int = 10_000,
+        max_pending: int = 1000,
+    ) -> None:
+        self._on_log = on_log
+        self._head_lines = max_lines // 2
+        self._tail_lines = max_lines - self._head_lines
+        self._head_chars = max_chars // 2
+        self._tail_chars = max_chars - self._head_chars
+        self._max_line_chars = max_line_chars
+        self._max_pending = max_pending
+
+        self._head: List[str] = []
+        self._tail: Deque[str] = deque()
+        self._head_size = 0
+        self._tail_size = 0
+        self._head_closed = False
+        self._omitted_lines = 0
+
+        self._partial: List[str] = []
+        self._partial_size = 0
+        self._lock = threading.RLock()
+
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._thread_id: Optional[int] = None
+        self._queue: Optional["asyncio.Queue[Optional[str]]"] = None
+        self._consumer: Optional["asyncio.Task[None]"] = None
+        self._dropped_deliveries = 0
+
+    @property
+    def omitted_lines(self) -> int:
+        return self._omitted_lines
+
+    @property
+    def dropped_deliveries(self) -> int:
+        return self._dropped_deliveries
+
+    async def __aenter__(self) -> "LogCapture":
+        if self._on_log is not None:
+            self._loop = asyncio.get_running_loop()
+            self._thread_id = threading.get_ident()
+            self._queue = asyncio.Queue()
+            self._consumer = asyncio.create_task(self._consume())
+
+        return self
+
+    async def __aexit__(self, exc_type: Any, *exc_info: Any) -> None:
+        self.close()
+
+        if self._consumer is None or self._queue is None:
+            return
+
+        if exc_type is not None and issubclass(exc_type, asyncio.CancelledError):
+            self._consumer.cancel()
+            return
+
+        self._queue.put_nowait(None)
+        await self._consumer
+
+    def write(self, s: str) -> int:
+        with self._lock:
+            if "\n" not in s:
+                # Most writes are fragments of a line, such as the pieces print() emits
+                if self._partial_size < self._max_line_chars:
+                    self._partial.append(s)
+                self._partial_size += len(s)
+                return len(s)
+
+            lines = s.split("\n")
+            rest = lines.pop()
+            self._add_line(self._take_partial(lines[0]))
+            for line in lines[1:]:
+                self._add_line(self._truncate(line, len(line)))
+
+            if rest:
+                self._partial.append(rest[: self._max_line_chars])
+                self._partial_size = len(rest)
+
+        return len(s)
+
+    def flush(self) -> None:
+        pass
+
+    def close(self) -> None:
+        """Capture the last line even if it was not terminated by a newline."""
+        with self._lock:
+            if self._partial:
+                self._add_line(self._take_partial(""))
+
+    def get_lines(self) -> List[str]:
+        with self._lock:
+            lines = list(self._head)
+            if self._omitted_lines:
+                lines.append(f"... {self._omitted_lines} lines omitted ...")
+            lines.extend(self._tail)
+            return lines
+
+    def getvalue(self) -> str:
+        return "\n".join(self.get_lines())
+
+    def _take_partial(self, end: str) -> str:
+        if not self._partial:
+            line = end
+        else:
+            self._partial.append(end)
+            line = "".join(self._partial)
+            self._partial.clear()
+
+        size = self._partial_size + len(end)
+        self._partial_size = 0
+        return self._truncate(line, size)
+
+    def _truncate(self, line: str, size: int) -> str:
+        """Cut a line at `max_line_chars`, `size` being its length before any earlier cut."""
+        if size <= self._max_line_chars:
+            return line
+
+        truncated = size - self._max_line_chars
+        return f"{line[: self._max_line_chars]}... [{truncated} characters truncated]"
+
+    def _add_line(self, line: str) -> None:
+        if "\x1b" in line:
+            line = ANSI_ESCAPE_PATTERN.sub("", line)
+        if not line:
+            return
+
+        size = len(line)
+        if (
+            not self._head_closed
+            and len(self._head) < self._head_lines
+            and self._head_size + size <= self._head_chars
+        ):
+            self._head.append(line)
+            self._head_size += size
+        else:
+            # Later lines must not be placed before ones already in the tail
+            self._head_closed = True
+            tail = self._tail
+            tail.append(line)
+            self._tail_size += size
+
+            while len(tail) > self._tail_lines or self._tail_size > self._tail_chars:
+                self._tail_size -= len(tail.popleft())
+                self._omitted_lines += 1
+
+        if self._on_log is not None:
+            self._deliver(line)
+
+    def _deliver(self, line: str) -> None:
+        if self._on_log is None:
+            return
+
+        if self._queue is None or self._loop is None:
+            self._call_on_log(line)
+        elif self._queue.qsize() >= self._max_pending:
+            self._dropped_deliveries += 1
+        elif threading.get_ident() == self._thread_id:
+            self._queue.put_nowait(line)
+        else:
+            # Output printed from worker threads
+            self._loop.call_soon_threadsafe(self._queue.put_nowait, line)
+
+    async def _consume(self) -> None:
+        assert self._queue is not None and self._on_log is not None
+
+        while (line := await self._queue.get()) is not None:
+            self._call_on_log(line)
+
+    def _call_on_log(self, line: str) -> None:
+        assert self._on_log is not None
+
+        result = self._on_log(line)
+        if inspect.isawaitable(result):
+            # Nothing would ever await it, so reject instead of dropping it silently
+            if inspect.iscoroutine(result):
+                result.close()
+            raise TypeError("on_log must be a synchronous callback")
+
+
+_current_log_capture: ContextVar[Optional[LogCapture]] = ContextVar(
+    "chat2edit_log_capture", default=None
+)
+_redirect_lock = threading.Lock()
+_active_captures: List[LogCapture] = []
+_redirected_streams: Optional[tuple] = None
+
+
+class _RoutedStream:
+    """Stands in for stdout/stderr and writes to the log capture of the current task."""
+
+    def __init__(self, fallback: TextIO) -> None:
+        self._fallback = fallback
+
+    def write(self, s: str) -> int:
+        capture = _current_log_capture.get()
+        if capture is not None:
+            return capture.write(s)
+
+        return self._get_target().write(s)
+
+    def flush(self) -> None:
+        self._get_target().flush()
+
+    def _get_target(self) -> Any:
+        capture = _current_log_capture.get()
+        if capture is not None:
+            return capture
+
+        # Threads started by a block do not inherit its context, like redirect_stdout
+        # their output goes to the most recently started capture
+        with _redirect_lock:
+            return _active_captures[-1] if _active_captures else self._fallback
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self._fallback, name)
+
+
+@contextmanager
+def redirect_logs(capture: LogCapture) -> Iterator[LogCapture]:
+    """
+    Redirect stdout and stderr of the current task to `capture`.
+
+    Unlike `contextlib.redirect_stdout`, the target is kept in a context
+    variable, so blocks awaited concurrently each capture their own output.
+    """
+    global _redirected_streams
+
+    with _redirect_lock:
+        if not _active_captures:
+            _redirected_streams = (sys.stdout, sys.stderr)
+            sys.stdout = _RoutedStream(sys.stdout)  # type: ignore[assignment]
+            sys.stderr = _RoutedStream(sys.stderr)  # type: ignore[assignment]
+        _active_captures.append(capture)
+
+    token = _current_log_capture.set(capture)
+    try:
+        yield capture
+    finally:
+        _current_log_capture.reset(token)
+
+        with _redirect_lock:
+            _active_captures.remove(capture)
+            if not _active_captures and _redirected_streams is not None:
+                sys.stdout, sys.stderr = _redirected_streams
+                _redirected_streams = None
@@ -0,0 +1,23 @@
+from typing import Optional, Sequence, TypeVar
+
+from chat2edit.models import ExemplaryExecutionBlock
+
+BlockT = TypeVar("BlockT", bound=ExemplaryExecutionBlock)
+
+
+def get_outcome_block(blocks: Sequence[BlockT]) -> Optional[BlockT]:
+    """
+    Return the executed block whose feedback, response or error ends the cycle.
+
+    Blocks run concurrently with the one that stopped the cycle may have run
+    after it, so this is the first executed block with an outcome, falling back
+    to the last executed block.
+    """
+    executed_blocks = [block for block in blocks if block.executed]
+
+    for block in executed_blocks:
+        # Exemplary blocks have no error field
+        if block.feedback or block.response or getattr(block, "error", None):
+            return block
+
+    return executed_blocks[-1] if executed_blocks else None
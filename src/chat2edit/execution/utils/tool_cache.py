@@ -0,0 +1,181 @@
+import os
+import pickle
+import threading
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple, Union
+
+from chat2edit.execution.utils.tool_cache_stats import ToolCacheStats
+
+_tool_caches: Dict[str, "ToolCache"] = {}
+_tool_caches_lock = threading.Lock()
+
+
+class ToolCache:
+    """
+    Bounded LRU of tool results keyed by argument fingerprints.
+
+    Entries evicted from memory are pickled to `spill_dir` when one is given and
+    loaded back on a later miss, so results survive across sessions and
+    processes. Spilled entries are kept per `version`, which should change with
+    the tool's code so a redeployed tool does not serve results of the old one.
+    The spill directory is pruned oldest first once it exceeds `max_spill_bytes`.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        max_size: int = 128,
+        spill_dir: Optional[Union[str, os.PathLike]] = None,
+        max_spill_bytes: Optional[int] = None,
+        version: Optional[str] = None,
+    ) -> None:
+        self._name = name
+        self._max_size = max_size
+        self._spill_dir = (
+            Path(spill_dir) / (f"{name}-{version}" if version else name)
+            if spill_dir is not None
+            else None
+        )
+        self._max_spill_bytes = max_spill_bytes
+        self._entries: "OrderedDict[str, Any]" = OrderedDict()
+        self._stats = ToolCacheStats()
+        self._lock = threading.Lock()
+
+        with _tool_caches_lock:
+            _tool_caches[name] = self
+
+    @property
+    def name(self) -> str:
+        return self._name
+
+    def get(self, key: str) -> Tuple[bool, Any]:
+        with self._lock:
+            if key in self._entries:
+                self._stats.hits += 1
+                self._entries.move_to_end(key)
+                return True, self._entries[key]
+
+        found, value = self._read_spilled(key)
+
+        with self._lock:
+            if not found:
+                self._stats.misses += 1
+                return False, None
+
+            self._stats.hits += 1
+            self._stats.disk_hits += 1
+            evicted = self._store(key, value)
+
+        self._spill_evicted(evicted)
+        return True, value
+
+    def put(self, key: str, value: Any) -> None:
+        with self._lock:
+            evicted = self._store(key, value)
+
+        self._spill_evicted(evicted)
+
+    def record_uncacheable(self) -> None:
+        with self._lock:
+            self._stats.uncacheable += 1
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def get_stats(self) -> ToolCacheStats:
+        with self._lock:
+            stats = self._stats.model_copy()
+            stats.size = len(self._entries)
+            return stats
+
+    def _store(self, key: str, value: Any) -> List[Tuple[str, Any]]:
+        self._entries[key] = value
+        self._entries.move_to_end(key)
+        evicted = []
+
+        while len(self._entries) > self._max_size:
+            evicted.append(self._entries.popitem(last=False))
+            self._stats.evictions += 1
+
+        return evicted
+
+    def _spill_evicted(self, evicted: List[Tuple[str, Any]]) -> None:
+        # Runs after the lock is released, so lookups never wait on pickling or disk I/O
+        spilled = sum(self._spill(key, value) for key, value in evicted)
+        if spilled:
+            with self._lock:
+                self._stats.spills += spilled
+
+    def _get_spill_path(self, key: str) -> Optional[Path]:
+        return self._spill_dir / key if self._spill_dir is not None else None
+
+    def _spill(self, key: str, value: Any) -> bool:
+        path = self._get_spill_path(key)
+        if path is None or path.exists():
+            return False
+
+        try:
+            data = pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL)
+        except Exception:
+            return False
+
+        path.parent.mkdir(parents=True, exist_ok=True)
+        temp_path = path.with_name(f"{path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+        temp_path.write_bytes(data)
+        os.replace(temp_path, path)
+
+        self._prune_spilled()
+        return True
+
+    def _read_spilled(self, key: str) -> Tuple[bool, Any]:
+        path = self._get_spill_path(key)
+        if path is None:
+            return False, None
+
+        try:
+            data = path.read_bytes()
+        except FileNotFoundError:
+            return False, None
+
+        try:
+            value = pickle.loads(data)
+        except Exception:
+            path.unlink(missing_ok=True)
+            return False, None
+
+        # Pruning goes by modification time, so refresh it to keep reused entries
+        os.utime(path)
+        return True, value
+
+    def _prune_spilled(self) -> None:
+        if self._max_spill_bytes is None or self._spill_dir is None:
+            return
+
+        files = []
+
+        for entry in os.scandir(self._spill_dir):
+            try:
+                if entry.is_file():
+                    files.append((entry.path, entry.stat()))
+            except FileNotFoundError:
+                # Removed by a concurrent prune
+                continue
+
+        total = sum(stat.st_size for _, stat in files)
+
+        for path, stat in sorted(files, key=lambda file: file[1].st_mtime):
+            if total <= self._max_spill_bytes:
+                break
+
+            total -= stat.st_size
+            Path(path).unlink(missing_ok=True)
+
+
+def get_tool_cache_stats() -> Dict[str, ToolCacheStats]:
+    """Return the statistics of every tool cache, keyed by tool name."""
+    with _tool_caches_lock:
+        caches = list(_tool_caches.values())
+
+    return {cache.name: cache.get_stats() for cache in caches}
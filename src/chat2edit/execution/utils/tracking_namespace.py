@@ -0,0 +1,96 @@
+from typing import Any, Container, Dict, Set
+
+
+class TrackingNamespace(Dict[str, Any]):
+    """
+    Dict that records the keys written and deleted since the last reset.
+
+    Top-level block code stores names through `__setitem__` when its globals
+    are a dict subclass, so every assignment, import, definition and `del`
+    is recorded as it happens and merging a block's effects costs only as much
+    as the block changed. Functions storing through a `global` statement bypass
+    `__setitem__`; new keys added that way are picked up by a size check.
+    """
+
+    def __init__(self, *args: Any, **kwargs: Any) -> None:
+        super().__init__(*args, **kwargs)
+        self._written: Set[str] = set()
+        self._deleted: Set[str] = set()
+        self._base_size = len(self)
+        self._size_delta = 0
+
+    def __setitem__(self, key: str, value: Any) -> None:
+        if key not in self:
+            self._size_delta += 1
+        super().__setitem__(key, value)
+        self._written.add(key)
+        self._deleted.discard(key)
+
+    def __delitem__(self, key: str) -> None:
+        super().__delitem__(key)
+        self._size_delta -= 1
+        self._deleted.add(key)
+        self._written.discard(key)
+
+    def __ior__(self, other: Any) -> "TrackingNamespace":  # type: ignore[override]
+        self.update(other)
+        return self
+
+    def pop(self, key: str, *default: Any) -> Any:
+        if key in self:
+            value = self[key]
+            del self[key]
+            return value
+
+        return super().pop(key, *default)
+
+    def popitem(self) -> Any:
+        key, value = super().popitem()
+        self._size_delta -= 1
+        self._deleted.add(key)
+        self._written.discard(key)
+        return key, value
+
+    def setdefault(self, key: str, default: Any = None) -> Any:
+        if key not in self:
+            self[key] = default
+
+        return self[key]
+
+    def update(self, *args: Any, **kwargs: Any) -> None:
+        for key, value in dict(*args, **kwargs).items():
+            self[key] = value
+
+    def clear(self) -> None:
+        for key in list(self):
+            del self[key]
+
+    def reset_changes(self) -> None:
+        self._written.clear()
+        self._deleted.clear()
+        self._base_size = len(self)
+        self._size_delta = 0
+
+    def get_written(self) -> Set[str]:
+        return {key for key in self._written if key in self}
+
+    def get_deleted(self) -> Set[str]:
+        return set(self._deleted)
+
+    def apply_changes(self, target: Dict[str, Any], hidden: Container[str] = ()) -> None:
+        """Replay the recorded writes and deletes onto `target`, skipping `hidden` names."""
+        for key in self._deleted:
+            if key not in hidden:
+                target.pop(key, None)
+
+        target.update({key: self[key] for key in self._written if key not in hidden})
+
+        if len(self) != self._base_size + self._size_delta:
+            # Keys were added without going through __setitem__
+            target.update(
+                {
+                    key: value
+                    for key, value in self.items()
+                    if key not in target and key not in hidden
+                }
+            )
@@ -0,0 +1,19 @@
+from chat2edit.metrics.chat2edit_metrics import Chat2EditMetrics
+from chat2edit.metrics.impl.counter import Counter
+from chat2edit.metrics.impl.histogram import Histogram
+from chat2edit.metrics.metric import Metric
+from chat2edit.metrics.metric_family import MetricFamily
+from chat2edit.metrics.metric_sample import MetricSample
+from chat2edit.metrics.metrics_registry import MetricsRegistry
+from chat2edit.metrics.prometheus_exporter import PrometheusExporter
+
+__all__ = [
+    "Chat2EditMetrics",
+    "Counter",
+    "Histogram",
+    "Metric",
+    "MetricFamily",
+    "MetricSample",
+    "MetricsRegistry",
+    "PrometheusExporter",
+]
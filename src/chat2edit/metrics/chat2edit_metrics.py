@@ -0,0 +1,36 @@
+from typing import Optional
+
+from chat2edit.metrics.metrics_registry import MetricsRegistry
+
+COUNT_BUCKETS = (1, 2, 3, 4, 5, 8, 16)
+CHARS_BUCKETS = (1_000, 2_000, 4_000, 8_000, 16_000, 32_000, 64_000, 128_000, 256_000)
+
+
+class Chat2EditMetrics:
+    """The metrics recorded by `Chat2Edit`, registered on a shared registry."""
+
+    def __init__(self, registry: Optional[MetricsRegistry] = None) -> None:
+        self.registry = registry or MetricsRegistry()
+
+        self.requests = self.registry.counter("requests", "Generate calls", ["responded"])
+        self.cycles_per_request = self.registry.histogram(
+            "cycles_per_request", "Prompt cycles per generate call", buckets=COUNT_BUCKETS
+        )
+        self.exchanges_per_cycle = self.registry.histogram(
+            "exchanges_per_cycle", "LLM exchanges per prompt cycle", buckets=COUNT_BUCKETS
+        )
+        self.prompts = self.registry.counter("prompts", "Prompts sent to the LLM", ["kind"])
+        self.prompt_chars = self.registry.histogram(
+            "prompt_chars", "Characters per prompt", ["kind"], buckets=CHARS_BUCKETS
+        )
+        self.llm_latency = self.registry.histogram(
+            "llm_latency_seconds", "LLM call latency", ["model"]
+        )
+        self.llm_errors = self.registry.counter("llm_errors", "Failed LLM calls", ["model"])
+        self.block_execution_time = self.registry.histogram(
+            "block_execution_seconds", "Execution time per code block"
+        )
+        self.feedbacks = self.registry.counter("feedbacks", "Feedback by type", ["type"])
+        self.execution_errors = self.registry.counter(
+            "execution_errors", "Code blocks that raised an error"
+        )
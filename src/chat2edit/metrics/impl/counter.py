@@ -0,0 +1,32 @@
+from typing import Any, Dict, List
+
+from chat2edit.metrics.metric import LabelValues, Metric
+from chat2edit.metrics.metric_family import MetricFamily
+from chat2edit.metrics.metric_sample import MetricSample
+
+
+class Counter(Metric):
+    def inc(self, value: float = 1, **labels: Any) -> None:
+        if value < 0:
+            raise ValueError("Counters can only be incremented by non-negative values")
+
+        shard = self._get_shard()
+        key = self._get_label_values(labels)
+        shard[key] = shard.get(key, 0) + value
+
+    def _collect(self, shards: List[Dict[LabelValues, Any]]) -> MetricFamily:
+        totals: Dict[LabelValues, float] = {}
+
+        for shard in shards:
+            for key, value in shard.items():
+                totals[key] = totals.get(key, 0) + value
+
+        return MetricFamily(
+            name=self.name,
+            type="counter",
+            description=self.description,
+            samples=[
+                MetricSample(name=f"{self.name}_total", labels=self._get_labels(key), value=value)
+                for key, value in sorted(totals.items())
+            ],
+        )
@@ -0,0 +1,77 @@
+from bisect import bisect_left
+from typing import Any, Dict, List, Sequence
+
+from chat2edit.metrics.metric import LabelValues, Metric
+from chat2edit.metrics.metric_family import MetricFamily
+from chat2edit.metrics.metric_sample import MetricSample
+
+DEFAULT_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0)
+
+
+class Histogram(Metric):
+    def __init__(
+        self,
+        name: str,
+        description: str = "",
+        label_names: Sequence[str] = (),
+        buckets: Sequence[float] = DEFAULT_BUCKETS,
+    ) -> None:
+        super().__init__(name, description, label_names)
+        self.buckets = tuple(sorted(buckets))
+
+    def observe(self, value: float, **labels: Any) -> None:
+        shard = self._get_shard()
+        key = self._get_label_values(labels)
+        # Per-bucket counts followed by the running sum and count
+        state = shard.get(key)
+
+        if state is None:
+            state = shard[key] = [0] * (len(self.buckets) + 1) + [0.0, 0]
+
+        state[bisect_left(self.buckets, value)] += 1
+        state[-2] += value
+        state[-1] += 1
+
+    def _collect(self, shards: List[Dict[LabelValues, Any]]) -> MetricFamily:
+        totals: Dict[LabelValues, List[float]] = {}
+
+        for shard in shards:
+            for key, state in shard.items():
+                total = totals.setdefault(key, [0] * len(state))
+                for i, value in enumerate(list(state)):
+                    total[i] += value
+
+        samples: List[MetricSample] = []
+
+        for key, total in sorted(totals.items()):
+            labels = self._get_labels(key)
+            cumulative = 0.0
+
+            for bound, count in zip(self.buckets, total):
+                cumulative += count
+                samples.append(
+                    MetricSample(
+                        name=f"{self.name}_bucket",
+                        labels={**labels, "le": format_bound(bound)},
+                        value=cumulative,
+                    )
+                )
+
+            samples.append(
+                MetricSample(
+                    name=f"{self.name}_bucket", labels={**labels, "le": "+Inf"}, value=total[-1]
+                )
+            )
+            samples.append(MetricSample(name=f"{self.name}_sum", labels=labels, value=total[-2]))
+            samples.append(MetricSample(name=f"{self.name}_count", labels=labels, value=total[-1]))
+
+        return MetricFamily(
+            name=self.name,
+            type="histogram",
+            description=self.description,
+            samples=samples,
+        )
+
+
+def format_bound(bound: float) -> str:
+    return repr(float(bound))
@@ -0,0 +1,57 @@
+import threading
+from abc import ABC, abstractmethod
+from typing import Any, Dict, List, Sequence, Tuple
+
+from chat2edit.metrics.metric_family import MetricFamily
+
+LabelValues = Tuple[str, ...]
+
+
+class Metric(ABC):
+    """
+    Base class for metrics aggregated in per-thread shards.
+
+    Each thread writes only to its own shard, so recording takes no lock. The
+    shard list is guarded by a lock that is only taken the first time a thread
+    records and when shards are merged on collection.
+    """
+
+    def __init__(self, name: str, description: str = "", label_names: Sequence[str] = ()) -> None:
+        self.name = name
+        self.description = description
+        self.label_names = tuple(label_names)
+        self._local = threading.local()
+        self._shards: List[Dict[LabelValues, Any]] = []
+        self._shards_lock = threading.Lock()
+
+    def collect(self) -> MetricFamily:
+        with self._shards_lock:
+            shards = [dict(shard) for shard in self._shards]
+
+        return self._collect(shards)
+
+    def _get_shard(self) -> Dict[LabelValues, Any]:
+        shard = getattr(self._local, "shard", None)
+
+        if shard is None:
+            shard = self._local.shard = {}
+            with self._shards_lock:
+                self._shards.append(shard)
+
+        return shard  # type: ignore[no-any-return]
+
+    def _get_label_values(self, labels: Dict[str, Any]) -> LabelValues:
+        if not labels and not self.label_names:
+            return ()
+
+        if len(labels) != len(self.label_names):
+            raise ValueError(f"Metric {self.name} expects labels {list(self.label_names)}")
+
+        return tuple([str(labels[name]) for name in self.label_names])
+
+    def _get_labels(self, label_values: LabelValues) -> Dict[str, str]:
+        return dict(zip(self.label_names, label_values))
+
+    @abstractmethod
+    def _collect(self, shards: List[Dict[LabelValues, Any]]) -> MetricFamily:
+        pass
@@ -0,0 +1,12 @@
+from typing import List, Literal
+
+from pydantic import BaseModel, Field
+
+from chat2edit.metrics.metric_sample import MetricSample
+
+
+class MetricFamily(BaseModel):
+    name: str
+    type: Literal["counter", "histogram"]
+    description: str = Field(default="")
+    samples: List[MetricSample] = Field(default_factory=list)
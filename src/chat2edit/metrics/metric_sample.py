@@ -0,0 +1,9 @@
+from typing import Dict
+
+from pydantic import BaseModel, Field
+
+
+class MetricSample(BaseModel):
+    name: str
+    labels: Dict[str, str] = Field(default_factory=dict)
+    value: float
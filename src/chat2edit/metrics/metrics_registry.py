@@ -0,0 +1,52 @@
+import threading
+from typing import Dict, List, Sequence, Type, TypeVar
+
+from chat2edit.metrics.impl.counter import Counter
+from chat2edit.metrics.impl.histogram import DEFAULT_BUCKETS, Histogram
+from chat2edit.metrics.metric import Metric
+from chat2edit.metrics.metric_family import MetricFamily
+
+MetricT = TypeVar("MetricT", bound=Metric)
+
+
+class MetricsRegistry:
+    def __init__(self) -> None:
+        self._metrics: Dict[str, Metric] = {}
+        self._lock = threading.Lock()
+
+    def counter(self, name: str, description: str = "", label_names: Sequence[str] = ()) -> Counter:
+        return self._register(Counter, name, description, label_names)
+
+    def histogram(
+        self,
+        name: str,
+        description: str = "",
+        label_names: Sequence[str] = (),
+        buckets: Sequence[float] = DEFAULT_BUCKETS,
+    ) -> Histogram:
+        return self._register(Histogram, name, description, label_names, buckets=buckets)
+
+    def collect(self) -> List[MetricFamily]:
+        with self._lock:
+            metrics = list(self._metrics.values())
+
+        return [metric.collect() for metric in metrics]
+
+    def _register(
+        self,
+        metric_cls: Type[MetricT],
+        name: str,
+        description: str,
+        label_names: Sequence[str],
+        **kwargs,
+    ) -> MetricT:
+        with self._lock:
+            metric = self._metrics.get(name)
+
+            if metric is None:
+                metric = self._metrics[name] = metric_cls(name, description, label_names, **kwargs)
+
+            elif not isinstance(metric, metric_cls) or metric.label_names != tuple(label_names):
+                raise ValueError(f"Metric {name} is already registered with a different type")
+
+            return metric
@@ -0,0 +1,68 @@
+import math
+from typing import Dict, List
+
+from chat2edit.metrics.metric_family import MetricFamily
+from chat2edit.metrics.metrics_registry import MetricsRegistry
+
+CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+
+class PrometheusExporter:
+    """Renders a registry in the Prometheus text exposition format."""
+
+    def __init__(self, registry: MetricsRegistry, namespace: str = "chat2edit") -> None:
+        self._registry = registry
+        self._namespace = namespace
+
+    def export(self) -> str:
+        return "".join(self._format_family(family) for family in self._registry.collect())
+
+    def _format_family(self, family: MetricFamily) -> str:
+        name = self._get_name(family.name)
+        if family.type == "counter":
+            name = f"{name}_total"
+        lines: List[str] = []
+
+        if family.description:
+            lines.append(f"# HELP {name} {escape_help(family.description)}")
+
+        lines.append(f"# TYPE {name} {family.type}")
+
+        for sample in family.samples:
+            sample_name = self._get_name(sample.name)
+            lines.append(
+                f"{sample_name}{format_labels(sample.labels)} {format_value(sample.value)}"
+            )
+
+        return "\n".join(lines) + "\n"
+
+    def _get_name(self, name: str) -> str:
+        return f"{self._namespace}_{name}" if self._namespace else name
+
+
+def escape_help(text: str) -> str:
+    return text.replace("\\", "\\\\").replace("\n", "\\n")
+
+
+def escape_label_value(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def format_labels(labels: Dict[str, str]) -> str:
+    if not labels:
+        return ""
+
+    return "{" + ",".join(f'{k}="{escape_label_value(v)}"' for k, v in labels.items()) + "}"
+
+
+def format_value(value: float) -> str:
+    if math.isnan(value):
+        return "NaN"
+
+    if math.isinf(value):
+        return "+Inf" if value > 0 else "-Inf"
+
+    if value == int(value):
+        return str(int(value))
+
+    return repr(value)
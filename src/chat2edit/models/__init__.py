@@ -1,13 +1,15 @@
 from chat2edit.models.chat_cycle import ChatCycle
 from chat2edit.models.execution_block import ExecutionBlock
 from chat2edit.models.execution_error import ExecutionError
+from chat2edit.models.execution_profile import ExecutionProfile
+from chat2edit.models.exemplar import Exemplar
 from chat2edit.models.exemplary_chat_cycle import ExemplaryChatCycle
 from chat2edit.models.exemplary_execution_block import ExemplaryExecutionBlock
 from chat2edit.models.exemplary_prompt_cycle import ExemplaryPromptCycle
 from chat2edit.models.exemplary_prompt_exchange import ExemplaryPromptExchange
-from chat2edit.models.exemplar import Exemplar
 from chat2edit.models.feedback import Feedback
 from chat2edit.models.message import Message
+from chat2edit.models.profiled_function import ProfiledFunction
 from chat2edit.models.prompt_cycle import PromptCycle
 from chat2edit.models.prompt_exchange import PromptExchange
 
@@ -15,6 +17,7 @@ __all__ = [
     "ChatCycle",
     "ExecutionBlock",
     "ExecutionError",
+    "ExecutionProfile",
     "Exemplar",
     "ExemplaryChatCycle",
     "ExemplaryExecutionBlock",
@@ -24,4 +27,5 @@ __all__ = [
     "Feedback",
     "PromptCycle",
     "PromptExchange",
+    "ProfiledFunction",
 ]
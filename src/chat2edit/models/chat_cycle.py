@@ -1,4 +1,4 @@
-from typing import List
+from typing import List, Optional
 
 from pydantic import BaseModel, Field
 
@@ -9,3 +9,9 @@ from chat2edit.models.prompt_cycle import PromptCycle
 class ChatCycle(BaseModel):
     request: Message
     cycles: List[PromptCycle] = Field(default_factory=list)
+    start_time: Optional[int] = Field(default=None)
+    end_time: Optional[int] = Field(default=None)
+    execution_time: int = Field(default=0)  # Nanoseconds spent executing code blocks
+    # Why generation stopped: "response", "error", "no_code", "max_prompt_cycles",
+    # "deadline" or "insufficient_budget"
+    stop_reason: Optional[str] = Field(default=None)
@@ -3,6 +3,7 @@ from typing import List, Optional
 from pydantic import Field
 
 from chat2edit.models.execution_error import ExecutionError
+from chat2edit.models.execution_profile import ExecutionProfile
 from chat2edit.models.exemplary_execution_block import ExemplaryExecutionBlock
 
 
@@ -12,4 +13,5 @@ class ExecutionBlock(ExemplaryExecutionBlock):
     logs: List[str] = Field(default_factory=list)
     executed: bool = Field(default=False)
     start_time: Optional[int] = Field(default=None)
-    end_time: Optional[int] = Field(default=None)
\ No newline at end of file
+    end_time: Optional[int] = Field(default=None)
+    profile: Optional[ExecutionProfile] = Field(default=None)
@@ -0,0 +1,14 @@
+from typing import List, Optional
+
+from pydantic import BaseModel, Field
+
+from chat2edit.models.profiled_function import ProfiledFunction
+
+
+class ExecutionProfile(BaseModel):
+    functions: List[ProfiledFunction] = Field(
+        default_factory=list
+    )  # Top functions by cumulative time
+    total_calls: Optional[int] = Field(default=None)
+    peak_memory: Optional[int] = Field(default=None)  # Bytes above the allocations at block start
+    allocated_memory: Optional[int] = Field(default=None)  # Net bytes still allocated at block end
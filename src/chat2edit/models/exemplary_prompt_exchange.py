@@ -7,3 +7,5 @@ from chat2edit.models.message import Message
 
 class ExemplaryPromptExchange(BaseModel):
     answer: Optional[Message] = Field(default=None)
+    # Thinking parsed from the answer, filled in the first time the answer is rendered
+    thinking: Optional[str] = Field(default=None)
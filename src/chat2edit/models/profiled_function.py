@@ -0,0 +1,10 @@
+from pydantic import BaseModel
+
+
+class ProfiledFunction(BaseModel):
+    name: str
+    filename: str
+    line: int
+    calls: int
+    total_time: float  # Seconds spent in the function itself
+    cumulative_time: float  # Seconds including callees
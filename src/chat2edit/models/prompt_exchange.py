@@ -11,3 +11,8 @@ class PromptExchange(ExemplaryPromptExchange):
     prompt: Message
     error: Optional[PromptError] = Field(default=None)
     code: Optional[str] = Field(default=None)
+    # Candidate answers raced for this exchange, the position of the chosen one among
+    # the answers received and the nanoseconds until it arrived
+    candidates: int = Field(default=1)
+    chosen_candidate: Optional[int] = Field(default=None)
+    race_time: Optional[int] = Field(default=None)
@@ -0,0 +1,4 @@
+from chat2edit.prompting.artifacts.fingerprint import fingerprint_prompt_inputs
+from chat2edit.prompting.artifacts.prompt_artifact import ARTIFACT_VERSION, PromptArtifact
+
+__all__ = ["ARTIFACT_VERSION", "PromptArtifact", "fingerprint_prompt_inputs"]
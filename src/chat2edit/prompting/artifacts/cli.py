@@ -0,0 +1,61 @@
+"""
+Render the static prompt sections of a context provider into a prompt artifact.
+
+Workers configured with `prompt_artifact_path` load the artifact at startup
+instead of generating stubs and rendering exemplars on their first prompt.
+
+Usage: chat2edit-prompt-artifact my_app.providers:EditorContextProvider -o prompt.json
+"""
+
+import argparse
+import importlib
+from typing import Any, List, Optional
+
+
+def load_object(spec: str) -> Any:
+    module_name, _, attr = spec.partition(":")
+    if not module_name or not attr:
+        raise ValueError(f"Expected an import path of the form module:attr, got {spec!r}")
+
+    obj = importlib.import_module(module_name)
+    for name in attr.split("."):
+        obj = getattr(obj, name)
+
+    return obj
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    parser = argparse.ArgumentParser(
+        prog="chat2edit-prompt-artifact", description=__doc__.strip().splitlines()[0]
+    )
+    parser.add_argument("context_provider", help="context provider class, as module:Class")
+    parser.add_argument("--prompting-strategy", default=None, help="module:Class")
+    parser.add_argument("--context-strategy", default=None, help="module:Class")
+    parser.add_argument("-o", "--output", default="prompt_artifact.json")
+    args = parser.parse_args(argv)
+
+    from chat2edit import Chat2Edit
+
+    try:
+        chat2edit = Chat2Edit(
+            context_provider=load_object(args.context_provider)(),
+            prompting_strategy=(
+                load_object(args.prompting_strategy)() if args.prompting_strategy else None
+            ),
+            context_strategy=(
+                load_object(args.context_strategy)() if args.context_strategy else None
+            ),
+        )
+    except (ImportError, AttributeError, ValueError) as e:
+        parser.error(str(e))
+
+    artifact = chat2edit.create_prompt_artifact()
+    if not artifact.sections:
+        parser.error("The prompting strategy does not support prompt artifacts")
+
+    artifact.save(args.output)
+    print(f"Wrote prompt artifact {artifact.fingerprint[:12]} to {args.output}")
+
+
+if __name__ == "__main__":
+    main()
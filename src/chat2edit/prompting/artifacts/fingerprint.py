@@ -0,0 +1,76 @@
+import hashlib
+import inspect
+import json
+from importlib import metadata
+from typing import Any, Dict, Iterable, List
+
+from chat2edit.context.utils import fingerprint_value
+from chat2edit.models import Exemplar
+from chat2edit.prompting.artifacts.prompt_artifact import ARTIFACT_VERSION
+from chat2edit.utils import hash_source_file
+
+
+def fingerprint_prompt_inputs(
+    context: Dict[str, Any],
+    exemplars: List[Exemplar],
+    components: Iterable[Any] = (),
+) -> str:
+    """
+    Digest everything the static prompt sections are rendered from.
+
+    Classes, functions and modules in the context are identified by their
+    import path and the content of the file defining them rather than by their
+    rendering, so checking an artifact costs a few file reads instead of a
+    stub generation. `components` are the strategies doing the rendering.
+    """
+    hasher = hashlib.sha256()
+    hasher.update(f"v{ARTIFACT_VERSION};{get_package_version()};".encode())
+
+    for component in components:
+        hasher.update(f"c{describe_object(type(component))};".encode())
+
+    for key in sorted(context):
+        hasher.update(f"k{key}={describe_object(context[key])};".encode())
+
+    for exemplar in exemplars:
+        fields = strip_timestamps(exemplar.model_dump(mode="json"))
+        hasher.update(f"e{json.dumps(fields, sort_keys=True, default=repr)};".encode())
+
+    return hasher.hexdigest()
+
+
+def describe_object(obj: Any) -> str:
+    if inspect.ismodule(obj):
+        return f"module {obj.__name__} {hash_source_file(getattr(obj, '__file__', None))}"
+
+    if inspect.isclass(obj) or inspect.isroutine(obj):
+        target = obj if inspect.isclass(obj) else inspect.unwrap(obj)
+        try:
+            path = inspect.getsourcefile(target)
+        except TypeError:
+            path = None
+
+        # The name is included as well since decorators such as `alias` rename objects
+        name = f"{getattr(obj, '__module__', None)}.{getattr(obj, '__qualname__', None)}"
+        return f"object {name} {getattr(obj, '__name__', None)} {hash_source_file(path)}"
+
+    try:
+        return f"value {describe_object(type(obj))} {fingerprint_value(obj)}"
+    except TypeError:
+        return f"value {describe_object(type(obj))}"
+
+
+def strip_timestamps(value: Any) -> Any:
+    # Timestamps are set on construction and differ between processes
+    if isinstance(value, dict):
+        return {k: strip_timestamps(v) for k, v in value.items() if k != "timestamp"}
+    if isinstance(value, list):
+        return [strip_timestamps(item) for item in value]
+    return value
+
+
+def get_package_version() -> str:
+    try:
+        return metadata.version("chat2edit")
+    except metadata.PackageNotFoundError:
+        return "unknown"
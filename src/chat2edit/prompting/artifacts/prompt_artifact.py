@@ -0,0 +1,37 @@
+import os
+from pathlib import Path
+from typing import Dict, Optional, Union
+
+from pydantic import BaseModel, Field, ValidationError
+
+# Bumped whenever the artifact layout or the way sections are rendered changes
+ARTIFACT_VERSION = 1
+
+
+class PromptArtifact(BaseModel):
+    """
+    Prompt sections rendered ahead of time, keyed by the prompting strategy's
+    section names. The fingerprint identifies the inputs they were rendered
+    from, so a stale artifact is detected instead of served.
+    """
+
+    version: int = Field(default=ARTIFACT_VERSION)
+    fingerprint: str
+    sections: Dict[str, str] = Field(default_factory=dict)
+
+    def save(self, path: Union[str, os.PathLike]) -> None:
+        path = Path(path)
+        temp_path = path.with_suffix(path.suffix + ".tmp")
+        temp_path.write_text(self.model_dump_json(indent=2), encoding="utf-8")
+        # Replace atomically so workers starting meanwhile never read a partial artifact
+        os.replace(temp_path, path)
+
+    @classmethod
+    def load(cls, path: Union[str, os.PathLike]) -> Optional["PromptArtifact"]:
+        """Read an artifact, returning None when it is missing, invalid or of another version."""
+        try:
+            artifact = cls.model_validate_json(Path(path).read_bytes())
+        except (OSError, ValidationError):
+            return None
+
+        return artifact if artifact.version == ARTIFACT_VERSION else None
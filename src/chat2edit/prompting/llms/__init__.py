@@ -1,5 +1,19 @@
-from chat2edit.prompting.llms.impl.google_llm import GoogleLlm
-from chat2edit.prompting.llms.impl.openai_llm import OpenAILlm
+from typing import TYPE_CHECKING
+
 from chat2edit.prompting.llms.llm import Llm
+from chat2edit.utils import create_lazy_getattr
+
+if TYPE_CHECKING:
+    from chat2edit.prompting.llms.impl.google_llm import GoogleLlm
+    from chat2edit.prompting.llms.impl.openai_llm import OpenAILlm
+
+# Backends pull in their provider SDKs, so they are only imported when first used
+__getattr__ = create_lazy_getattr(
+    __name__,
+    {
+        "GoogleLlm": "chat2edit.prompting.llms.impl.google_llm",
+        "OpenAILlm": "chat2edit.prompting.llms.impl.openai_llm",
+    },
+)
 
 __all__ = ["GoogleLlm", "OpenAILlm", "Llm"]
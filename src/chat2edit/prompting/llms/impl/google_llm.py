@@ -1,5 +1,5 @@
 import os
-from typing import Any, Dict, Iterable, List, Optional, Tuple
+from typing import Any, AsyncIterator, Dict, Iterable, List, Optional, Tuple
 
 import google.generativeai as genai  # type: ignore[import-untyped, unused-ignore]
 from google.generativeai import GenerationConfig  # type: ignore[import-untyped, unused-ignore]
@@ -64,6 +64,23 @@ class GoogleLlm(Llm):
         response = await chat_session.send_message_async(prompt.text)
         return Message(text=response.text)
 
+    async def generate_stream(
+        self, prompt: Message, history: List[Tuple[Message, Message]]
+    ) -> AsyncIterator[str]:
+        input_history = self._create_input_history(history)
+        chat_session = self._model.start_chat(history=input_history)
+        response = await chat_session.send_message_async(prompt.text, stream=True)
+
+        async for chunk in response:
+            try:
+                text = chunk.text
+            except ValueError:
+                # Chunks without text parts, e.g. carrying only safety ratings
+                continue
+
+            if text:
+                yield text
+
     def get_info(self) -> Dict[str, Any]:
         return {
             "model": self._model.model_name,
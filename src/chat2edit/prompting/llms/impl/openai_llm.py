@@ -1,5 +1,5 @@
 import os
-from typing import Any, Dict, Iterable, List, Optional, Tuple
+from typing import Any, AsyncIterator, Dict, Iterable, List, Optional, Tuple
 
 import openai
 
@@ -43,6 +43,41 @@ class OpenAILlm(Llm):
 
         return Message(text=response.choices[0].message.content)
 
+    async def generate_candidates(
+        self, prompt: Message, history: List[Tuple[Message, Message]], num_candidates: int
+    ) -> AsyncIterator[Message]:
+        # One request sampling all candidates costs a single round trip and prompt
+        response = await openai.ChatCompletion.acreate(
+            messages=self._create_messages(prompt, history),
+            model=self._model,
+            max_tokens=self._max_tokens,
+            temperature=self._temperature,
+            stop=self._stop,
+            top_p=self._top_p,
+            n=num_candidates,
+        )
+
+        for choice in response.choices:
+            yield Message(text=choice.message.content)
+
+    async def generate_stream(
+        self, prompt: Message, history: List[Tuple[Message, Message]]
+    ) -> AsyncIterator[str]:
+        response = await openai.ChatCompletion.acreate(
+            messages=self._create_messages(prompt, history),
+            model=self._model,
+            max_tokens=self._max_tokens,
+            temperature=self._temperature,
+            stop=self._stop,
+            top_p=self._top_p,
+            stream=True,
+        )
+
+        async for chunk in response:
+            delta = chunk["choices"][0]["delta"].get("content")
+            if delta:
+                yield delta
+
     def get_info(self) -> Dict[str, Any]:
         return {
             "model": self._model,
@@ -1,5 +1,6 @@
+import asyncio
 from abc import ABC, abstractmethod
-from typing import Any, Dict, List, Tuple
+from typing import Any, AsyncIterator, Dict, List, Optional, Tuple
 
 from chat2edit.models import Message
 
@@ -9,6 +10,49 @@ class Llm(ABC):
     async def generate(self, prompt: Message, history: List[Tuple[Message, Message]]) -> Message:
         pass
 
+    async def generate_stream(
+        self, prompt: Message, history: List[Tuple[Message, Message]]
+    ) -> AsyncIterator[str]:
+        """Yield the answer in text deltas, by default all at once."""
+        answer = await self.generate(prompt, history)
+        yield answer.text
+
+    async def generate_candidates(
+        self, prompt: Message, history: List[Tuple[Message, Message]], num_candidates: int
+    ) -> AsyncIterator[Message]:
+        """
+        Yield independent answers to the same prompt in the order they arrive.
+
+        By default the answers are requested concurrently. Requests still pending
+        when the consumer stops iterating are cancelled. Failed requests are skipped
+        unless every request fails.
+        """
+        tasks = [
+            asyncio.ensure_future(self.generate(prompt, history)) for _ in range(num_candidates)
+        ]
+        error: Optional[BaseException] = None
+        answered = False
+
+        try:
+            for next_done in asyncio.as_completed(tasks):
+                try:
+                    answer = await next_done
+                except Exception as e:
+                    error = e
+                    continue
+
+                answered = True
+                yield answer
+
+            if not answered and error is not None:
+                raise error
+
+        finally:
+            for task in tasks:
+                task.cancel()
+
+            await asyncio.gather(*tasks, return_exceptions=True)
+
     @abstractmethod
     def get_info(self) -> Dict[str, Any]:
         pass
@@ -1,6 +1,16 @@
-from chat2edit.prompting.strategies.impl.otc_prompting_strategy import (
-    OtcPromptingStrategy,
-)
+from typing import TYPE_CHECKING
+
 from chat2edit.prompting.strategies.prompting_strategy import PromptingStrategy
+from chat2edit.utils import create_lazy_getattr
+
+if TYPE_CHECKING:
+    from chat2edit.prompting.strategies.impl.otc_prompting_strategy import (
+        OtcPromptingStrategy,
+    )
+
+__getattr__ = create_lazy_getattr(
+    __name__,
+    {"OtcPromptingStrategy": "chat2edit.prompting.strategies.impl.otc_prompting_strategy"},
+)
 
 __all__ = ["OtcPromptingStrategy", "PromptingStrategy"]
@@ -1,6 +1,9 @@
 import re
+import weakref
+from collections import OrderedDict
 from typing import Any, Dict, List, Optional, Tuple, Union
 
+from chat2edit.execution.utils import get_outcome_block
 from chat2edit.models import (
     ChatCycle,
     Exemplar,
@@ -83,15 +86,53 @@ MISMATCH_LIST_PARAMETERS_FEEDBACK_TEXT_TEMPLATE = (
 MISSING_ALL_OPTIONAL_PARAMETERS_FEEDBACK_TEXT_TEMPLATE = (
     "In function `{function}`, all optional parameters are missing: {params_str}."
 )
+EXECUTION_TIMEOUT_FEEDBACK_TEXT_TEMPLATE = (
+    "The commands were stopped after exceeding the {scope} time limit of {timeout} seconds. "
+    "Use fewer or cheaper operations."
+)
+DEADLINE_FEEDBACK_TEXT = (
+    "The commands were stopped because the request ran out of time. "
+    "Use fewer or cheaper operations."
+)
+
+
+# Names of the sections create_prompt_sections renders
+CONTEXT_CODE_SECTION = "context_code"
+EXEMPLARY_OTC_SEQUENCES_SECTION = "exemplary_otc_sequences"
+
+# Finished cycles whose rendered OTC sequences are kept for later prompts
+RENDERED_CYCLES_CACHE_SIZE = 1024
 
 
 class OtcPromptingStrategy(PromptingStrategy):
+    def __init__(self, *, rendered_cycles_cache_size: int = RENDERED_CYCLES_CACHE_SIZE) -> None:
+        self._rendered_cycles_cache_size = rendered_cycles_cache_size
+        # Keyed by identity, a weak reference to the cycle tells a reused id apart from it
+        self._rendered_cycles: "OrderedDict[int, Tuple[weakref.ref, str]]" = OrderedDict()
+        self._prompt_sections: Optional[Dict[str, str]] = None
+
     def create_prompt(
         self,
         cycles: List[ChatCycle],
         exemplars: List[Exemplar],
         context: Dict[str, Any],
     ) -> Message:
+        sections = self._prompt_sections or self.create_prompt_sections(exemplars, context)
+        current_otc_sequences = "\n".join(map(self.create_otc_sequence, cycles))
+
+        return Message(
+            text=OTC_PROMPT_TEMPLATE.format(
+                context_code=sections[CONTEXT_CODE_SECTION],
+                exemplary_otc_sequences=sections[EXEMPLARY_OTC_SEQUENCES_SECTION],
+                current_otc_sequences=current_otc_sequences,
+            )
+        )
+
+    def create_prompt_sections(
+        self,
+        exemplars: List[Exemplar],
+        context: Dict[str, Any],
+    ) -> Dict[str, str]:
         prompting_context = self.filter_context(context)
         context_code = self.create_context_code(prompting_context)
 
@@ -100,15 +141,17 @@ class OtcPromptingStrategy(PromptingStrategy):
             for idx, exemplar in enumerate(exemplars)
         )
 
-        current_otc_sequences = "\n".join(map(self.create_otc_sequence, cycles))
+        return {
+            CONTEXT_CODE_SECTION: context_code,
+            EXEMPLARY_OTC_SEQUENCES_SECTION: exemplary_otc_sequences,
+        }
 
-        return Message(
-            text=OTC_PROMPT_TEMPLATE.format(
-                context_code=context_code,
-                exemplary_otc_sequences=exemplary_otc_sequences,
-                current_otc_sequences=current_otc_sequences,
-            )
-        )
+    def load_prompt_sections(self, sections: Dict[str, str]) -> bool:
+        if not {CONTEXT_CODE_SECTION, EXEMPLARY_OTC_SEQUENCES_SECTION}.issubset(sections):
+            return False
+
+        self._prompt_sections = dict(sections)
+        return True
 
     def get_refine_prompt(self) -> Message:
         return Message(text=OTC_REFINE_PROMPT)
@@ -128,17 +171,45 @@ class OtcPromptingStrategy(PromptingStrategy):
         return code_stub.generate()
 
     def create_otc_sequence(self, cycle: Union[ChatCycle, ExemplaryChatCycle]) -> str:
+        """
+        Render a cycle as OTC sequences.
+
+        Exemplary cycles and chat cycles that have ended never change, so their
+        rendering is cached and later prompts only render the cycles added since.
+        """
+        if isinstance(cycle, ChatCycle) and cycle.end_time is None:
+            return self._render_otc_sequence(cycle)
+
+        entry = self._rendered_cycles.get(id(cycle))
+        if entry is not None and entry[0]() is cycle:
+            self._rendered_cycles.move_to_end(id(cycle))
+            return entry[1]
+
+        sequence = self._render_otc_sequence(cycle)
+        self._rendered_cycles[id(cycle)] = (weakref.ref(cycle), sequence)
+        if len(self._rendered_cycles) > self._rendered_cycles_cache_size:
+            self._rendered_cycles.popitem(last=False)
+
+        return sequence
+
+    def _render_otc_sequence(self, cycle: Union[ChatCycle, ExemplaryChatCycle]) -> str:
         sequences = []
         observation = self.create_observation_from_request(cycle.request)
+        prompt_cycle = None
 
         for prompt_cycle in cycle.cycles:
             if not prompt_cycle.exchanges or not prompt_cycle.exchanges[-1].answer:
                 continue
 
-            answer = prompt_cycle.exchanges[-1].answer
-            thinking, _ = self.extract_thinking_commands(answer.text)
-
             executed_blocks = list(filter(lambda block: block.executed, prompt_cycle.blocks))
+            if not executed_blocks:
+                continue
+
+            exchange = prompt_cycle.exchanges[-1]
+            if exchange.thinking is None:
+                exchange.thinking, _ = self.extract_thinking_commands(exchange.answer.text)
+
+            thinking = exchange.thinking
             commands = "\n".join(map(lambda block: block.generated_code, executed_blocks))
 
             sequences.append(
@@ -147,11 +218,11 @@ class OtcPromptingStrategy(PromptingStrategy):
                 )
             )
 
-            last_executed_block = executed_blocks[-1]
-            if last_executed_block.feedback:
-                observation = self.create_observation_from_feedback(last_executed_block.feedback)
+            outcome_block = get_outcome_block(executed_blocks)
+            if outcome_block is not None and outcome_block.feedback:
+                observation = self.create_observation_from_feedback(outcome_block.feedback)
 
-        if not prompt_cycle.blocks or not prompt_cycle.blocks[-1].response:
+        if prompt_cycle is None or not prompt_cycle.blocks or not prompt_cycle.blocks[-1].response:
             sequences.append(INCOMPLETE_OTC_SEQUENCE_TEMPLATE.format(observation=observation))
 
         return "\n".join(sequences)
@@ -240,6 +311,15 @@ class OtcPromptingStrategy(PromptingStrategy):
                 function=feedback.function, params_str=params_str
             )
 
+        elif feedback_type == "execution_timeout" and details.get("scope") == "deadline":
+            return DEADLINE_FEEDBACK_TEXT
+
+        elif feedback_type == "execution_timeout":
+            return EXECUTION_TIMEOUT_FEEDBACK_TEXT_TEMPLATE.format(
+                scope=details.get("scope", "execution"),
+                timeout=details.get("timeout", ""),
+            )
+
         else:
             raise ValueError(f"Unknown feedback type: {feedback_type}")
 
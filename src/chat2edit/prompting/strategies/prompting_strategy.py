@@ -21,3 +21,15 @@ class PromptingStrategy(ABC):
     @abstractmethod
     def extract_code(self, text: str) -> Optional[str]:
         pass
+
+    def create_prompt_sections(
+        self,
+        exemplars: List[Exemplar],
+        context: Dict[str, Any],
+    ) -> Dict[str, str]:
+        """Render the prompt parts that depend only on the exemplars and the context provider."""
+        return {}
+
+    def load_prompt_sections(self, sections: Dict[str, str]) -> bool:
+        """Use prerendered prompt sections from now on, returning whether they were accepted."""
+        return False
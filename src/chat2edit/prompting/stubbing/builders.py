@@ -11,7 +11,7 @@ from chat2edit.prompting.stubbing.stubs import (
     ImportInfo,
     ImportNodeType,
 )
-from chat2edit.prompting.stubbing.utils import get_node_doc
+from chat2edit.prompting.stubbing.utils import get_node_doc, unparse
 
 
 class ClassStubBuilder(ast.NodeVisitor):
@@ -22,8 +22,8 @@ class ClassStubBuilder(ast.NodeVisitor):
     def build(self, node: ast.ClassDef) -> ClassStub:
         self.stub = ClassStub(
             name=node.name,
-            bases=list(map(ast.unparse, node.bases)),
-            decorators=list(map(ast.unparse, node.decorator_list)),
+            bases=list(map(unparse, node.bases)),
+            decorators=list(map(unparse, node.decorator_list)),
             docstring=get_node_doc(node),
         )
         self.visit(node)
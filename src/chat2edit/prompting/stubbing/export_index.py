@@ -0,0 +1,78 @@
+import sys
+import threading
+from typing import Any, Dict, List
+
+
+class ExportIndex:
+    """
+    Reverse index from objects to the loaded modules exporting them under their own name.
+
+    The index is built on first use and extended with the modules imported
+    since the previous lookup. Entries are keyed by object id and confirmed
+    with an identity check on lookup, so rebinding an attribute or reusing an
+    id never yields a wrong module. The object's defining module and modules
+    with a `__getattr__` are always probed, as they can export an object
+    without it being in their namespace when indexed.
+    """
+
+    def __init__(self) -> None:
+        self._exporters: Dict[int, List[str]] = {}
+        # Module names mapped to the id of the module object indexed under them
+        self._indexed: Dict[str, int] = {}
+        self._dynamic: List[str] = []
+        self._num_modules = 0
+        self._lock = threading.Lock()
+
+    def get_exporters(self, obj: Any) -> List[str]:
+        """Return the names of loaded modules where `obj.__name__` resolves to `obj`."""
+        with self._lock:
+            if len(sys.modules) != self._num_modules:
+                self._update()
+
+            candidates = [*self._exporters.get(id(obj), []), *self._dynamic]
+
+        candidates.append(getattr(obj, "__module__", None))
+        exporters = []
+
+        for module_name in dict.fromkeys(candidates):
+            module = sys.modules.get(module_name) if isinstance(module_name, str) else None
+            if module is None:
+                continue
+
+            try:
+                exported = getattr(module, obj.__name__, None) is obj
+            except Exception:
+                # A module `__getattr__` may raise for names it deprecated or removed
+                continue
+
+            if exported:
+                exporters.append(module_name)
+
+        return exporters
+
+    def _update(self) -> None:
+        for module_name, module in list(sys.modules.items()):
+            if module is None or self._indexed.get(module_name) == id(module):
+                continue
+
+            self._indexed[module_name] = id(module)
+
+            try:
+                namespace = dict(vars(module))
+            except TypeError:
+                continue
+
+            if "__getattr__" in namespace:
+                self._dynamic.append(module_name)
+
+            for name, value in namespace.items():
+                try:
+                    value_name = getattr(value, "__name__", None)
+                except Exception:
+                    # Proxies and lazy objects may fail on any attribute access
+                    continue
+
+                if isinstance(value_name, str) and value_name == name:
+                    self._exporters.setdefault(id(value), []).append(module_name)
+
+        self._num_modules = len(sys.modules)
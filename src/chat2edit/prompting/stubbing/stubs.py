@@ -5,8 +5,6 @@ from dataclasses import dataclass, field
 from types import ModuleType
 from typing import Any, Callable, Dict, List, Optional, Tuple, Type, Union
 
-import black
-
 from chat2edit.prompting.stubbing.constants import (
     ATTRIBUTE_MAP_FUNCTION_KEY,
     ATTRIBUTE_TO_ALIAS_KEY,
@@ -26,16 +24,17 @@ from chat2edit.prompting.stubbing.constants import (
     METHOD_TO_ALIAS_KEY,
     PARAMETER_TO_ALIAS_KEY,
 )
-from chat2edit.prompting.stubbing.replacers import (
-    AttributeReplacer,
-    MethodReplacer,
-    ParameterReplacer,
-)
 from chat2edit.prompting.stubbing.utils import (
     find_shortest_import_path,
+    format_arguments,
+    format_docstring,
     get_ast_node,
     get_node_doc,
     is_external_package,
+    join_blocks,
+    rename_identifiers,
+    rename_parameters,
+    unparse,
 )
 
 ImportNodeType = Union[ast.Import, ast.ImportFrom]
@@ -88,13 +87,13 @@ class AssignInfo:
         if isinstance(node, ast.Assign):
             return cls(
                 target=list(map(ast.unparse, node.targets))[0],
-                value=ast.unparse(node.value),
+                value=unparse(node.value),
             )
 
         return cls(
             target=[ast.unparse(node.target)][0],
-            value=ast.unparse(node.value) if node.value else None,
-            annotation=ast.unparse(node.annotation),
+            value=unparse(node.value) if node.value else None,
+            annotation=unparse(node.annotation),
         )
 
     def __repr__(self) -> str:
@@ -123,17 +122,17 @@ class FunctionStub:
 
     @classmethod
     def from_node(cls, node: FunctionNodeType) -> "FunctionStub":
-        signature = f"({ast.unparse(node.args)})"
+        signature = f"({format_arguments(node.args)})"
 
         if node.returns:
-            signature += f" -> {ast.unparse(node.returns)}"
+            signature += f" -> {unparse(node.returns)}"
 
         return cls(
             name=node.name,
             signature=signature,
             coroutine=isinstance(node, ast.AsyncFunctionDef),
             docstring=get_node_doc(node),
-            decorators=list(map(ast.unparse, node.decorator_list)),
+            decorators=list(map(unparse, node.decorator_list)),
         )
 
     @classmethod
@@ -143,7 +142,7 @@ class FunctionStub:
         stub.function = func
         return stub
 
-    def generate(self, indent_spaces: int = 4) -> str:
+    def generate(self, indent_spaces: int = 4, name: Optional[str] = None) -> str:
         comment = getattr(self.function, COMMENT_KEY, None)
         dec_names = set(dec.split("(")[0] for dec in self.decorators)
         docstring = (
@@ -156,7 +155,9 @@ class FunctionStub:
             if self.function and hasattr(self.function, COROUTINE_EXCLUDED_KEY)
             else self.coroutine
         )
-        name = self.function.__name__ if self.function else self.name
+        if name is None:
+            name = self.function.__name__ if self.function else self.name
+
         signature = self.signature
 
         param_to_alias = getattr(self.function, PARAMETER_TO_ALIAS_KEY, None)
@@ -171,30 +172,26 @@ class FunctionStub:
 
         decorators = filter(lambda x: x.split("(")[0] in dec_names, self.decorators)
 
+        if param_to_alias:
+            signature = rename_parameters(signature, param_to_alias)
+
         stub = ""
 
         if comment:
             stub += f"# {comment}\n"
 
-        if decorators:
-            for dec in decorators:
-                stub += f"@{dec}\n"
+        for dec in decorators:
+            stub += f"@{dec}\n"
 
         if coroutine:
             stub += "async "
 
-        stub += f"def {name}{signature}: ..."
-
         if docstring:
-            stub += "\n"
-            indent = " " * indent_spaces
-
-            stub += textwrap.indent('"""\n', indent)
-            stub += textwrap.indent(f"{docstring}\n", indent)
-            stub += textwrap.indent('"""\n', indent)
-
-        if param_to_alias:
-            stub = ParameterReplacer.replace(stub, param_to_alias)
+            # The docstring is the body, so the definition needs no ellipsis
+            stub += f"def {name}{signature}:\n"
+            stub += format_docstring(docstring, " " * indent_spaces)
+        else:
+            stub += f"def {name}{signature}: ..."
 
         return stub
 
@@ -314,10 +311,6 @@ class ClassStub:
             if attr.target in attr_names and not attr.target.startswith("_")
         ]
 
-        if attr_map_func:
-            for attr in attributes:
-                attr.target = attr_map_func(attr.target)
-
         methods = [
             method
             for method in self.methods
@@ -332,47 +325,47 @@ class ClassStub:
                 except:
                     pass
 
-            if method_map_func:
-                method.name = method_map_func(method.name)
-
         stub = ""
         indent = " " * indent_spaces
 
-        if decorators:
-            for dec in decorators:
-                stub += f"@{dec}\n"
+        for dec in decorators:
+            stub += f"@{dec}\n"
 
         stub += f"class {name}"
 
         if bases:
             stub += f"({', '.join(bases)})"
 
-        stub += ":\n"
+        stub += ":"
 
         if docstring:
-            stub += textwrap.indent('"""\n', indent)
-            stub += textwrap.indent(f"{docstring}\n", indent)
-            stub += textwrap.indent('"""\n', indent)
+            stub += f"\n{format_docstring(docstring, indent)}"
 
         if not attributes and not methods:
-            stub += f"{indent}pass"
-            return stub
+            return f"{stub}\n{indent}pass"
 
-        if attributes:
-            stub += textwrap.indent("\n".join(map(str, attributes)), indent)
+        if docstring:
             stub += "\n"
 
-        if methods:
-            stub += textwrap.indent("\n".join(map(str, methods)), indent)
-            stub += "\n"
+        # Aliases are applied while rendering so generating a stub never modifies it
+        members = []
 
-        if attr_to_alias:
-            stub = AttributeReplacer.replace(stub, attr_to_alias)
+        for attr in attributes:
+            target = attr_map_func(attr.target) if attr_map_func else attr.target
+            if attr_to_alias:
+                target = attr_to_alias.get(target, target)
 
-        if method_to_alias:
-            stub = MethodReplacer.replace(stub, method_to_alias)
+            members.append((repr(AssignInfo(target, attr.value, attr.annotation)), None))
 
-        return stub.strip()
+        for method in methods:
+            method_name = method_map_func(method.name) if method_map_func else method.name
+            if method_to_alias:
+                method_name = method_to_alias.get(method_name, method_name)
+
+            method_stub = method.generate(indent_spaces, name=method_name)
+            members.append((method_stub, None))
+
+        return f"{stub}\n{textwrap.indent(join_blocks(members), indent)}"
 
     def __repr__(self) -> str:
         return self.generate()
@@ -432,13 +425,17 @@ class CodeStub:
         return cls(mappings, blocks)
 
     def generate(self) -> str:
-        stub = "\n".join(map(str, self.blocks))
+        blocks = []
+
+        for block in self.blocks:
+            text = repr(block)
+            # Imports already carry their aliases
+            if self.mappings and not isinstance(block, ImportInfo):
+                text = rename_identifiers(text, self.mappings)
 
-        if self.mappings:
-            for k, v in self.mappings.items():
-                stub = stub.replace(k, v)
+            blocks.append((text, type(block)))
 
-        return black.format_str(stub, mode=black.Mode(line_length=1000, is_pyi=True)).strip()
+        return join_blocks(blocks)
 
     def __repr__(self) -> str:
         return self.generate()
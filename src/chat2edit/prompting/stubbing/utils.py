@@ -1,11 +1,28 @@
 import ast
 import inspect
+import io
 import re
 import sys
 import textwrap
+import tokenize
 from itertools import chain
 from pathlib import Path
-from typing import Any, Dict, Iterable, Optional
+from typing import Any, Dict, Iterable, List, Optional, Set, Tuple
+
+from chat2edit.prompting.stubbing.export_index import ExportIndex
+
+# Tokens after which a name at the top level of a signature is a parameter
+PARAMETER_PREFIXES = frozenset({"(", ",", "*", "**", "/"})
+PARAMETER_SUFFIXES = frozenset({":", "=", ",", ")"})
+
+# sys.path as of the last module classification, with its entries resolved once
+_sys_path_snapshot: List[str] = []
+_site_package_paths: List[Path] = []
+_stdlib_paths: List[Path] = []
+_module_classifications: Dict[str, Tuple[str, bool]] = {}
+
+# Shared by find_shortest_import_path, so the index is built once per process
+_export_index = ExportIndex()
 
 
 def get_ast_node(target: Any) -> ast.AST:
@@ -25,6 +42,193 @@ def get_node_doc(node: ast.AST) -> Optional[str]:
     return None
 
 
+def unparse(node: ast.AST) -> str:
+    """Unparse a node, quoting strings with double quotes where that needs no escaping."""
+    code = ast.unparse(node)
+    return prefer_double_quotes(code) if "'" in code else code
+
+
+def prefer_double_quotes(code: str) -> str:
+    try:
+        tokens = list(tokenize.generate_tokens(io.StringIO(code).readline))
+    except (tokenize.TokenError, SyntaxError):
+        return code
+
+    for token in reversed(tokens):
+        body = token.string[1:-1]
+        if (
+            token.type == tokenize.STRING
+            and token.string[0] == "'"
+            and not token.string.startswith("'''")
+            and '"' not in body
+            and "\\'" not in body
+        ):
+            # Unparsed code is a single line, so the column locates the token
+            start, end = token.start[1], token.end[1]
+            code = f'{code[:start]}"{body}"{code[end:]}'
+
+    return code
+
+
+def format_arguments(args: ast.arguments) -> str:
+    """Render function parameters the way black does, without running it."""
+    parameters = []
+    positional = [*args.posonlyargs, *args.args]
+    defaults = [None] * (len(positional) - len(args.defaults)) + list(args.defaults)
+
+    for i, (arg, default) in enumerate(zip(positional, defaults)):
+        parameters.append(format_parameter(arg, default))
+        if args.posonlyargs and i == len(args.posonlyargs) - 1:
+            parameters.append("/")
+
+    if args.vararg:
+        parameters.append(f"*{format_parameter(args.vararg)}")
+    elif args.kwonlyargs:
+        parameters.append("*")
+
+    for arg, default in zip(args.kwonlyargs, args.kw_defaults):
+        parameters.append(format_parameter(arg, default))
+
+    if args.kwarg:
+        parameters.append(f"**{format_parameter(args.kwarg)}")
+
+    return ", ".join(parameters)
+
+
+def format_parameter(arg: ast.arg, default: Optional[ast.expr] = None) -> str:
+    parameter = arg.arg
+
+    if arg.annotation:
+        parameter += f": {unparse(arg.annotation)}"
+
+    if default is not None:
+        parameter += f" = {unparse(default)}" if arg.annotation else f"={unparse(default)}"
+
+    return parameter
+
+
+def format_docstring(docstring: str, indent: str) -> str:
+    """Render a docstring as an indented block with the quotes on their own lines."""
+    lines = [f"{indent}{line}" if line else "" for line in inspect.cleandoc(docstring).splitlines()]
+    return "\n".join([f'{indent}"""', *lines, f'{indent}"""'])
+
+
+def join_blocks(blocks: List[Tuple[str, Any]]) -> str:
+    """
+    Join rendered blocks, separating them with a blank line when one of them
+    spans several lines or when their kinds differ.
+    """
+    stub = ""
+    previous: Optional[Tuple[str, Any]] = None
+
+    for text, kind in blocks:
+        if previous is not None:
+            separated = kind != previous[1] or "\n" in text or "\n" in previous[0]
+            stub += "\n\n" if separated else "\n"
+
+        stub += text
+        previous = (text, kind)
+
+    return stub
+
+
+def rename_identifiers(code: str, mappings: Dict[str, str]) -> str:
+    """
+    Rename the identifiers in `mappings` by token, so attributes, comments and
+    strings other than forward references in annotations are left intact.
+    """
+    forward_references = _get_forward_references(code)
+    line_offsets = [0]
+    for line in code.split("\n"):
+        line_offsets.append(line_offsets[-1] + len(line) + 1)
+
+    pieces = []
+    position = 0
+    previous = None
+
+    for token in tokenize.generate_tokens(io.StringIO(code).readline):
+        if token.type in (tokenize.NL, tokenize.COMMENT):
+            continue
+
+        replacement = None
+        if token.type == tokenize.NAME:
+            if token.string in mappings and not (previous is not None and previous.string == "."):
+                replacement = mappings[token.string]
+        elif token.type == tokenize.STRING and token.start in forward_references:
+            quote = token.string[0]
+            if quote in "'\"" and token.string[-1] == quote:
+                renamed = rename_identifiers(token.string[1:-1], mappings)
+                replacement = quote + renamed + quote
+
+        if replacement is not None:
+            start = line_offsets[token.start[0] - 1] + token.start[1]
+            pieces.extend((code[position:start], replacement))
+            position = start + len(token.string)
+
+        previous = token
+
+    pieces.append(code[position:])
+    return "".join(pieces)
+
+
+def _get_forward_references(code: str) -> Set[Tuple[int, int]]:
+    """Return the (line, column) positions of string literals used as annotations."""
+    try:
+        tree = ast.parse(code)
+    except SyntaxError:
+        return set()
+
+    annotations: List[ast.AST] = []
+    for node in ast.walk(tree):
+        if isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef)) and node.returns:
+            annotations.append(node.returns)
+        elif isinstance(node, ast.arg) and node.annotation:
+            annotations.append(node.annotation)
+        elif isinstance(node, ast.AnnAssign):
+            annotations.append(node.annotation)
+
+    lines = code.split("\n")
+    positions = set()
+
+    for annotation in annotations:
+        for node in ast.walk(annotation):
+            if isinstance(node, ast.Constant) and isinstance(node.value, str):
+                # AST columns count UTF-8 bytes while tokenize counts characters
+                line = lines[node.lineno - 1]
+                column = len(line.encode()[: node.col_offset].decode())
+                positions.add((node.lineno, column))
+
+    return positions
+
+
+def rename_parameters(signature: str, mappings: Dict[str, str]) -> str:
+    """Rename the parameters of a rendered signature, leaving annotations and defaults intact."""
+    tokens = list(tokenize.generate_tokens(io.StringIO(signature).readline))
+    replacements = []
+    depth = 0
+
+    for i, token in enumerate(tokens):
+        if token.type == tokenize.OP and token.string in "([{":
+            depth += 1
+        elif token.type == tokenize.OP and token.string in ")]}":
+            depth -= 1
+        elif (
+            token.type == tokenize.NAME
+            and depth == 1
+            and token.string in mappings
+            and i > 0
+            and tokens[i - 1].string in PARAMETER_PREFIXES
+            and i + 1 < len(tokens)
+            and tokens[i + 1].string in PARAMETER_SUFFIXES
+        ):
+            replacements.append((token.start[1], token.end[1], mappings[token.string]))
+
+    for start, end, name in reversed(replacements):
+        signature = signature[:start] + name + signature[end:]
+
+    return signature
+
+
 def get_call_args(call: str) -> str:
     return re.search(r"\((.*?)\)", call).group(1)
 
@@ -58,43 +262,62 @@ def is_external_package(obj: Any) -> bool:
         return True
 
     # If module has no __file__, it's likely built-in or special
-    if not hasattr(module, "__file__") or module.__file__ is None:
+    module_file = getattr(module, "__file__", None)
+    if module_file is None:
         return True
 
-    module_path = Path(module.__file__).resolve()
+    if sys.path != _sys_path_snapshot:
+        _resolve_sys_path()
+
+    # Keyed by module name, the file is kept to notice a module replaced under the same name
+    cached = _module_classifications.get(module_name)
+    if cached is not None and cached[0] == module_file:
+        return cached[1]
+
+    external = _is_external_file(module_file)
+    _module_classifications[module_name] = (module_file, external)
+    return external
+
+
+def _resolve_sys_path() -> None:
+    global _sys_path_snapshot, _site_package_paths, _stdlib_paths
+
+    site_package_paths = []
+    stdlib_paths = []
 
-    # Check if it's in site-packages or dist-packages
     for path in sys.path:
-        site_pkg_path = Path(path).resolve()
-        if "site-packages" in str(site_pkg_path) or "dist-packages" in str(site_pkg_path):
-            try:
-                if site_pkg_path in module_path.parents or site_pkg_path == module_path.parent:
-                    return True
-            except (ValueError, OSError):
-                continue
-
-    # Check if it's from the standard library
-    # Standard library is usually in the Python installation directory
-    stdlib_paths = [Path(p).resolve() for p in sys.path if "lib" in p and "site-packages" not in p]
-    for stdlib_path in stdlib_paths:
         try:
-            if stdlib_path in module_path.parents:
-                return True
+            resolved = Path(path).resolve()
         except (ValueError, OSError):
             continue
 
-    # If none of the above, it's part of the user's project (internal)
-    return False
+        if "site-packages" in str(resolved) or "dist-packages" in str(resolved):
+            site_package_paths.append(resolved)
+        # Standard library is usually in the Python installation directory
+        if "lib" in path and "site-packages" not in path:
+            stdlib_paths.append(resolved)
 
+    _sys_path_snapshot = list(sys.path)
+    _site_package_paths = site_package_paths
+    _stdlib_paths = stdlib_paths
+    # Classifications depend on sys.path, so they are recomputed against the new one
+    _module_classifications.clear()
 
-def find_shortest_import_path(obj: Any) -> str:
-    candidates = []
 
-    for name, module in list(sys.modules.items()):
-        if module and getattr(module, obj.__name__, None) is obj:
-            candidates.append(name)
+def _is_external_file(module_file: str) -> bool:
+    try:
+        parents = set(Path(module_file).resolve().parents)
+    except (ValueError, OSError):
+        return False
 
-    candidates = [c for c in candidates if not c.startswith("__")]
+    # Check if it's in site-packages or dist-packages, or from the standard library
+    return any(path in parents for path in _site_package_paths) or any(
+        path in parents for path in _stdlib_paths
+    )
+
+
+def find_shortest_import_path(obj: Any) -> str:
+    candidates = [c for c in _export_index.get_exporters(obj) if not c.startswith("__")]
 
     # If no candidates found after filtering, fall back to the object's module
     if not candidates:
@@ -0,0 +1,19 @@
+from chat2edit.sessions.session import Session
+from chat2edit.sessions.session_journal import SessionJournal
+from chat2edit.sessions.stores import (
+    FileSessionStore,
+    InMemorySessionStore,
+    SessionStore,
+    SessionStoreMetrics,
+    SqliteSessionStore,
+)
+
+__all__ = [
+    "FileSessionStore",
+    "InMemorySessionStore",
+    "Session",
+    "SessionJournal",
+    "SessionStore",
+    "SessionStoreMetrics",
+    "SqliteSessionStore",
+]
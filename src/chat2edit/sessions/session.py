@@ -0,0 +1,14 @@
+from time import time_ns
+from typing import Any, Dict, List
+
+from pydantic import BaseModel, Field
+
+from chat2edit.models import ChatCycle
+
+
+class Session(BaseModel):
+    session_id: str
+    cycles: List[ChatCycle] = Field(default_factory=list)
+    # The context doubles as the execution namespace: every block is run against it
+    context: Dict[str, Any] = Field(default_factory=dict)
+    last_accessed: int = Field(default_factory=time_ns)
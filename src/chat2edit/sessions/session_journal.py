@@ -0,0 +1,191 @@
+import json
+import os
+import struct
+import zlib
+from collections.abc import Sequence
+from typing import BinaryIO, Dict, Iterator, List, Optional, Tuple, Union, overload
+
+from chat2edit.models import ChatCycle, ExecutionBlock, PromptCycle
+
+# Each frame is a fixed header followed by a JSON payload:
+# payload length (uint32), record kind (uint8), flags (uint8)
+FRAME_HEADER = struct.Struct(">IBB")
+
+CHAT_CYCLE_RECORD = 1
+PROMPT_CYCLE_RECORD = 2
+EXECUTION_BLOCK_RECORD = 3
+CHAT_CYCLE_UPDATE_RECORD = 4
+
+# Chat cycle fields that are only known once the cycle has finished
+CHAT_CYCLE_UPDATE_FIELDS = {"end_time", "execution_time", "stop_reason"}
+
+COMPRESSED_FLAG = 0x01
+
+
+class SessionJournal(Sequence):
+    """
+    Append-only log of a session's chat cycles.
+
+    Every `ChatCycle`, `PromptCycle` and `ExecutionBlock` is written as its own
+    length-prefixed frame when it is produced, so persisting a turn only costs
+    the records of that turn. Opening a journal scans frame headers only; a
+    chat cycle is decoded the first time it is indexed.
+    """
+
+    def __init__(
+        self,
+        path: Union[str, os.PathLike],
+        *,
+        compress: bool = False,
+        compress_threshold: int = 256,
+        compress_level: int = 6,
+    ) -> None:
+        self._path = path
+        self._compress = compress
+        self._compress_threshold = compress_threshold
+        self._compress_level = compress_level
+        self._file: BinaryIO = open(path, "a+b")
+        self._offsets: List[int] = []
+        self._cycles: Dict[int, ChatCycle] = {}
+        self._scan()
+
+    @property
+    def path(self) -> Union[str, os.PathLike]:
+        return self._path
+
+    def append_chat_cycle(self, chat_cycle: ChatCycle) -> None:
+        offset = self._write(CHAT_CYCLE_RECORD, chat_cycle.model_dump_json(exclude={"cycles"}))
+        self._cycles[len(self._offsets)] = chat_cycle
+        self._offsets.append(offset)
+
+    def append_prompt_cycle(self, prompt_cycle: PromptCycle) -> None:
+        self._ensure_chat_cycle()
+        self._write(PROMPT_CYCLE_RECORD, prompt_cycle.model_dump_json(exclude={"blocks"}))
+
+    def append_execution_block(self, block: ExecutionBlock) -> None:
+        self._ensure_chat_cycle()
+        self._write(EXECUTION_BLOCK_RECORD, block.model_dump_json())
+
+    def update_chat_cycle(self, chat_cycle: ChatCycle) -> None:
+        """Record the fields of the last chat cycle that are set when it finishes."""
+        self._ensure_chat_cycle()
+        self._write(
+            CHAT_CYCLE_UPDATE_RECORD, chat_cycle.model_dump_json(include=CHAT_CYCLE_UPDATE_FIELDS)
+        )
+
+    def flush(self) -> None:
+        self._file.flush()
+
+    def close(self) -> None:
+        self._file.close()
+
+    def __enter__(self) -> "SessionJournal":
+        return self
+
+    def __exit__(self, *args) -> None:
+        self.close()
+
+    def __len__(self) -> int:
+        return len(self._offsets)
+
+    @overload
+    def __getitem__(self, index: int) -> ChatCycle: ...
+
+    @overload
+    def __getitem__(self, index: slice) -> List[ChatCycle]: ...
+
+    def __getitem__(self, index: Union[int, slice]) -> Union[ChatCycle, List[ChatCycle]]:
+        if isinstance(index, slice):
+            return [self._load(i) for i in range(*index.indices(len(self)))]
+
+        if index < 0:
+            index += len(self)
+
+        if not 0 <= index < len(self):
+            raise IndexError("journal index out of range")
+
+        return self._load(index)
+
+    def __iter__(self) -> Iterator[ChatCycle]:
+        for i in range(len(self)):
+            yield self._load(i)
+
+    def _ensure_chat_cycle(self) -> None:
+        if not self._offsets:
+            raise ValueError("A chat cycle must be appended before its records")
+
+    def _write(self, kind: int, payload: str) -> int:
+        data = payload.encode()
+        flags = 0
+
+        if self._compress and len(data) >= self._compress_threshold:
+            data = zlib.compress(data, self._compress_level)
+            flags |= COMPRESSED_FLAG
+
+        self._file.seek(0, os.SEEK_END)
+        offset = self._file.tell()
+        self._file.write(FRAME_HEADER.pack(len(data), kind, flags))
+        self._file.write(data)
+        self._file.flush()
+
+        return offset
+
+    def _scan(self) -> None:
+        size = os.fstat(self._file.fileno()).st_size
+        offset = 0
+
+        while offset + FRAME_HEADER.size <= size:
+            self._file.seek(offset)
+            length, kind, _ = FRAME_HEADER.unpack(self._file.read(FRAME_HEADER.size))
+            if offset + FRAME_HEADER.size + length > size:
+                break
+
+            if kind == CHAT_CYCLE_RECORD:
+                self._offsets.append(offset)
+
+            offset += FRAME_HEADER.size + length
+
+        # Drop a partially written trailing frame so later appends stay aligned
+        if offset < size:
+            self._file.truncate(offset)
+
+    def _read_frame(self, offset: int) -> Optional[Tuple[int, bytes, int]]:
+        self._file.seek(offset)
+        header = self._file.read(FRAME_HEADER.size)
+        if len(header) < FRAME_HEADER.size:
+            return None
+
+        length, kind, flags = FRAME_HEADER.unpack(header)
+        data = self._file.read(length)
+        if flags & COMPRESSED_FLAG:
+            data = zlib.decompress(data)
+
+        return kind, data, offset + FRAME_HEADER.size + length
+
+    def _load(self, index: int) -> ChatCycle:
+        if index in self._cycles:
+            return self._cycles[index]
+
+        frame = self._read_frame(self._offsets[index])
+        assert frame is not None and frame[0] == CHAT_CYCLE_RECORD
+        _, data, offset = frame
+        chat_cycle = ChatCycle.model_validate_json(data)
+
+        while (frame := self._read_frame(offset)) is not None:
+            kind, data, offset = frame
+
+            if kind == CHAT_CYCLE_RECORD:
+                break
+
+            if kind == PROMPT_CYCLE_RECORD:
+                chat_cycle.cycles.append(PromptCycle.model_validate_json(data))
+
+            elif kind == EXECUTION_BLOCK_RECORD and chat_cycle.cycles:
+                chat_cycle.cycles[-1].blocks.append(ExecutionBlock.model_validate_json(data))
+
+            elif kind == CHAT_CYCLE_UPDATE_RECORD:
+                for field, value in json.loads(data).items():
+                    setattr(chat_cycle, field, value)
+
+        self._cycles[index] = chat_cycle
+        return chat_cycle
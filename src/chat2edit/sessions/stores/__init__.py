@@ -0,0 +1,13 @@
+from chat2edit.sessions.stores.impl.file_session_store import FileSessionStore
+from chat2edit.sessions.stores.impl.in_memory_session_store import InMemorySessionStore
+from chat2edit.sessions.stores.impl.sqlite_session_store import SqliteSessionStore
+from chat2edit.sessions.stores.session_store import SessionStore
+from chat2edit.sessions.stores.session_store_metrics import SessionStoreMetrics
+
+__all__ = [
+    "FileSessionStore",
+    "InMemorySessionStore",
+    "SessionStore",
+    "SessionStoreMetrics",
+    "SqliteSessionStore",
+]
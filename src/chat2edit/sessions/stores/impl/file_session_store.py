@@ -0,0 +1,67 @@
+import hashlib
+import os
+from pathlib import Path
+from typing import Collection, Optional, Union
+
+from chat2edit.sessions.session import Session
+from chat2edit.sessions.stores.session_store import SessionStore
+
+SESSION_FILE_SUFFIX = ".session"
+
+
+class FileSessionStore(SessionStore):
+    """Stores each session in its own file, using the file mtime as its last access time."""
+
+    def __init__(self, directory: Union[str, os.PathLike], **kwargs) -> None:
+        super().__init__(**kwargs)
+        self._directory = Path(directory)
+        self._directory.mkdir(parents=True, exist_ok=True)
+
+    def _get_path(self, session_id: str) -> Path:
+        filename = hashlib.sha256(session_id.encode()).hexdigest() + SESSION_FILE_SUFFIX
+        return self._directory / filename
+
+    def _read(self, session_id: str) -> Optional[Session]:
+        path = self._get_path(session_id)
+
+        try:
+            return self._load(path.read_bytes(), path.stat().st_mtime_ns)
+        except FileNotFoundError:
+            return None
+
+    def _write(self, session: Session) -> None:
+        path = self._get_path(session.session_id)
+        temp_path = path.with_suffix(".tmp")
+        temp_path.write_bytes(self._dump(session))
+        # Replace atomically so readers never observe a partially written session
+        os.replace(temp_path, path)
+        os.utime(path, ns=(session.last_accessed, session.last_accessed))
+
+    def _remove(self, session_id: str) -> None:
+        self._get_path(session_id).unlink(missing_ok=True)
+
+    def _remove_expired(self, cutoff: int, keep: Collection[str]) -> int:
+        kept_paths = {self._get_path(session_id) for session_id in keep}
+        removed = 0
+
+        for path in self._directory.glob(f"*{SESSION_FILE_SUFFIX}"):
+            if path in kept_paths:
+                continue
+
+            try:
+                if path.stat().st_mtime_ns < cutoff:
+                    path.unlink()
+                    removed += 1
+            except FileNotFoundError:
+                continue
+
+        return removed
+
+    def _touch(self, session: Session) -> None:
+        try:
+            os.utime(
+                self._get_path(session.session_id),
+                ns=(session.last_accessed, session.last_accessed),
+            )
+        except FileNotFoundError:
+            pass
@@ -0,0 +1,23 @@
+from typing import Collection, Optional
+
+from chat2edit.sessions.session import Session
+from chat2edit.sessions.stores.session_store import SessionStore
+
+
+class InMemorySessionStore(SessionStore):
+    """Keeps sessions only in the LRU cache, so evicted sessions are gone for good."""
+
+    def _read(self, session_id: str) -> Optional[Session]:
+        return None
+
+    def _write(self, session: Session) -> None:
+        pass
+
+    def _remove(self, session_id: str) -> None:
+        pass
+
+    def _remove_expired(self, cutoff: int, keep: Collection[str]) -> int:
+        return 0
+
+    def _touch(self, session: Session) -> None:
+        pass
@@ -0,0 +1,59 @@
+import os
+import sqlite3
+from typing import Collection, Optional, Union
+
+from chat2edit.sessions.session import Session
+from chat2edit.sessions.stores.session_store import SessionStore
+
+CREATE_TABLE_SQL = """
+CREATE TABLE IF NOT EXISTS sessions (
+    session_id TEXT PRIMARY KEY,
+    data BLOB NOT NULL,
+    last_accessed INTEGER NOT NULL
+)
+""".strip()
+
+
+class SqliteSessionStore(SessionStore):
+    def __init__(self, path: Union[str, os.PathLike] = ":memory:", **kwargs) -> None:
+        super().__init__(**kwargs)
+        self._connection = sqlite3.connect(path, check_same_thread=False)
+        self._connection.execute(CREATE_TABLE_SQL)
+        self._connection.commit()
+
+    def close(self) -> None:
+        self._connection.close()
+
+    def _read(self, session_id: str) -> Optional[Session]:
+        row = self._connection.execute(
+            "SELECT data, last_accessed FROM sessions WHERE session_id = ?", (session_id,)
+        ).fetchone()
+
+        return self._load(*row) if row else None
+
+    def _write(self, session: Session) -> None:
+        self._connection.execute(
+            "INSERT OR REPLACE INTO sessions (session_id, data, last_accessed) VALUES (?, ?, ?)",
+            (session.session_id, self._dump(session), session.last_accessed),
+        )
+        self._connection.commit()
+
+    def _remove(self, session_id: str) -> None:
+        self._connection.execute("DELETE FROM sessions WHERE session_id = ?", (session_id,))
+        self._connection.commit()
+
+    def _remove_expired(self, cutoff: int, keep: Collection[str]) -> int:
+        rows = self._connection.execute(
+            "SELECT session_id FROM sessions WHERE last_accessed < ?", (cutoff,)
+        ).fetchall()
+        expired = [(session_id,) for (session_id,) in rows if session_id not in keep]
+        self._connection.executemany("DELETE FROM sessions WHERE session_id = ?", expired)
+        self._connection.commit()
+        return len(expired)
+
+    def _touch(self, session: Session) -> None:
+        self._connection.execute(
+            "UPDATE sessions SET last_accessed = ? WHERE session_id = ?",
+            (session.last_accessed, session.session_id),
+        )
+        self._connection.commit()
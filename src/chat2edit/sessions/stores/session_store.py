@@ -0,0 +1,201 @@
+import pickle
+import threading
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from time import perf_counter_ns, time_ns
+from typing import Callable, Collection, Optional, Tuple
+
+from chat2edit.context.utils import safe_pickle, safe_unpickle
+from chat2edit.models import ChatCycle
+from chat2edit.sessions.session import Session
+from chat2edit.sessions.stores.session_store_metrics import SessionStoreMetrics
+from chat2edit.utils import estimate_size
+
+
+class SessionStore(ABC):
+    """
+    Session storage fronted by an in-memory LRU cache.
+
+    Cached sessions are evicted least recently used first once their estimated
+    size exceeds `max_memory_bytes`; backends keep evicted sessions available
+    for the next `get`. Sessions idle for longer than `ttl` seconds expire and
+    are removed from the cache and the backend.
+    """
+
+    def __init__(
+        self,
+        *,
+        max_memory_bytes: Optional[int] = None,
+        ttl: Optional[float] = None,
+        get_size: Callable[[Session], int] = estimate_size,
+    ) -> None:
+        self._max_memory_bytes = max_memory_bytes
+        self._ttl_ns = int(ttl * 1e9) if ttl is not None else None
+        self._get_size = get_size
+        self._cache: "OrderedDict[str, Tuple[Session, int]]" = OrderedDict()
+        self._cached_bytes = 0
+        self._metrics = SessionStoreMetrics()
+        self._lock = threading.RLock()
+
+    def get(self, session_id: str) -> Optional[Session]:
+        start = perf_counter_ns()
+
+        with self._lock:
+            self._metrics.gets += 1
+            session = self._get_cached(session_id)
+
+            if session is None:
+                session = self._read(session_id)
+                if session is not None and self._is_expired(session):
+                    self._remove(session_id)
+                    self._metrics.ttl_evictions += 1
+                    session = None
+
+                if session is not None:
+                    self._cache_session(session)
+
+            if session is not None:
+                self._metrics.hits += 1
+                session.last_accessed = time_ns()
+            else:
+                self._metrics.misses += 1
+
+            self._record_latency("get", perf_counter_ns() - start)
+            return session
+
+    def put(self, session: Session) -> None:
+        start = perf_counter_ns()
+
+        with self._lock:
+            self._metrics.puts += 1
+            session.last_accessed = time_ns()
+            self._write(session)
+            self._cache_session(session)
+            self._record_latency("put", perf_counter_ns() - start)
+
+    def delete(self, session_id: str) -> None:
+        with self._lock:
+            self._metrics.deletes += 1
+            self._uncache(session_id)
+            self._remove(session_id)
+
+    def evict(self) -> int:
+        """Expire idle sessions and enforce the memory budget, returning the eviction count."""
+        with self._lock:
+            evicted = 0
+
+            if self._ttl_ns is not None:
+                cutoff = time_ns() - self._ttl_ns
+
+                for session_id, (session, _) in list(self._cache.items()):
+                    if session.last_accessed < cutoff:
+                        self._uncache(session_id)
+                        self._remove(session_id)
+                        evicted += 1
+
+                # Cached sessions were touched since the backend last saw them and are not expired
+                evicted += self._remove_expired(cutoff, keep=self._cache.keys())
+                self._metrics.ttl_evictions += evicted
+
+            return evicted + self._enforce_budget()
+
+    def get_metrics(self) -> SessionStoreMetrics:
+        with self._lock:
+            metrics = self._metrics.model_copy()
+            metrics.cached_sessions = len(self._cache)
+            metrics.cached_bytes = self._cached_bytes
+            return metrics
+
+    @abstractmethod
+    def _read(self, session_id: str) -> Optional[Session]:
+        """Load a session with the last access time the backend recorded for it."""
+        pass
+
+    @abstractmethod
+    def _write(self, session: Session) -> None:
+        pass
+
+    @abstractmethod
+    def _remove(self, session_id: str) -> None:
+        pass
+
+    @abstractmethod
+    def _remove_expired(self, cutoff: int, keep: Collection[str]) -> int:
+        pass
+
+    @abstractmethod
+    def _touch(self, session: Session) -> None:
+        """Persist the last access time of a session without rewriting it."""
+        pass
+
+    def _dump(self, session: Session) -> bytes:
+        return pickle.dumps(
+            {
+                "session_id": session.session_id,
+                "cycles": [cycle.model_dump_json() for cycle in session.cycles],
+                "context": safe_pickle(session.context),
+            }
+        )
+
+    def _load(self, data: bytes, last_accessed: int) -> Session:
+        # The access time is owned by the backend, `_touch` updates it without the data
+        fields = pickle.loads(data)
+        return Session(
+            session_id=fields["session_id"],
+            cycles=[ChatCycle.model_validate_json(cycle) for cycle in fields["cycles"]],
+            context=safe_unpickle(fields["context"]),
+            last_accessed=last_accessed,
+        )
+
+    def _is_expired(self, session: Session) -> bool:
+        return self._ttl_ns is not None and time_ns() - session.last_accessed > self._ttl_ns
+
+    def _get_cached(self, session_id: str) -> Optional[Session]:
+        entry = self._cache.get(session_id)
+        if entry is None:
+            return None
+
+        session, _ = entry
+        if self._is_expired(session):
+            self._uncache(session_id)
+            self._remove(session_id)
+            self._metrics.ttl_evictions += 1
+            return None
+
+        self._cache.move_to_end(session_id)
+        return session
+
+    def _cache_session(self, session: Session) -> None:
+        self._uncache(session.session_id)
+        size = self._get_size(session)
+        self._cache[session.session_id] = (session, size)
+        self._cached_bytes += size
+        self._enforce_budget()
+
+    def _uncache(self, session_id: str) -> None:
+        entry = self._cache.pop(session_id, None)
+        if entry is not None:
+            self._cached_bytes -= entry[1]
+
+    def _enforce_budget(self) -> int:
+        if self._max_memory_bytes is None:
+            return 0
+
+        evicted = 0
+
+        # Keep the most recently used session even if it alone exceeds the budget
+        while self._cached_bytes > self._max_memory_bytes and len(self._cache) > 1:
+            session_id, (session, _) = next(iter(self._cache.items()))
+            self._uncache(session_id)
+            # Reads only touched the cached copy, so record them before the backend is the source
+            self._touch(session)
+            evicted += 1
+
+        self._metrics.budget_evictions += evicted
+        return evicted
+
+    def _record_latency(self, operation: str, latency_ns: int) -> None:
+        total_field = f"{operation}_latency_ns"
+        max_field = f"max_{operation}_latency_ns"
+        setattr(self._metrics, total_field, getattr(self._metrics, total_field) + latency_ns)
+        setattr(self._metrics, max_field, max(getattr(self._metrics, max_field), latency_ns))
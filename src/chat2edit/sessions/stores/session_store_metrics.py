@@ -0,0 +1,29 @@
+from pydantic import BaseModel, Field
+
+
+class SessionStoreMetrics(BaseModel):
+    gets: int = Field(default=0)
+    hits: int = Field(default=0)
+    misses: int = Field(default=0)
+    puts: int = Field(default=0)
+    deletes: int = Field(default=0)
+    budget_evictions: int = Field(default=0)
+    ttl_evictions: int = Field(default=0)
+    cached_sessions: int = Field(default=0)
+    cached_bytes: int = Field(default=0)
+    get_latency_ns: int = Field(default=0)
+    max_get_latency_ns: int = Field(default=0)
+    put_latency_ns: int = Field(default=0)
+    max_put_latency_ns: int = Field(default=0)
+
+    @property
+    def hit_rate(self) -> float:
+        return self.hits / self.gets if self.gets else 0.0
+
+    @property
+    def mean_get_latency_ns(self) -> float:
+        return self.get_latency_ns / self.gets if self.gets else 0.0
+
+    @property
+    def mean_put_latency_ns(self) -> float:
+        return self.put_latency_ns / self.puts if self.puts else 0.0
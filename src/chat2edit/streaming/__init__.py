@@ -0,0 +1,31 @@
+from chat2edit.streaming.event_sink import (
+    EventSink,
+    OverflowPolicy,
+    get_event_sink,
+    set_event_sink,
+)
+from chat2edit.streaming.events import (
+    AnswerDeltaEvent,
+    BlockFinishedEvent,
+    BlockStartedEvent,
+    CodeExtractedEvent,
+    LogEvent,
+    PromptEvent,
+    ResponseEvent,
+    StreamEvent,
+)
+
+__all__ = [
+    "AnswerDeltaEvent",
+    "BlockFinishedEvent",
+    "BlockStartedEvent",
+    "CodeExtractedEvent",
+    "EventSink",
+    "LogEvent",
+    "OverflowPolicy",
+    "PromptEvent",
+    "ResponseEvent",
+    "StreamEvent",
+    "get_event_sink",
+    "set_event_sink",
+]
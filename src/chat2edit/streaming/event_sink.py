@@ -0,0 +1,120 @@
+import asyncio
+from collections import deque
+from contextvars import ContextVar
+from typing import Deque, Literal, Optional
+
+from chat2edit.streaming.events import StreamEvent
+
+OverflowPolicy = Literal["block", "drop_oldest", "drop_newest"]
+
+_current_event_sink: ContextVar[Optional["EventSink"]] = ContextVar(
+    "chat2edit_event_sink", default=None
+)
+
+
+class EventSink:
+    """
+    Bounded buffer between the generate loop and a stream consumer.
+
+    Once `max_size` events are buffered, the `block` policy makes the producer
+    wait for the consumer, while `drop_oldest` and `drop_newest` discard a
+    droppable event (answer deltas and logs) to keep the producer running.
+    Other events are always buffered, so a stream never loses its structure.
+    Events put without waiting fall back to dropping under `block`. Events put
+    after `close` are discarded.
+    """
+
+    def __init__(self, max_size: int = 256, overflow: OverflowPolicy = "block") -> None:
+        self._max_size = max_size
+        self._overflow = overflow
+        self._events: Deque[StreamEvent] = deque()
+        self._condition = asyncio.Condition()
+        self._closed = False
+        self._error: Optional[BaseException] = None
+        self._dropped = 0
+        self._wake_task: Optional["asyncio.Task[None]"] = None
+
+    @property
+    def dropped(self) -> int:
+        return self._dropped
+
+    async def put(self, event: StreamEvent) -> None:
+        async with self._condition:
+            if self._closed:
+                return
+
+            if len(self._events) >= self._max_size:
+                if self._overflow == "block":
+                    await self._condition.wait_for(
+                        lambda: len(self._events) < self._max_size or self._closed
+                    )
+                    if self._closed:
+                        return
+                elif not (self._overflow == "drop_oldest" and self._drop_oldest()):
+                    if event.droppable:
+                        self._dropped += 1
+                        return
+
+            self._events.append(event)
+            self._condition.notify_all()
+
+    def put_nowait(self, event: StreamEvent) -> None:
+        """Buffer an event from synchronous code running on the event loop."""
+        if self._closed:
+            return
+
+        if len(self._events) >= self._max_size:
+            if not (self._overflow == "drop_oldest" and self._drop_oldest()):
+                if event.droppable:
+                    self._dropped += 1
+                    return
+
+        self._events.append(event)
+
+        # Notifying requires the condition's lock, so the consumer is woken by a task
+        if self._wake_task is None or self._wake_task.done():
+            self._wake_task = asyncio.get_running_loop().create_task(self._wake())
+
+    async def close(self, error: Optional[BaseException] = None) -> None:
+        async with self._condition:
+            self._closed = True
+            self._error = error
+            self._condition.notify_all()
+
+    def __aiter__(self) -> "EventSink":
+        return self
+
+    async def __anext__(self) -> StreamEvent:
+        async with self._condition:
+            await self._condition.wait_for(lambda: self._events or self._closed)
+
+            if self._events:
+                event = self._events.popleft()
+                self._condition.notify_all()
+                return event
+
+            if self._error is not None:
+                raise self._error
+
+            raise StopAsyncIteration
+
+    async def _wake(self) -> None:
+        async with self._condition:
+            self._condition.notify_all()
+
+    def _drop_oldest(self) -> bool:
+        for buffered in self._events:
+            if buffered.droppable:
+                self._events.remove(buffered)
+                self._dropped += 1
+                return True
+
+        return False
+
+
+def get_event_sink() -> Optional[EventSink]:
+    return _current_event_sink.get()
+
+
+def set_event_sink(sink: Optional[EventSink]) -> None:
+    _current_event_sink.set(sink)
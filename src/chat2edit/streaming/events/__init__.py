@@ -0,0 +1,19 @@
+from chat2edit.streaming.events.answer_delta_event import AnswerDeltaEvent
+from chat2edit.streaming.events.block_finished_event import BlockFinishedEvent
+from chat2edit.streaming.events.block_started_event import BlockStartedEvent
+from chat2edit.streaming.events.code_extracted_event import CodeExtractedEvent
+from chat2edit.streaming.events.log_event import LogEvent
+from chat2edit.streaming.events.prompt_event import PromptEvent
+from chat2edit.streaming.events.response_event import ResponseEvent
+from chat2edit.streaming.events.stream_event import StreamEvent
+
+__all__ = [
+    "AnswerDeltaEvent",
+    "BlockFinishedEvent",
+    "BlockStartedEvent",
+    "CodeExtractedEvent",
+    "LogEvent",
+    "PromptEvent",
+    "ResponseEvent",
+    "StreamEvent",
+]
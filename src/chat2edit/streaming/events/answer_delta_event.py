@@ -0,0 +1,10 @@
+from typing import ClassVar, Literal
+
+from chat2edit.streaming.events.stream_event import StreamEvent
+
+
+class AnswerDeltaEvent(StreamEvent):
+    type: Literal["answer_delta"] = "answer_delta"
+    text: str
+
+    droppable: ClassVar[bool] = True
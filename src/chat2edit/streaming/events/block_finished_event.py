@@ -0,0 +1,11 @@
+from typing import Literal
+
+from chat2edit.models import ExecutionBlock
+from chat2edit.streaming.events.stream_event import StreamEvent
+
+
+class BlockFinishedEvent(StreamEvent):
+    type: Literal["block_finished"] = "block_finished"
+    index: int
+    # Not executed when the block was discarded after running alongside one that stopped
+    block: ExecutionBlock
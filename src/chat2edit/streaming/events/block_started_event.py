@@ -0,0 +1,9 @@
+from typing import Literal
+
+from chat2edit.streaming.events.stream_event import StreamEvent
+
+
+class BlockStartedEvent(StreamEvent):
+    type: Literal["block_started"] = "block_started"
+    index: int
+    code: str
@@ -0,0 +1,8 @@
+from typing import Literal
+
+from chat2edit.streaming.events.stream_event import StreamEvent
+
+
+class CodeExtractedEvent(StreamEvent):
+    type: Literal["code_extracted"] = "code_extracted"
+    code: str
@@ -0,0 +1,11 @@
+from typing import ClassVar, Literal
+
+from chat2edit.streaming.events.stream_event import StreamEvent
+
+
+class LogEvent(StreamEvent):
+    type: Literal["log"] = "log"
+    index: int
+    line: str
+
+    droppable: ClassVar[bool] = True
@@ -0,0 +1,10 @@
+from typing import Literal
+
+from chat2edit.models import Message
+from chat2edit.streaming.events.stream_event import StreamEvent
+
+
+class PromptEvent(StreamEvent):
+    type: Literal["prompt"] = "prompt"
+    prompt: Message
+    refine: bool
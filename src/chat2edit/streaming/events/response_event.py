@@ -0,0 +1,13 @@
+from typing import Any, Dict, Literal, Optional
+
+from chat2edit.models import ChatCycle, Message
+from chat2edit.streaming.events.stream_event import StreamEvent
+
+
+class ResponseEvent(StreamEvent):
+    """Final event of a stream, carrying what `Chat2Edit.generate` returns."""
+
+    type: Literal["response"] = "response"
+    response: Optional[Message]
+    chat_cycle: ChatCycle
+    context: Dict[str, Any]
@@ -0,0 +1,9 @@
+from typing import ClassVar
+
+from pydantic import BaseModel
+
+
+class StreamEvent(BaseModel):
+    type: str
+    # Droppable events may be discarded by a full stream under a drop policy
+    droppable: ClassVar[bool] = False
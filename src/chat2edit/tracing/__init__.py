@@ -0,0 +1,15 @@
+from chat2edit.tracing.exporters import (
+    ChromeTraceSpanExporter,
+    InMemorySpanExporter,
+    SpanExporter,
+)
+from chat2edit.tracing.span import Span
+from chat2edit.tracing.tracer import Tracer
+
+__all__ = [
+    "ChromeTraceSpanExporter",
+    "InMemorySpanExporter",
+    "Span",
+    "SpanExporter",
+    "Tracer",
+]
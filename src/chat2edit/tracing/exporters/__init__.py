@@ -0,0 +1,7 @@
+from chat2edit.tracing.exporters.impl.chrome_trace_span_exporter import (
+    ChromeTraceSpanExporter,
+)
+from chat2edit.tracing.exporters.impl.in_memory_span_exporter import InMemorySpanExporter
+from chat2edit.tracing.exporters.span_exporter import SpanExporter
+
+__all__ = ["ChromeTraceSpanExporter", "InMemorySpanExporter", "SpanExporter"]
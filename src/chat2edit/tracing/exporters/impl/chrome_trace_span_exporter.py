@@ -0,0 +1,65 @@
+import json
+import os
+import threading
+from typing import Any, Dict, List, Union
+
+from chat2edit.tracing.exporters.span_exporter import SpanExporter
+from chat2edit.tracing.span import Span
+
+
+class ChromeTraceSpanExporter(SpanExporter):
+    """
+    Collects spans as Chrome trace-event "complete" events.
+
+    The output loads in chrome://tracing or Perfetto. Each trace is drawn on
+    its own row so concurrent requests do not overlap.
+    """
+
+    def __init__(self, process_name: str = "chat2edit") -> None:
+        self._process_name = process_name
+        self._events: List[Dict[str, Any]] = []
+        self._trace_rows: Dict[str, int] = {}
+        self._lock = threading.Lock()
+
+    def export(self, span: Span) -> None:
+        if span.end_time is None:
+            return
+
+        with self._lock:
+            row = self._trace_rows.setdefault(span.trace_id, len(self._trace_rows) + 1)
+            self._events.append(
+                {
+                    "name": span.name,
+                    "cat": "chat2edit",
+                    "ph": "X",
+                    "ts": span.start_time / 1000,
+                    "dur": (span.end_time - span.start_time) / 1000,
+                    "pid": os.getpid(),
+                    "tid": row,
+                    "args": {
+                        **span.attributes,
+                        "span_id": span.span_id,
+                        "parent_id": span.parent_id,
+                        **({"error": span.error} if span.error else {}),
+                    },
+                }
+            )
+
+    def get_trace(self) -> Dict[str, Any]:
+        with self._lock:
+            metadata = {
+                "name": "process_name",
+                "ph": "M",
+                "pid": os.getpid(),
+                "args": {"name": self._process_name},
+            }
+            return {"traceEvents": [metadata, *self._events], "displayTimeUnit": "ms"}
+
+    def write(self, path: Union[str, os.PathLike]) -> None:
+        with open(path, "w") as f:
+            json.dump(self.get_trace(), f, default=str)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._events.clear()
+            self._trace_rows.clear()
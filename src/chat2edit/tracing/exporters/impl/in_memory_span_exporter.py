@@ -0,0 +1,26 @@
+import threading
+from typing import List, Optional
+
+from chat2edit.tracing.exporters.span_exporter import SpanExporter
+from chat2edit.tracing.span import Span
+
+
+class InMemorySpanExporter(SpanExporter):
+    def __init__(self, max_spans: Optional[int] = None) -> None:
+        self._spans: List[Span] = []
+        self._max_spans = max_spans
+        self._lock = threading.Lock()
+
+    def export(self, span: Span) -> None:
+        with self._lock:
+            self._spans.append(span)
+            if self._max_spans is not None and len(self._spans) > self._max_spans:
+                del self._spans[: len(self._spans) - self._max_spans]
+
+    def get_finished_spans(self) -> List[Span]:
+        with self._lock:
+            return list(self._spans)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._spans.clear()
@@ -0,0 +1,9 @@
+from abc import ABC, abstractmethod
+
+from chat2edit.tracing.span import Span
+
+
+class SpanExporter(ABC):
+    @abstractmethod
+    def export(self, span: Span) -> None:
+        pass
@@ -0,0 +1,40 @@
+from time import time_ns
+from typing import Any, Dict, Optional
+from uuid import uuid4
+
+from pydantic import BaseModel, Field
+
+
+def generate_id() -> str:
+    return uuid4().hex[:16]
+
+
+class Span(BaseModel):
+    name: str
+    trace_id: str
+    span_id: str = Field(default_factory=generate_id)
+    parent_id: Optional[str] = Field(default=None)
+    start_time: int = Field(default_factory=time_ns)
+    end_time: Optional[int] = Field(default=None)
+    attributes: Dict[str, Any] = Field(default_factory=dict)
+    error: Optional[str] = Field(default=None)
+
+    @property
+    def duration(self) -> Optional[int]:
+        return self.end_time - self.start_time if self.end_time is not None else None
+
+    def set_attribute(self, key: str, value: Any) -> None:
+        self.attributes[key] = value
+
+    def set_attributes(self, attributes: Dict[str, Any]) -> None:
+        self.attributes.update(attributes)
+
+
+class NonRecordingSpan(Span):
+    """Span handed out when tracing is disabled; attribute writes are dropped."""
+
+    def set_attribute(self, key: str, value: Any) -> None:
+        pass
+
+    def set_attributes(self, attributes: Dict[str, Any]) -> None:
+        pass
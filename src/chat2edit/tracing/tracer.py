@@ -0,0 +1,61 @@
+from contextlib import contextmanager
+from contextvars import ContextVar
+from time import time_ns
+from typing import Any, Iterator, List, Optional
+
+from chat2edit.tracing.exporters import SpanExporter
+from chat2edit.tracing.span import NonRecordingSpan, Span, generate_id
+
+_current_span: ContextVar[Optional[Span]] = ContextVar("chat2edit_current_span", default=None)
+
+NON_RECORDING_SPAN = NonRecordingSpan(name="", trace_id="")
+
+
+class Tracer:
+    """
+    Creates nested spans and hands finished ones to the exporters.
+
+    The active span is tracked in a context variable, so spans opened inside
+    concurrently running tasks nest under the span that was active when the
+    task was created. Without exporters no spans are recorded.
+    """
+
+    def __init__(self, exporters: Optional[List[SpanExporter]] = None) -> None:
+        self._exporters = list(exporters or [])
+
+    @property
+    def enabled(self) -> bool:
+        return bool(self._exporters)
+
+    def add_exporter(self, exporter: SpanExporter) -> None:
+        self._exporters.append(exporter)
+
+    def get_current_span(self) -> Optional[Span]:
+        return _current_span.get()
+
+    @contextmanager
+    def start_span(self, name: str, **attributes: Any) -> Iterator[Span]:
+        if not self._exporters:
+            yield NON_RECORDING_SPAN
+            return
+
+        parent = _current_span.get()
+        span = Span(
+            name=name,
+            trace_id=parent.trace_id if parent else generate_id(),
+            parent_id=parent.span_id if parent else None,
+            attributes=attributes,
+        )
+        token = _current_span.set(span)
+
+        try:
+            yield span
+        except BaseException as e:
+            span.error = f"{type(e).__name__}: {e}"
+            raise
+        finally:
+            span.end_time = time_ns()
+            _current_span.reset(token)
+
+            for exporter in self._exporters:
+                exporter.export(span)
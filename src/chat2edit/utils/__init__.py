@@ -1,5 +1,15 @@
 from chat2edit.utils.anno_repr import anno_repr
+from chat2edit.utils.estimate_size import estimate_size
+from chat2edit.utils.hash_source_file import hash_source_file
+from chat2edit.utils.lazy_attributes import create_lazy_getattr
 from chat2edit.utils.smart_type_adaptor import SmartTypeAdapter
 from chat2edit.utils.to_snake_case import to_snake_case
 
-__all__ = ["anno_repr", "SmartTypeAdapter", "to_snake_case"]
+__all__ = [
+    "anno_repr",
+    "create_lazy_getattr",
+    "estimate_size",
+    "hash_source_file",
+    "SmartTypeAdapter",
+    "to_snake_case",
+]
@@ -0,0 +1,39 @@
+import sys
+from types import ModuleType
+from typing import Any, Set
+
+
+def estimate_size(obj: Any, max_depth: int = 32) -> int:
+    """Estimate the memory held by an object graph, counting shared objects once."""
+
+    visited: Set[int] = set()
+    size = 0
+    stack = [(obj, 0)]
+
+    while stack:
+        current, depth = stack.pop()
+
+        if id(current) in visited:
+            continue
+
+        visited.add(id(current))
+
+        try:
+            size += sys.getsizeof(current)
+        except TypeError:
+            continue
+
+        if depth >= max_depth or isinstance(current, (str, bytes, bytearray, type, ModuleType)):
+            continue
+
+        if isinstance(current, dict):
+            stack.extend((k, depth + 1) for k in current.keys())
+            stack.extend((v, depth + 1) for v in current.values())
+
+        elif isinstance(current, (list, tuple, set, frozenset)):
+            stack.extend((item, depth + 1) for item in current)
+
+        elif hasattr(current, "__dict__") and not callable(current):
+            stack.append((current.__dict__, depth + 1))
+
+    return size
@@ -0,0 +1,24 @@
+import hashlib
+import os
+from functools import lru_cache
+from typing import Optional
+
+
+def hash_source_file(path: Optional[str]) -> str:
+    """Return a digest of a file's content, or "-" when there is no readable file."""
+    if not path:
+        return "-"
+
+    try:
+        stat = os.stat(path)
+    except OSError:
+        return "-"
+
+    return _hash_file(path, stat.st_mtime_ns, stat.st_size)
+
+
+@lru_cache(maxsize=None)
+def _hash_file(path: str, mtime_ns: int, size: int) -> str:
+    # Keyed by modification time and size as well, so an edited file is hashed again
+    with open(path, "rb") as f:
+        return hashlib.blake2b(f.read(), digest_size=16).hexdigest()
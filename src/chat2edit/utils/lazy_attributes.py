@@ -0,0 +1,22 @@
+import sys
+from importlib import import_module
+from typing import Any, Callable, Dict
+
+
+def create_lazy_getattr(module_name: str, attributes: Dict[str, str]) -> Callable[[str], Any]:
+    """
+    Create a module-level `__getattr__` (PEP 562) that imports attributes on first access.
+
+    `attributes` maps each attribute name to the module defining it. The loaded value is
+    stored on the module, so later lookups bypass `__getattr__` entirely.
+    """
+
+    def __getattr__(name: str) -> Any:
+        if name not in attributes:
+            raise AttributeError(f"module {module_name!r} has no attribute {name!r}")
+
+        value = getattr(import_module(attributes[name]), name)
+        setattr(sys.modules[module_name], name, value)
+        return value
+
+    return __getattr__
@@ -1,12 +1,69 @@
-from typing import Any, Type, Union
+from functools import lru_cache
+from typing import (
+    Any,
+    Dict,
+    FrozenSet,
+    List,
+    Literal,
+    Optional,
+    Tuple,
+    Type,
+    Union,
+    get_args,
+    get_origin,
+)
 
 from pydantic import BaseModel, TypeAdapter
+from pydantic_core import from_json
+
+
+@lru_cache(maxsize=None)
+def get_type_adapter(cls: Type[BaseModel]) -> TypeAdapter:
+    """Return a shared `TypeAdapter` for a model class, building it only once."""
+    return TypeAdapter(cls)
 
 
 class SmartTypeAdapter(TypeAdapter):  # type: ignore[misc]
-    def __init__(self, base_cls: Type[BaseModel]):
+    """
+    Validates payloads into the most specific subclass of `base_cls` they match.
+
+    With a `discriminator`, subclasses narrowing that field to a Literal or a
+    default claim its values, so a payload is routed straight to its subclass.
+    The base field may stay a plain `str`, as `Feedback.type` does: payloads
+    whose value no subclass claims skip the Literal-narrowed subclasses.
+    """
+
+    def __init__(self, base_cls: Type[BaseModel], discriminator: Optional[str] = None):
         self.base_cls = base_cls
-        self.subclasses = self._get_all_subclasses()
+        self.discriminator = discriminator
+        self.subclasses: List[Type[BaseModel]] = []
+        self._subclass_counts: Dict[Type[BaseModel], int] = {}
+        self._required_fields: Dict[Type[BaseModel], FrozenSet[str]] = {}
+        self._discriminated: Dict[Any, Type[BaseModel]] = {}
+        self._literal_subclasses: FrozenSet[Type[BaseModel]] = frozenset()
+        self.refresh()
+
+    def refresh(self) -> None:
+        """Rebuild the subclass cache, e.g. after new subclasses have been defined."""
+        subclasses = self._get_all_subclasses()
+        # Try the most specific subclasses first so richer payloads are not
+        # swallowed by a more general parent that ignores extra fields
+        self.subclasses = sorted(subclasses, key=lambda cls: len(cls.__mro__), reverse=True)
+        self._subclass_counts = {
+            cls: len(cls.__subclasses__()) for cls in [self.base_cls, *self.subclasses]
+        }
+        self._required_fields = {
+            cls: frozenset(
+                field.alias or name
+                for name, field in cls.model_fields.items()
+                if field.is_required()
+            )
+            for cls in self.subclasses
+        }
+        self._discriminated = self._get_discriminated_subclasses()
+        self._literal_subclasses = frozenset(
+            cls for cls in self.subclasses if self._get_literal_values(cls) is not None
+        )
 
     def _get_all_subclasses(self):
         subclasses = set()
@@ -22,25 +79,71 @@ class SmartTypeAdapter(TypeAdapter):  # type: ignore[misc]
 
         return subclasses
 
+    def _get_discriminated_subclasses(self) -> Dict[Any, Type[BaseModel]]:
+        if not self.discriminator:
+            return {}
+
+        discriminated: Dict[Any, Type[BaseModel]] = {}
+
+        # Subclasses are ordered most specific first and the base class comes last,
+        # so a value goes to the narrowest class claiming it
+        for cls in [*self.subclasses, self.base_cls]:
+            values = self._get_literal_values(cls)
+            if values is None:
+                field = cls.model_fields.get(self.discriminator)
+                if field is None or not isinstance(field.default, (str, int)):
+                    continue
+                values = (field.default,)
+
+            for value in values:
+                discriminated.setdefault(value, cls)
+
+        return discriminated
+
+    def _get_literal_values(self, cls: Type[BaseModel]) -> Optional[Tuple[Any, ...]]:
+        field = cls.model_fields.get(self.discriminator) if self.discriminator else None
+        if field is None or get_origin(field.annotation) is not Literal:
+            return None
+
+        return get_args(field.annotation)
+
+    def _is_stale(self) -> bool:
+        return any(
+            len(cls.__subclasses__()) != count for cls, count in self._subclass_counts.items()
+        )
+
     def validate_python(self, obj: Any) -> BaseModel:  # type: ignore[override]
         if isinstance(obj, self.base_cls):
             return obj
 
-        for subcls in self.subclasses:
-            try:
-                return TypeAdapter(subcls).validate_python(obj)  # type: ignore[no-any-return]
+        if self._is_stale():
+            self.refresh()
 
-            except Exception:
-                continue
+        skipped: FrozenSet[Type[BaseModel]] = frozenset()
 
-        return TypeAdapter(self.base_cls).validate_python(obj)
+        if self._discriminated and isinstance(obj, dict) and self.discriminator in obj:
+            subcls = self._discriminated.get(obj[self.discriminator])
+            if subcls is not None:
+                return get_type_adapter(subcls).validate_python(obj)  # type: ignore[no-any-return]
+
+            # No Literal-narrowed subclass accepts a value none of them claims
+            skipped = self._literal_subclasses
 
-    def validate_json(self, data: Union[str, bytes]) -> BaseModel:  # type: ignore[override]
         for subcls in self.subclasses:
+            if subcls in skipped:
+                continue
+
+            # Skip subclasses that cannot match instead of paying for a failed validation
+            if isinstance(obj, dict) and not self._required_fields[subcls].issubset(obj.keys()):
+                continue
+
             try:
-                return TypeAdapter(subcls).validate_json(data)  # type: ignore[no-any-return]
+                return get_type_adapter(subcls).validate_python(obj)  # type: ignore[no-any-return]
 
             except Exception:
                 continue
 
-        return TypeAdapter(self.base_cls).validate_json(data)
+        return get_type_adapter(self.base_cls).validate_python(obj)  # type: ignore[no-any-return]
+
+    def validate_json(self, data: Union[str, bytes]) -> BaseModel:  # type: ignore[override]
+        return self.validate_python(from_json(data))
@@ -0,0 +1,28 @@
+from chat2edit.prompting.stubbing.utils import rename_identifiers
+
+STUB = '''
+class Shape:
+    """A Shape drawn on the canvas, see Shape.render."""
+
+    parent: "Shape" = None
+
+    def render(self, other: Optional["Shape"] = None, label: str = "Shape") -> "Shape": ...
+
+def make(shape: Shape) -> Shape:  # returns a Shape
+    return canvas.Shape
+'''.strip()
+
+
+def test_rename_identifiers_only_renames_code_identifiers():
+    renamed = rename_identifiers(STUB, {"Shape": "Figure"})
+
+    assert "class Figure:" in renamed
+    assert '"""A Shape drawn on the canvas, see Shape.render."""' in renamed
+    assert 'parent: "Figure" = None' in renamed
+    assert 'other: Optional["Figure"] = None, label: str = "Shape") -> "Figure"' in renamed
+    assert "def make(shape: Figure) -> Figure:  # returns a Shape" in renamed
+    assert "return canvas.Shape" in renamed
+
+
+def test_rename_identifiers_skips_longer_names():
+    assert rename_identifiers("ShapeList = Shape", {"Shape": "Figure"}) == "ShapeList = Figure"
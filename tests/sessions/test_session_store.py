@@ -0,0 +1,40 @@
+import time
+
+import pytest
+
+from chat2edit.sessions import FileSessionStore, Session, SqliteSessionStore
+
+
+@pytest.fixture(params=["sqlite", "file"])
+def create_store(request, tmp_path):
+    def create(**kwargs):
+        if request.param == "sqlite":
+            return SqliteSessionStore(tmp_path / "sessions.db", **kwargs)
+        return FileSessionStore(tmp_path / "sessions", **kwargs)
+
+    return create
+
+
+def test_session_read_from_cache_survives_budget_eviction(create_store):
+    # Each session fills the whole budget, so putting a second one evicts the first
+    store = create_store(ttl=1, max_memory_bytes=1, get_size=lambda session: 1)
+    store.put(Session(session_id="a"))
+
+    deadline = time.monotonic() + 1.5
+    while time.monotonic() < deadline:
+        assert store.get("a") is not None
+        time.sleep(0.1)
+
+    store.put(Session(session_id="b"))
+
+    assert store.get("a") is not None
+
+
+def test_idle_session_expires(create_store):
+    store = create_store(ttl=0.2, max_memory_bytes=1, get_size=lambda session: 1)
+    store.put(Session(session_id="a"))
+    store.put(Session(session_id="b"))
+
+    time.sleep(0.3)
+
+    assert store.get("a") is None
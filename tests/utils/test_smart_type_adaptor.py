@@ -0,0 +1,53 @@
+from typing import Literal
+
+from pydantic import BaseModel
+
+from chat2edit.models import Feedback
+from chat2edit.utils import SmartTypeAdapter
+
+
+class Shape(BaseModel):
+    kind: Literal["circle", "square"]
+
+
+class Circle(Shape):
+    kind: Literal["circle"]
+    radius: float
+
+
+class InvalidColorFeedback(Feedback):
+    type: Literal["invalid_color"] = "invalid_color"
+    color: str
+
+
+def test_discriminator_dispatches_to_narrowing_subclass():
+    adapter = SmartTypeAdapter(Shape, discriminator="kind")
+
+    circle = adapter.validate_python({"kind": "circle", "radius": 2.0})
+    square = adapter.validate_python({"kind": "square"})
+
+    assert isinstance(circle, Circle)
+    assert circle.radius == 2.0
+    assert type(square) is Shape
+
+
+def test_feedback_type_dispatch():
+    adapter = SmartTypeAdapter(Feedback, discriminator="type")
+
+    payload = {"type": "invalid_color", "severity": "error", "color": "mauve"}
+    feedback = adapter.validate_json(InvalidColorFeedback(**payload).model_dump_json())
+    other = adapter.validate_python({"type": "unexpected_error", "severity": "error"})
+
+    assert isinstance(feedback, InvalidColorFeedback)
+    assert feedback.color == "mauve"
+    assert type(other) is Feedback
+
+
+def test_refresh_picks_up_new_subclasses():
+    adapter = SmartTypeAdapter(Shape, discriminator="kind")
+
+    class Square(Shape):
+        kind: Literal["square"]
+        side: float
+
+    assert isinstance(adapter.validate_python({"kind": "square", "side": 1.0}), Square)